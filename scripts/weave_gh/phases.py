@@ -51,6 +51,10 @@ from weave_gh.body import parse_gh_body_description, parse_issue_template_fields
 # Used to detect Weave-closed issues and prevent phantom reopens.
 _WEAVE_CLOSE_MARKER = "Completed. Weave node"
 
+# Weave ID marker in an issue body, either "**Weave ID:** `id`" or the legacy
+# "**Weave ID**: `id`"; group 1 is the node id.
+_WEAVE_ID_RE = re.compile(r"\*\*Weave ID(?::\*\*|\*\*:) `([^`\s]+)`")
+
 # Cache of known-invalid assignee logins to avoid repeated failed API calls.
 _invalid_assignees: set[str] = set()
 _REIMPORTED_PRESERVE_MARKERS = ("## Tasks", "## Dependency Graph", "```mermaid")
@@ -917,13 +921,9 @@ def sync_github_to_weave(
         if issue.number in tracked_gh_nums:
             continue
 
-        # Skip if issue body contains a known Weave ID marker
-        # Handle both format variants: **Weave ID:** `id` and **Weave ID**: `id`
-        if any(
-            f"**Weave ID:** `{nid}`" in issue.body
-            or f"**Weave ID**: `{nid}`" in issue.body
-            for nid in node_ids
-        ):
+        # Skip if issue body contains a known Weave ID marker. One regex scan
+        # per body, not a substring search per (issue, node) pair.
+        if not node_ids.isdisjoint(_WEAVE_ID_RE.findall(issue.body)):
             continue
 
         # New GH issue not in Weave
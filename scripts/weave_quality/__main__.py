@@ -31,7 +31,7 @@ from fnmatch import fnmatch
 from pathlib import Path
 import tempfile
 
-from weave_quality.ast_cache import ASTCache
+from weave_quality.ast_cache import ASTCache, content_blob_sha
 from weave_quality.bash_ast_grep import analyze_bash_file_best, ast_grep_available, batch_cc_lines
 from weave_quality.bash_heuristic import detect_bash
 from weave_quality.classification import classify_file, load_classify_overrides
@@ -85,7 +85,7 @@ from weave_quality.hotspots import (
 from weave_quality.findings import cmd_findings_promote
 from weave_quality.models import CKMetrics, FileEntry, FunctionCC, GitStats, PatternFinding
 from weave_quality.prose_rules import PROSE_LANGUAGES, rule_language, run_prose_rule
-from weave_quality.python_parser import analyze_python_file
+from weave_quality.python_parser import analyze_python_files
 
 log = logging.getLogger(__name__)
 
@@ -339,16 +339,41 @@ def _scan_files(
     ]
     _batch_cc: dict[str, list[int]] | None = batch_cc_lines(bash_abs_paths) if bash_abs_paths else None
 
+    # Python: resolve cache hits first, then analyze all misses in one
+    # (possibly multi-process) batch instead of one file at a time.
+    py_keys: dict[str, tuple[str, str]] = {}  # rel_path -> (blob_sha, category)
+    py_cached: dict[str, tuple[FileEntry, CKMetrics | None, list[FunctionCC]]] = {}
+    py_misses: list[str] = []
+    for rel_path in files_to_scan:
+        if not rel_path.endswith(".py"):
+            continue
+        blob_sha = blob_map.get(rel_path, "") if blob_map else ""
+        if ast_cache and not blob_sha:
+            # Untracked / non-git file: key the cache by content instead.
+            blob_sha = content_blob_sha(os.path.join(repo, rel_path))
+        category = classify_file(rel_path, classify_overrides)
+        py_keys[rel_path] = (blob_sha, category)
+        cached = ast_cache.get(blob_sha, rel_path, scan_id, category) if ast_cache else None
+        if cached is not None:
+            py_cached[rel_path] = cached
+        else:
+            py_misses.append(rel_path)
+    py_fresh = dict(
+        zip(
+            py_misses,
+            analyze_python_files([os.path.join(repo, rel) for rel in py_misses], scan_id),
+        )
+    )
+
     for rel_path in files_to_scan:
         abs_path = os.path.join(repo, rel_path)
         if rel_path.endswith(".py"):
-            category = classify_file(rel_path, classify_overrides)
-            blob_sha = blob_map.get(rel_path, "") if blob_map else ""
-            cached = ast_cache.get(blob_sha, rel_path, scan_id, category) if ast_cache else None
+            blob_sha, category = py_keys[rel_path]
+            cached = py_cached.get(rel_path)
             if cached is not None:
                 entry, ck, fn_cc = cached
             else:
-                entry, ck, fn_cc = analyze_python_file(abs_path, scan_id)
+                entry, ck, fn_cc = py_fresh[rel_path]
                 if ast_cache and blob_sha:
                     ast_cache.put(blob_sha, entry, ck, fn_cc)
                 entry = FileEntry(
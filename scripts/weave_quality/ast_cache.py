@@ -6,7 +6,9 @@ reset. The cache is anchored at the git top-level (not the scan path) so a
 subdir-scoped scan shares the one root cache and never leaks a nested .weave/.
 
 Cache key: (blob_sha, scanner_version)
-  blob_sha       — git object SHA; changes when file content changes
+  blob_sha       — git object SHA; changes when file content changes. Files with
+                   no HEAD blob (untracked, or scans outside git) are keyed by
+                   content_blob_sha(), the same SHA git would assign.
   scanner_version — invalidates cache when algorithm changes
 
 On a cold full scan, every file is analysed normally and results are written to
@@ -19,6 +21,7 @@ _scan_files runs on the main thread; background git threads don't touch it.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import sqlite3
 import subprocess
@@ -51,6 +54,22 @@ def _git_toplevel(path: str | Path) -> str | None:
     return top or None
 
 
+def content_blob_sha(path: str | Path) -> str:
+    """Return the git blob SHA of a file's current content, or "" if unreadable.
+
+    Computed in-process (``sha1(b"blob <size>\\0" + data)``) so files absent
+    from ``batch_blob_shas`` still get a content-addressed cache key without a
+    ``git hash-object`` subprocess per file.
+    """
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return ""
+    digest = hashlib.sha1(b"blob %d\0" % len(data), usedforsecurity=False)
+    digest.update(data)
+    return digest.hexdigest()
+
+
 @dataclass
 class _CachedEntry:
     entry_fields: dict[str, Any]
@@ -14,6 +14,7 @@ import logging
 import math
 import re
 from pathlib import Path
+from typing import Iterable
 
 from .models import FileEntry, FunctionCC
 
@@ -41,7 +42,7 @@ _TOOL_PATTERN = re.compile(r"\b(sqlite3|curl|jq|gh|git|python3|sed|awk)\b")
 _BASH_INDENT_WIDTH = 2
 
 
-def _indent_sd(lines: list[str], indent_width: int = _BASH_INDENT_WIDTH) -> float:
+def _indent_sd(lines: Iterable[str], indent_width: int = _BASH_INDENT_WIDTH) -> float:
     """Compute stddev of indentation levels across non-empty Bash lines.
 
     Uses the same formula as python_parser._indent_sd but with a 2-space
@@ -292,21 +293,32 @@ def analyze_bash_file(
     return analyze_bash_source(source, str(filepath), scan_id)
 
 
+# Shebang naming bash or sh, directly or via env
+_SHEBANG_PATTERN = re.compile(r"^#!\s*/(?:usr/)?(?:bin/)?(?:env\s+)?(?:ba)?sh\b")
+
+_BASH_SUFFIXES = (".sh", ".bash")
+
+
+def _detect_from_header(header: str, filename: str | Path) -> bool:
+    """Decide whether a file is Bash from its name and first line, without I/O."""
+    if Path(filename).suffix in _BASH_SUFFIXES:
+        return True
+    return bool(_SHEBANG_PATTERN.match(header))
+
+
 def detect_bash(filepath: str | Path) -> bool:
     """Heuristic to detect if a file is Bash/Shell script.
 
     Checks extension (.sh, .bash) or shebang line (#!/bin/bash, #!/bin/sh, etc.).
     """
     p = Path(filepath)
-    if p.suffix in (".sh", ".bash"):
+    # Extension alone is conclusive; skip opening the file
+    if p.suffix in _BASH_SUFFIXES:
         return True
 
-    # Check shebang
     try:
         with open(p, "r", encoding="utf-8", errors="replace") as f:
             first_line = f.readline(256)
-        return bool(
-            re.match(r"^#!\s*/(?:usr/)?(?:bin/)?(?:env\s+)?(?:ba)?sh\b", first_line)
-        )
     except OSError:
         return False
+    return _detect_from_header(first_line, p)
@@ -131,7 +131,8 @@ CREATE TABLE IF NOT EXISTS pattern_findings (
 -- Indexes for common queries
 CREATE INDEX IF NOT EXISTS idx_files_scan ON files(scan_id);
 CREATE INDEX IF NOT EXISTS idx_files_complexity ON files(complexity DESC);
-CREATE INDEX IF NOT EXISTS idx_fm_scan ON file_metrics(scan_id);
+-- Covering index: get_ck_metrics reads (scan_id, path) rows without touching the table
+CREATE INDEX IF NOT EXISTS idx_fm_scan_path ON file_metrics(scan_id, path, metric, value);
 CREATE INDEX IF NOT EXISTS idx_pf_scan ON pattern_findings(scan_id);
 CREATE INDEX IF NOT EXISTS idx_pf_rule ON pattern_findings(rule_id);
 CREATE INDEX IF NOT EXISTS idx_gs_hotspot ON git_stats(hotspot DESC);
@@ -147,6 +148,17 @@ _FILES_SCANS = 2  # how many scans to retain raw files + file_metrics (diff wind
 # ---------------------------------------------------------------------------
 
 
+def _tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """Cursor yielding plain tuples, whatever the connection's row_factory.
+
+    Hot read paths feed these straight into a model constructor instead of
+    copying each sqlite3.Row into a dict first.
+    """
+    cur = conn.cursor()
+    cur.row_factory = None
+    return cur
+
+
 def _resolve_db_path(hot_zone: str | None = None) -> Path:
     """Resolve quality.db path from WV_HOT_ZONE or explicit path."""
     if hot_zone:
@@ -285,6 +297,16 @@ def _migrate_v7(conn: sqlite3.Connection) -> None:
     conn.commit()
 
 
+def _migrate_v8(conn: sqlite3.Connection) -> None:
+    """Idempotent v8 schema migration: drop idx_fm_scan.
+
+    idx_fm_scan_path (created by _SCHEMA) has scan_id as its leading column,
+    so the single-column index only costs writes on existing DBs.
+    """
+    conn.execute("DROP INDEX IF EXISTS idx_fm_scan")
+    conn.commit()
+
+
 def init_db(hot_zone: str | None = None) -> sqlite3.Connection:
     """Initialise quality.db, creating schema if needed.
 
@@ -295,6 +317,13 @@ def init_db(hot_zone: str | None = None) -> sqlite3.Connection:
 
     conn = sqlite3.connect(str(resolved))
     conn.row_factory = sqlite3.Row
+    _apply_schema(conn)
+    log.debug("quality.db initialised at %s", resolved)
+    return conn
+
+
+def _apply_schema(conn: sqlite3.Connection) -> None:
+    """Create the schema and run all migrations on an open connection."""
     conn.executescript(_SCHEMA)
     _migrate_v2(conn)
     _migrate_v3(conn)
@@ -302,8 +331,7 @@ def init_db(hot_zone: str | None = None) -> sqlite3.Connection:
     _migrate_v5(conn)
     _migrate_v6(conn)
     _migrate_v7(conn)
-    log.debug("quality.db initialised at %s", resolved)
-    return conn
+    _migrate_v8(conn)
 
 
 def db_path(hot_zone: str | None = None) -> Path:
@@ -329,6 +357,15 @@ def reset_db(hot_zone: str | None = None) -> None:
 # ---------------------------------------------------------------------------
 
 
+def _retention_cutoff(conn: sqlite3.Connection, keep: int) -> int:
+    """Return the oldest scan id within the newest ``keep`` scans."""
+    row = conn.execute(
+        "SELECT MIN(id) FROM (SELECT id FROM scan_meta ORDER BY id DESC LIMIT ?)",
+        (keep,),
+    ).fetchone()
+    return int(row[0])
+
+
 def begin_scan(
     conn: sqlite3.Connection,
     git_head: str,
@@ -351,31 +388,17 @@ def begin_scan(
     # Step 1: Prune files + file_metrics to the diff window (_FILES_SCANS).
     # We do this explicitly because scan_meta now keeps more rows, so the
     # CASCADE on scan_meta won't fire for these tables until later.
-    conn.execute(
-        """DELETE FROM files WHERE scan_id NOT IN (
-            SELECT id FROM scan_meta ORDER BY id DESC LIMIT ?
-        )""",
-        (_FILES_SCANS,),
-    )
-    conn.execute(
-        """DELETE FROM file_metrics WHERE scan_id NOT IN (
-            SELECT id FROM scan_meta ORDER BY id DESC LIMIT ?
-        )""",
-        (_FILES_SCANS,),
-    )
-    conn.execute(
-        """DELETE FROM pattern_findings WHERE scan_id NOT IN (
-            SELECT id FROM scan_meta ORDER BY id DESC LIMIT ?
-        )""",
-        (_FILES_SCANS,),
-    )
+    # Scan ids only grow, so "not among the newest N" is "below the Nth
+    # newest id" -- a range delete on the scan_id indexes that touches only
+    # the pruned rows instead of scanning every kept row.
+    files_cutoff = _retention_cutoff(conn, _FILES_SCANS)
+    conn.execute("DELETE FROM files WHERE scan_id < ?", (files_cutoff,))
+    conn.execute("DELETE FROM file_metrics WHERE scan_id < ?", (files_cutoff,))
+    conn.execute("DELETE FROM pattern_findings WHERE scan_id < ?", (files_cutoff,))
     # Step 2: Prune scan_meta to trend window (_MAX_SCANS).
     # CASCADE will drop any complexity_trend rows for the removed scans.
     conn.execute(
-        """DELETE FROM scan_meta WHERE id NOT IN (
-            SELECT id FROM scan_meta ORDER BY id DESC LIMIT ?
-        )""",
-        (_MAX_SCANS,),
+        "DELETE FROM scan_meta WHERE id < ?", (_retention_cutoff(conn, _MAX_SCANS),)
     )
     log.debug("Scan %d started (head=%s)", scan_id, git_head[:8])
     return scan_id
@@ -446,53 +469,52 @@ def previous_scan(conn: sqlite3.Connection) -> ScanMeta | None:
 # ---------------------------------------------------------------------------
 
 
+_UPSERT_FILE_ENTRY_SQL = """INSERT INTO files (path, scan_id, language, loc,
+        complexity, functions, max_nesting, avg_fn_len,
+        essential_complexity, indent_sd, category)
+    VALUES (:path, :scan_id, :language, :loc,
+        :complexity, :functions, :max_nesting, :avg_fn_len,
+        :essential_complexity, :indent_sd, :category)
+    ON CONFLICT(path, scan_id) DO UPDATE SET
+        language=excluded.language, loc=excluded.loc,
+        complexity=excluded.complexity,
+        functions=excluded.functions,
+        max_nesting=excluded.max_nesting,
+        avg_fn_len=excluded.avg_fn_len,
+        essential_complexity=excluded.essential_complexity,
+        indent_sd=excluded.indent_sd,
+        category=excluded.category
+"""
+
+
 def upsert_file_entry(conn: sqlite3.Connection, entry: FileEntry) -> None:
     """Insert or update a file entry for a scan."""
     d = entry.to_dict()
-    conn.execute(
-        """INSERT INTO files (path, scan_id, language, loc,
-            complexity, functions, max_nesting, avg_fn_len,
-            essential_complexity, indent_sd, category)
-        VALUES (:path, :scan_id, :language, :loc,
-            :complexity, :functions, :max_nesting, :avg_fn_len,
-            :essential_complexity, :indent_sd, :category)
-        ON CONFLICT(path, scan_id) DO UPDATE SET
-            language=excluded.language, loc=excluded.loc,
-            complexity=excluded.complexity,
-            functions=excluded.functions,
-            max_nesting=excluded.max_nesting,
-            avg_fn_len=excluded.avg_fn_len,
-            essential_complexity=excluded.essential_complexity,
-            indent_sd=excluded.indent_sd,
-            category=excluded.category
-        """,
-        d,
-    )
+    conn.execute(_UPSERT_FILE_ENTRY_SQL, d)
 
 
 def bulk_upsert_file_entries(
     conn: sqlite3.Connection, entries: list[FileEntry]
 ) -> None:
     """Insert/update a batch of file entries."""
-    for entry in entries:
-        upsert_file_entry(conn, entry)
+    conn.executemany(_UPSERT_FILE_ENTRY_SQL, [e.to_dict() for e in entries])
+
+
+# files columns in FileEntry field order, so rows construct positionally
+_FILE_ENTRY_COLUMNS = """path, scan_id, language, loc, complexity, functions,
+    max_nesting, avg_fn_len, essential_complexity, indent_sd, category"""
 
 
 def get_file_entries(
     conn: sqlite3.Connection, scan_id: int, path: str | None = None
 ) -> list[FileEntry]:
     """Retrieve file entries for a scan, optionally filtered by path."""
+    sql = f"SELECT {_FILE_ENTRY_COLUMNS} FROM files WHERE scan_id = ?"
+    params: tuple[Any, ...] = (scan_id,)
     if path:
-        rows = conn.execute(
-            "SELECT * FROM files WHERE scan_id = ? AND path = ?",
-            (scan_id, path),
-        ).fetchall()
-    else:
-        rows = conn.execute(
-            "SELECT * FROM files WHERE scan_id = ?",
-            (scan_id,),
-        ).fetchall()
-    return [FileEntry.from_dict(dict(r)) for r in rows]
+        sql += " AND path = ?"
+        params = (scan_id, path)
+    return [FileEntry(*row) for row in _tuple_cursor(conn).execute(sql, params)]
 
 
 # ---------------------------------------------------------------------------
@@ -500,16 +522,15 @@ def get_file_entries(
 # ---------------------------------------------------------------------------
 
 
+_UPSERT_CK_METRIC_SQL = """INSERT INTO file_metrics (path, scan_id, metric, value)
+    VALUES (:path, :scan_id, :metric, :value)
+    ON CONFLICT(path, scan_id, metric) DO UPDATE SET value=excluded.value
+"""
+
+
 def upsert_ck_metrics(conn: sqlite3.Connection, ck: CKMetrics) -> None:
     """Insert or update CK metrics rows for a file."""
-    for row in ck.to_rows():
-        conn.execute(
-            """INSERT INTO file_metrics (path, scan_id, metric, value)
-            VALUES (:path, :scan_id, :metric, :value)
-            ON CONFLICT(path, scan_id, metric) DO UPDATE SET value=excluded.value
-            """,
-            row,
-        )
+    conn.executemany(_UPSERT_CK_METRIC_SQL, ck.to_rows())
 
 
 def get_ck_metrics(
@@ -521,7 +542,7 @@ def get_ck_metrics(
     EAV table but are not CK-suite metrics.
     """
     rows = conn.execute(
-        "SELECT * FROM file_metrics "
+        "SELECT path, scan_id, metric, value FROM file_metrics "
         "WHERE scan_id = ? AND path = ? AND metric NOT LIKE 'fn_cc:%'",
         (scan_id, path),
     ).fetchall()
@@ -533,24 +554,23 @@ def get_ck_metrics(
 # ---------------------------------------------------------------------------
 
 
+_UPSERT_FUNCTION_CC_SQL = """INSERT INTO file_metrics
+        (path, scan_id, metric, value, detail)
+    VALUES (:path, :scan_id, :metric, :value, :detail)
+    ON CONFLICT(path, scan_id, metric) DO UPDATE SET
+        value=excluded.value, detail=excluded.detail
+"""
+
+
 def upsert_function_cc(conn: sqlite3.Connection, fn: FunctionCC) -> None:
     """Insert or update per-function CC in file_metrics EAV."""
     row = fn.to_eav_row()
-    conn.execute(
-        """INSERT INTO file_metrics
-            (path, scan_id, metric, value, detail)
-        VALUES (:path, :scan_id, :metric, :value, :detail)
-        ON CONFLICT(path, scan_id, metric) DO UPDATE SET
-            value=excluded.value, detail=excluded.detail
-        """,
-        row,
-    )
+    conn.execute(_UPSERT_FUNCTION_CC_SQL, row)
 
 
 def bulk_upsert_function_cc(conn: sqlite3.Connection, fns: list[FunctionCC]) -> None:
     """Batch insert per-function CC rows."""
-    for fn in fns:
-        upsert_function_cc(conn, fn)
+    conn.executemany(_UPSERT_FUNCTION_CC_SQL, [fn.to_eav_row() for fn in fns])
 
 
 def get_function_cc(
@@ -672,55 +692,57 @@ def get_all_trend_directions(conn: sqlite3.Connection) -> dict[str, str]:
 # ---------------------------------------------------------------------------
 
 
+_UPSERT_GIT_STATS_SQL = """INSERT INTO git_stats
+        (path, churn, authors, age_days, hotspot,
+         ownership_fraction, minor_contributors)
+    VALUES
+        (:path, :churn, :authors, :age_days, :hotspot,
+         :ownership_fraction, :minor_contributors)
+    ON CONFLICT(path) DO UPDATE SET
+        churn=excluded.churn, authors=excluded.authors,
+        age_days=excluded.age_days, hotspot=excluded.hotspot,
+        ownership_fraction=excluded.ownership_fraction,
+        minor_contributors=excluded.minor_contributors
+"""
+
+
 def upsert_git_stats(conn: sqlite3.Connection, stats: GitStats) -> None:
     """Insert or update git stats for a file."""
     d = stats.to_dict()
-    conn.execute(
-        """INSERT INTO git_stats
-            (path, churn, authors, age_days, hotspot,
-             ownership_fraction, minor_contributors)
-        VALUES
-            (:path, :churn, :authors, :age_days, :hotspot,
-             :ownership_fraction, :minor_contributors)
-        ON CONFLICT(path) DO UPDATE SET
-            churn=excluded.churn, authors=excluded.authors,
-            age_days=excluded.age_days, hotspot=excluded.hotspot,
-            ownership_fraction=excluded.ownership_fraction,
-            minor_contributors=excluded.minor_contributors
-        """,
-        d,
-    )
+    conn.execute(_UPSERT_GIT_STATS_SQL, d)
 
 
 def bulk_upsert_git_stats(conn: sqlite3.Connection, stats_list: list[GitStats]) -> None:
     """Insert/update a batch of git stats."""
-    for stats in stats_list:
-        upsert_git_stats(conn, stats)
+    conn.executemany(_UPSERT_GIT_STATS_SQL, [gs.to_dict() for gs in stats_list])
+
+
+# git_stats columns in GitStats field order, so rows construct positionally
+_GIT_STATS_COLUMNS = """path, churn, authors, age_days, hotspot,
+    ownership_fraction, minor_contributors"""
 
 
 def get_git_stats(conn: sqlite3.Connection, path: str | None = None) -> list[GitStats]:
     """Get git stats, optionally for a single file."""
+    cur = _tuple_cursor(conn)
     if path:
-        rows = conn.execute(
-            "SELECT * FROM git_stats WHERE path = ?",
-            (path,),
-        ).fetchall()
+        cur.execute(f"SELECT {_GIT_STATS_COLUMNS} FROM git_stats WHERE path = ?", (path,))
     else:
-        rows = conn.execute("SELECT * FROM git_stats").fetchall()
-    return [GitStats.from_dict(dict(r)) for r in rows]
+        cur.execute(f"SELECT {_GIT_STATS_COLUMNS} FROM git_stats")
+    return [GitStats(*row) for row in cur]
 
 
 def top_hotspots(
     conn: sqlite3.Connection, top_n: int = 10, threshold: float = HOTSPOT_THRESHOLD
 ) -> list[GitStats]:
     """Get top N files above the hotspot threshold from git_stats."""
-    rows = conn.execute(
-        """SELECT * FROM git_stats
+    cur = _tuple_cursor(conn).execute(
+        f"""SELECT {_GIT_STATS_COLUMNS} FROM git_stats
            WHERE hotspot > ?
            ORDER BY hotspot DESC LIMIT ?""",
         (threshold, top_n),
-    ).fetchall()
-    return [GitStats.from_dict(dict(r)) for r in rows]
+    )
+    return [GitStats(*row) for row in cur]
 
 
 # ---------------------------------------------------------------------------
@@ -728,22 +750,23 @@ def top_hotspots(
 # ---------------------------------------------------------------------------
 
 
+_UPSERT_CO_CHANGE_SQL = """INSERT INTO co_change (path_a, path_b, count)
+    VALUES (?, ?, ?)
+    ON CONFLICT(path_a, path_b) DO UPDATE SET count=excluded.count
+"""
+
+
 def upsert_co_change(conn: sqlite3.Connection, cc: CoChange) -> None:
     """Insert or update a co-change pair."""
-    conn.execute(
-        """INSERT INTO co_change (path_a, path_b, count)
-        VALUES (?, ?, ?)
-        ON CONFLICT(path_a, path_b) DO UPDATE SET count=excluded.count
-        """,
-        (cc.path_a, cc.path_b, cc.count),
-    )
+    conn.execute(_UPSERT_CO_CHANGE_SQL, (cc.path_a, cc.path_b, cc.count))
 
 
 def bulk_upsert_co_changes(conn: sqlite3.Connection, pairs: list[CoChange]) -> None:
     """Replace all co-change pairs. Clears old data first."""
     conn.execute("DELETE FROM co_change")
-    for cc in pairs:
-        upsert_co_change(conn, cc)
+    conn.executemany(
+        _UPSERT_CO_CHANGE_SQL, [(cc.path_a, cc.path_b, cc.count) for cc in pairs]
+    )
 
 
 def get_co_changes(
@@ -772,23 +795,22 @@ def get_co_changes(
 # ---------------------------------------------------------------------------
 
 
+_UPSERT_FILE_STATE_SQL = """INSERT INTO file_state (path, mtime, git_blob)
+    VALUES (:path, :mtime, :git_blob)
+    ON CONFLICT(path) DO UPDATE SET
+        mtime=excluded.mtime, git_blob=excluded.git_blob
+"""
+
+
 def upsert_file_state(conn: sqlite3.Connection, fs: FileState) -> None:
     """Insert or update file state for incremental tracking."""
     d = fs.to_dict()
-    conn.execute(
-        """INSERT INTO file_state (path, mtime, git_blob)
-        VALUES (:path, :mtime, :git_blob)
-        ON CONFLICT(path) DO UPDATE SET
-            mtime=excluded.mtime, git_blob=excluded.git_blob
-        """,
-        d,
-    )
+    conn.execute(_UPSERT_FILE_STATE_SQL, d)
 
 
 def bulk_upsert_file_state(conn: sqlite3.Connection, states: list[FileState]) -> None:
     """Insert/update a batch of file states."""
-    for fs in states:
-        upsert_file_state(conn, fs)
+    conn.executemany(_UPSERT_FILE_STATE_SQL, [fs.to_dict() for fs in states])
 
 
 def get_file_state(conn: sqlite3.Connection, path: str) -> FileState | None:
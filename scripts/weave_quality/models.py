@@ -68,7 +68,7 @@ class FileStateRow(TypedDict):
     git_blob: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FileEntry:
     """Static analysis metrics for a single file (scan-versioned).
 
@@ -121,7 +121,7 @@ class FileEntry:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionCC:
     """Per-function cyclomatic complexity (scan-versioned, EAV).
 
@@ -224,7 +224,7 @@ class ASTAnalysis:
         return sum(f.complexity for f in self.functions if f.parent_is_class)
 
 
-@dataclass
+@dataclass(slots=True)
 class CKMetrics:
     """CK-suite OO metrics for a single file (scan-versioned, EAV).
 
@@ -261,7 +261,7 @@ class CKMetrics:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GitStats:
     """Git-derived metrics for a single file (NOT scan-versioned).
 
@@ -303,7 +303,7 @@ class GitStats:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CoChange:
     """Co-change pair: files that frequently change together in commits.
 
@@ -315,7 +315,7 @@ class CoChange:
     count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class FileState:
     """Per-file state for incremental scanning.
 
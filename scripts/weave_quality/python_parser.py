@@ -14,10 +14,16 @@ from __future__ import annotations
 import ast
 import logging
 import math
+import multiprocessing
+import os
 import re
 import sys
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from pathlib import Path
-from typing import Any, Optional, Tuple
+from typing import Iterable, Iterator, Optional, Tuple, TypedDict
 
 from .models import ASTAnalysis, CKMetrics, FileEntry, FunctionCC, FunctionDetail
 
@@ -27,24 +33,52 @@ log = logging.getLogger(__name__)
 # Regex fallback patterns (from PROPOSAL-wv-quality.md Heuristic Parsers)
 # ---------------------------------------------------------------------------
 
-# Cyclomatic complexity proxy
-_BRANCH_PATTERN = re.compile(
-    r"^\s*(if |elif |for |while |except |assert |and |or |\S+\s+if\s+)"
+# One match per code line (non-blank, non-comment), anchored at line start.
+# The optional named groups classify the line in the same match:
+#   branch -- cyclomatic complexity proxy (if/elif/for/while/except/assert/
+#             and/or, or "<token> if " conditional expressions)
+#   func   -- function definition
+# [^\S\n] (whitespace except newline) keeps every match on a single line.
+_LINE_PATTERN = re.compile(
+    r"^(?P<indent>[^\S\n]*)(?=[^\s#])"
+    r"(?:(?P<branch>(?:if|elif|for|while|except|assert|and|or) |\S+[^\S\n]+if[^\S\n])"
+    r"|(?P<func>def[^\S\n]+\w+[^\S\n]*\())?",
+    re.MULTILINE,
 )
 
-# Function detection
-_FUNC_PATTERN = re.compile(r"^\s*def\s+(\w+)\s*\(")
+# Line boundaries recognised by str.splitlines() other than "\n", "\r\n", "\r".
+_OTHER_LINE_BREAKS = re.compile(r"[\v\f\x1c-\x1e\x85\u2028\u2029]")
 
-# Class detection
-_CLASS_PATTERN = re.compile(r"^\s*class\s+(\w+)")
-
-# Import coupling
-_IMPORT_PATTERN = re.compile(r"^\s*(?:import|from)\s+(\S+)")
+_NEWLINE = re.compile(r"\n")
 
 # Indent width for SD computation (PEP 8: 4 spaces)
 _PYTHON_INDENT_WIDTH = 4
 
 
+def _code_line_indents(lines: Iterable[str]) -> list[int]:
+    """Return the leading-whitespace width of every code line.
+
+    Blank and comment-only lines are skipped, so len() of the result is LOC.
+    One lstrip() per line feeds both LOC and indent SD.
+    """
+    widths: list[int] = []
+    for line in lines:
+        stripped = line.lstrip()
+        if stripped and stripped[0] != "#":
+            widths.append(len(line) - len(stripped))
+    return widths
+
+
+def _indent_widths_sd(widths: list[int], indent_width: int = _PYTHON_INDENT_WIDTH) -> float:
+    """Standard deviation of indent levels (width / indent_width); 0.0 below 2 lines."""
+    if len(widths) < 2:
+        return 0.0
+    levels = [w / indent_width for w in widths]
+    mean = sum(levels) / len(levels)
+    variance = sum((x - mean) ** 2 for x in levels) / len(levels)
+    return math.sqrt(variance)
+
+
 def _indent_sd(lines: list[str], indent_width: int = _PYTHON_INDENT_WIDTH) -> float:
     """Compute standard deviation of indentation levels across non-empty lines.
 
@@ -55,36 +89,69 @@ def _indent_sd(lines: list[str], indent_width: int = _PYTHON_INDENT_WIDTH) -> fl
     where indent_level = leading_spaces / indent_width.
     Returns 0.0 for files with fewer than 2 non-empty lines.
     """
-    levels: list[float] = []
-    for line in lines:
-        stripped = line.lstrip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        indent = len(line) - len(stripped)
-        levels.append(indent / indent_width)
-    if len(levels) < 2:
-        return 0.0
-    mean = sum(levels) / len(levels)
-    variance = sum((x - mean) ** 2 for x in levels) / len(levels)
-    return math.sqrt(variance)
+    return _indent_widths_sd(_code_line_indents(lines), indent_width)
 
 
 # ---------------------------------------------------------------------------
 # AST-backed analysis (primary path)
 # ---------------------------------------------------------------------------
 
+# Exact-type sets for hot-loop node classification: a single hash lookup
+# instead of isinstance() MRO checks. ast.parse() only yields concrete node classes.
+# Only for tests that need no narrowing -- mypy cannot narrow on set membership,
+# so sites that go on to use the node as a FunctionDef keep isinstance().
+_FUNC_TYPES: frozenset[type] = frozenset({ast.FunctionDef, ast.AsyncFunctionDef})
+
+
+def _child_nodes(node: ast.AST) -> list[ast.AST]:
+    """Return the direct child nodes of node in field order (list, not generator)."""
+    children: list[ast.AST] = []
+    for name in node._fields:
+        value = getattr(node, name, None)
+        if isinstance(value, list):
+            for item in value:
+                if isinstance(item, ast.AST):
+                    children.append(item)
+        elif isinstance(value, ast.AST):
+            children.append(value)
+    return children
+
+
+def _iter_nodes(root: ast.AST) -> Iterator[ast.AST]:
+    """Yield root and all descendants in depth-first pre-order.
+
+    Drop-in replacement for ast.walk() (which is breadth-first): an explicit
+    stack over node._fields avoids the nested ast.iter_child_nodes generator
+    that ast.walk resumes for every node.
+    """
+    stack: list[ast.AST] = [root]
+    while stack:
+        node = stack.pop()
+        yield node
+        children = _child_nodes(node)
+        children.reverse()
+        stack.extend(children)
+
 
 class _ComplexityVisitor(ast.NodeVisitor):
     """Walk AST to compute cyclomatic complexity and nesting depth."""
 
     def __init__(self, per_function: bool = False) -> None:
+        self._per_function = per_function
         self.complexity = 1  # Base complexity
         self._depth = 0
         self.max_nesting = 0
-        self._per_function = per_function
         self.self_attrs: set[str] = set()
         self.call_count: int = 0
 
+    def reset(self) -> None:
+        """Clear accumulated metrics so one instance can visit many functions."""
+        self.complexity = 1
+        self._depth = 0
+        self.max_nesting = 0
+        self.self_attrs = set()
+        self.call_count = 0
+
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802  # pylint: disable=invalid-name
         """Stop recursion at nested function boundaries in per_function mode."""
         if not self._per_function:
@@ -135,38 +202,58 @@ class _ComplexityVisitor(ast.NodeVisitor):
         self.generic_visit(node)
 
 
-def _ast_function_lengths(tree: ast.Module) -> list[int]:
-    """Return line counts for each top-level and method function."""
-    lengths: list[int] = []
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            # end_lineno requires Python 3.8+
-            if hasattr(node, "end_lineno") and node.end_lineno is not None:
-                lengths.append(node.end_lineno - node.lineno + 1)
-    return lengths
+class _FileVisitor(_ComplexityVisitor):
+    """Full-tree _ComplexityVisitor that also collects functions, classes, imports.
 
+    Folds the collection walk into the CC/nesting descent so _single_pass_ast
+    traverses the module once instead of twice.
+    """
 
-def _ast_nesting_depth(tree: ast.Module) -> int:
-    """Compute maximum nesting depth via AST walk."""
-    visitor = _ComplexityVisitor()
-    visitor.visit(tree)
-    return visitor.max_nesting
+    def __init__(self) -> None:
+        super().__init__()
+        self.func_nodes: list[ast.FunctionDef | ast.AsyncFunctionDef] = []
+        self.class_nodes: list[ast.ClassDef] = []
+        self.class_children: set[int] = set()
+        self.imports: set[str] = set()
 
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: N802  # pylint: disable=invalid-name
+        """Record the function, then keep descending (full-tree mode)."""
+        self.func_nodes.append(node)
+        self.generic_visit(node)
 
-def _ast_complexity(tree: ast.Module) -> float:
-    """Compute total cyclomatic complexity via AST."""
-    visitor = _ComplexityVisitor()
-    visitor.visit(tree)
-    return float(visitor.complexity)
+    visit_AsyncFunctionDef = visit_FunctionDef  # type: ignore[assignment]
 
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: N802  # pylint: disable=invalid-name
+        """Record the class and its direct methods (for WMC/RFC/LCOM)."""
+        self.class_nodes.append(node)
+        for child in node.body:
+            if type(child) in _FUNC_TYPES:
+                self.class_children.add(id(child))
+        self.generic_visit(node)
 
-def _ast_function_count(tree: ast.Module) -> int:
-    """Count functions and methods."""
-    count = 0
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            count += 1
-    return count
+    def visit_Import(self, node: ast.Import) -> None:  # noqa: N802  # pylint: disable=invalid-name,missing-function-docstring
+        for alias in node.names:
+            self.imports.add(alias.name.split(".")[0])
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:  # noqa: N802  # pylint: disable=invalid-name,missing-function-docstring
+        if node.module:
+            self.imports.add(node.module.split(".")[0])
+
+
+def _ast_scalar_metrics(tree: ast.Module) -> tuple[float, int, int, list[int]]:
+    """Return (total CC, max nesting, function count, function lengths).
+
+    Standalone form of the file-level numbers _single_pass_ast derives: one
+    _FileVisitor descent instead of a separate walk per metric.
+    """
+    visitor = _FileVisitor()
+    visitor.visit(tree)
+    lengths = [
+        fn.end_lineno - fn.lineno + 1
+        for fn in visitor.func_nodes
+        if fn.end_lineno is not None
+    ]
+    return float(visitor.complexity), visitor.max_nesting, len(visitor.func_nodes), lengths
 
 
 def _ast_per_function_cc(
@@ -180,13 +267,14 @@ def _ast_per_function_cc(
     Also detects dispatch functions (flat if/elif or match/case).
     """
     results: list[FunctionCC] = []
-    for node in ast.walk(tree):
+    visitor = _ComplexityVisitor(per_function=True)
+    for node in _iter_nodes(tree):
         if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             continue
-        visitor = _ComplexityVisitor(per_function=True)
+        visitor.reset()
         for child in ast.iter_child_nodes(node):
             visitor.visit(child)
-        line_end = getattr(node, "end_lineno", node.lineno) or node.lineno
+        line_end = node.end_lineno or node.lineno
         results.append(
             FunctionCC(
                 path=path,
@@ -235,17 +323,19 @@ def _is_dispatch_function(
     return False
 
 
-_control_flow: Tuple[type, ...] = (
-    ast.If,
-    ast.For,
-    ast.While,
-    ast.AsyncFor,
-    ast.Try,
-    ast.With,
-    ast.AsyncWith,
+_control_flow: frozenset[type] = frozenset(
+    {
+        ast.If,
+        ast.For,
+        ast.While,
+        ast.AsyncFor,
+        ast.Try,
+        ast.With,
+        ast.AsyncWith,
+    }
 )
 if sys.version_info >= (3, 10):
-    _control_flow = _control_flow + (ast.Match,)
+    _control_flow = _control_flow | {ast.Match}
 
 
 def _is_flat_if_chain(node: ast.If) -> bool:
@@ -263,7 +353,7 @@ def _is_flat_if_chain(node: ast.If) -> bool:
 
     for branch in branches:
         for stmt in branch:
-            if isinstance(stmt, _control_flow):
+            if type(stmt) in _control_flow:
                 return False
     return True
 
@@ -293,6 +383,13 @@ class _EssentialComplexityVisitor(ast.NodeVisitor):
         self._return_depths: list[int] = []
         self._depth = 0
 
+    def reset(self) -> None:
+        """Clear accumulated state so one instance can visit many functions."""
+        self._non_reducible = 0
+        self._in_loop = False
+        self._return_depths = []
+        self._depth = 0
+
     @property
     def essential_complexity(self) -> float:
         """Compute ev(G). Minimum is 1."""
@@ -341,7 +438,7 @@ class _EssentialComplexityVisitor(ast.NodeVisitor):
 
     def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:  # noqa: N802
         """Count bare-raise as non-reducible; track depth for return analysis."""
-        for child in ast.walk(node):
+        for child in _iter_nodes(node):
             if isinstance(child, ast.Raise) and child.exc is None:
                 self._non_reducible += 1
                 break
@@ -372,7 +469,7 @@ def _ast_file_essential_complexity(tree: ast.Module) -> float:
     functions exist (fully structured by default).
     """
     evs: list[float] = []
-    for node in ast.walk(tree):
+    for node in _iter_nodes(tree):
         if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             evs.append(_ast_essential_complexity(node))
     return max(evs) if evs else 1.0
@@ -381,51 +478,33 @@ def _ast_file_essential_complexity(tree: ast.Module) -> float:
 def _single_pass_ast(tree: ast.Module) -> ASTAnalysis:
     """Collect all AST metrics in a single tree walk + per-function visitors.
 
-    One ast.walk(tree) collects functions, imports, classes.
+    One _FileVisitor descent computes total CC and max_nesting (including
+    module-level branches) while collecting functions, imports, and classes.
     Then per-function _ComplexityVisitor + _EssentialComplexityVisitor
     compute CC, nesting, and EV for each function.
 
-    Eliminates ~4 redundant full-tree walks from the original 7-walk
-    approach. The full-tree _ComplexityVisitor still runs once for
-    total CC and max_nesting (which includes module-level branches).
+    Functions are collected in source (depth-first) order.
     """
-    func_nodes: list[ast.FunctionDef | ast.AsyncFunctionDef] = []
-    imports: set[str] = set()
-    class_nodes: list[ast.ClassDef] = []
-    class_children: set[int] = set()
-
-    # Single walk: collect functions, imports, classes
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
-            class_nodes.append(node)
-            for child in ast.iter_child_nodes(node):
-                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    class_children.add(id(child))
-        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            func_nodes.append(node)
-        elif isinstance(node, ast.Import):
-            for alias in node.names:
-                imports.add(alias.name.split(".")[0])
-        elif isinstance(node, ast.ImportFrom) and node.module:
-            imports.add(node.module.split(".")[0])
+    full_visitor = _FileVisitor()
+    full_visitor.visit(tree)
+    func_nodes = full_visitor.func_nodes
+    class_children = full_visitor.class_children
 
     fn_self_attrs: dict[int, frozenset[str]] = {}
     class_rfc = 0
 
-    # Full-tree CC + nesting (one visitor run — matches _ast_complexity/_ast_nesting_depth)
-    full_visitor = _ComplexityVisitor()
-    full_visitor.visit(tree)
-
     # Per-function CC + EV; CC visitor also collects self_attrs and call_count
     # — folded here to avoid separate ast.walk passes in _compute_lcom (LCOM)
     # and _ast_ck_metrics (RFC).
     functions: list[FunctionDetail] = []
+    cc_visitor = _ComplexityVisitor(per_function=True)
+    ev_visitor = _EssentialComplexityVisitor()
     for fn_node in func_nodes:
-        cc_visitor = _ComplexityVisitor(per_function=True)
+        cc_visitor.reset()
         for child in ast.iter_child_nodes(fn_node):
             cc_visitor.visit(child)
 
-        ev_visitor = _EssentialComplexityVisitor()
+        ev_visitor.reset()
         for child in ast.iter_child_nodes(fn_node):
             ev_visitor.visit(child)
 
@@ -436,7 +515,7 @@ def _single_pass_ast(tree: ast.Module) -> ASTAnalysis:
             # RFC: +1 for the method def itself, + all Call nodes inside it
             class_rfc += 1 + cc_visitor.call_count
 
-        line_end = getattr(fn_node, "end_lineno", fn_node.lineno) or fn_node.lineno
+        line_end = fn_node.end_lineno or fn_node.lineno
         functions.append(
             FunctionDetail(
                 name=fn_node.name,
@@ -453,8 +532,8 @@ def _single_pass_ast(tree: ast.Module) -> ASTAnalysis:
         total_complexity=float(full_visitor.complexity),
         max_nesting=full_visitor.max_nesting,
         functions=functions,
-        imports=imports,
-        class_nodes=class_nodes,
+        imports=full_visitor.imports,
+        class_nodes=full_visitor.class_nodes,
         fn_self_attrs=fn_self_attrs,
         class_rfc=class_rfc,
     )
@@ -481,10 +560,12 @@ def _ast_ck_metrics(
         classes = analysis.class_nodes
         imports = analysis.imports
     else:
-        classes = [n for n in ast.walk(tree) if isinstance(n, ast.ClassDef)]
+        classes = []
         imports = set()
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
+        for node in _iter_nodes(tree):
+            if isinstance(node, ast.ClassDef):
+                classes.append(node)
+            elif isinstance(node, ast.Import):
                 for alias in node.names:
                     imports.add(alias.name.split(".")[0])
             elif isinstance(node, ast.ImportFrom) and node.module:
@@ -500,37 +581,20 @@ def _ast_ck_metrics(
             )
         return None
 
-    # WMC: derive from ASTAnalysis (correct: only class methods) or fallback
+    # WMC, RFC and per-method self attrs (for LCOM): from ASTAnalysis, or
+    # one fused walk per class when called standalone.
     if analysis is not None:
         wmc = analysis.wmc
+        rfc = analysis.class_rfc
+        fn_attrs = analysis.fn_self_attrs
     else:
-        wmc = 0
-        for cls_node in classes:
-            for item in ast.walk(cls_node):
-                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    visitor = _ComplexityVisitor(per_function=True)
-                    for child in ast.iter_child_nodes(item):
-                        visitor.visit(child)
-                    wmc += visitor.complexity
+        wmc, rfc, fn_attrs = _class_walk_metrics(classes)
 
     # direct_bases: max number of direct base classes across all classes
     # (renamed from "dit" — len(bases) measures breadth, not depth)
-    direct_bases = 0
-    for cls_node in classes:
-        direct_bases = max(direct_bases, len(cls_node.bases))
-
-    # RFC: method definitions + Call nodes in all classes
-    if analysis is not None:
-        rfc = analysis.class_rfc
-    else:
-        rfc = 0
-        for cls_node in classes:
-            for item in ast.walk(cls_node):
-                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Call)):
-                    rfc += 1
+    direct_bases = max(len(cls_node.bases) for cls_node in classes)
 
     # LCOM: Lack of Cohesion in Methods
-    fn_attrs = analysis.fn_self_attrs if analysis is not None else None
     lcom = _compute_lcom(classes, fn_attrs)
 
     return CKMetrics(
@@ -547,10 +611,39 @@ def _ast_ck_metrics(
     )
 
 
+def _class_walk_metrics(
+    classes: list[ast.ClassDef],
+) -> tuple[float, int, dict[int, frozenset[str]]]:
+    """Compute WMC, RFC and per-method self attrs from each class's direct methods.
+
+    Standalone counterpart of the ASTAnalysis fields (wmc, class_rfc,
+    fn_self_attrs). Only cls_node.body is scanned -- the per-method CC
+    visitor already descends the method body, so walking the whole class
+    was redundant. Nested classes appear in ``classes`` themselves.
+    Each method adds its CC to WMC and 1 + its Call count to RFC; the same
+    visitor collects self.x names so _compute_lcom does not re-walk methods.
+    """
+    wmc = 0.0
+    rfc = 0
+    fn_attrs: dict[int, frozenset[str]] = {}
+    visitor = _ComplexityVisitor(per_function=True)
+    for cls_node in classes:
+        for item in cls_node.body:
+            if type(item) not in _FUNC_TYPES:
+                continue
+            visitor.reset()
+            for child in ast.iter_child_nodes(item):
+                visitor.visit(child)
+            wmc += visitor.complexity
+            rfc += 1 + visitor.call_count
+            fn_attrs[id(item)] = frozenset(visitor.self_attrs)
+    return wmc, rfc, fn_attrs
+
+
 def _self_attrs_for_method(item: ast.FunctionDef | ast.AsyncFunctionDef) -> frozenset[str]:
     """Walk a method body and collect self.x attribute names."""
     attrs: set[str] = set()
-    for node in ast.walk(item):
+    for node in _iter_nodes(item):
         if (
             isinstance(node, ast.Attribute)
             and isinstance(node.value, ast.Name)
@@ -570,6 +663,7 @@ def _compute_lcom(
     per-method self.x attr sets — no re-walk. Early-exits to 1.0 when no
     method references self attributes (all pairs share nothing).
     LCOM = 1 - (pairs_sharing / total_pairs). Averaged across classes.
+    Pair sharing is tested on int bitmasks grouped by distinct mask.
     """
     if not classes:
         return 0.0
@@ -577,14 +671,11 @@ def _compute_lcom(
     lcom_values: list[float] = []
     for cls_node in classes:
         if fn_self_attrs is not None:
-            # pylint: disable=unidiomatic-typecheck
             method_attrs: list[frozenset[str]] = [
                 fn_self_attrs[id(item)]
                 for item in ast.iter_child_nodes(cls_node)
-                if (type(item) is ast.FunctionDef or type(item) is ast.AsyncFunctionDef)
-                and id(item) in fn_self_attrs
+                if type(item) in _FUNC_TYPES and id(item) in fn_self_attrs
             ]
-            # pylint: enable=unidiomatic-typecheck
         else:
             method_attrs = [
                 _self_attrs_for_method(item)
@@ -601,18 +692,30 @@ def _compute_lcom(
             lcom_values.append(1.0)
             continue
 
-        total_pairs = 0
+        # Encode each method's attr set as an int bitmask over this class's
+        # attrs, so "pair shares an attr" is one int AND. Identical masks are
+        # grouped: a pair of equal non-zero masks always shares, so only
+        # distinct masks need the pairwise test.
+        attr_bit: dict[str, int] = {}
+        mask_counts: dict[int, int] = {}
+        for attrs in method_attrs:
+            mask = 0
+            for name in attrs:
+                mask |= 1 << attr_bit.setdefault(name, len(attr_bit))
+            mask_counts[mask] = mask_counts.get(mask, 0) + 1
+
+        n_methods = len(method_attrs)
+        total_pairs = n_methods * (n_methods - 1) // 2
         sharing_pairs = 0
-        for i, mi in enumerate(method_attrs):
-            for mj in method_attrs[i + 1 :]:
-                total_pairs += 1
-                if mi & mj:
-                    sharing_pairs += 1
+        groups = list(mask_counts.items())
+        for i, (mask_i, count_i) in enumerate(groups):
+            if mask_i:
+                sharing_pairs += count_i * (count_i - 1) // 2
+            for mask_j, count_j in groups[i + 1 :]:
+                if mask_i & mask_j:
+                    sharing_pairs += count_i * count_j
 
-        if total_pairs == 0:  # pragma: no cover
-            lcom_values.append(0.0)
-        else:
-            lcom_values.append(1.0 - (sharing_pairs / total_pairs))
+        lcom_values.append(1.0 - (sharing_pairs / total_pairs))
 
     return sum(lcom_values) / len(lcom_values) if lcom_values else 0.0
 
@@ -622,51 +725,65 @@ def _compute_lcom(
 # ---------------------------------------------------------------------------
 
 
-def _regex_analyze(source: str) -> dict[str, Any]:
-    """Regex-based analysis fallback for files that fail ast.parse()."""
-    lines = source.splitlines()
-    non_empty = [ln for ln in lines if ln.strip() and not ln.strip().startswith("#")]
+class _RegexAnalysis(TypedDict):
+    """Metrics produced by the regex fallback (no CK / ev / per-function CC)."""
+
+    loc: int
+    complexity: float
+    functions: int
+    max_nesting: int
+    avg_fn_len: float
+    indent_sd: float
+
+
+def _regex_analyze(source: str) -> _RegexAnalysis:
+    """Regex-based analysis fallback for files that fail ast.parse().
+
+    A single _LINE_PATTERN.finditer pass over the whole source visits each
+    code line once; blank and comment lines never match, so the match count
+    is LOC and the indent widths feed indent SD. Line numbers are only
+    resolved (bisect over newline offsets) for function definitions.
+    """
+    # Normalise line breaks without a per-line list so line numbering
+    # matches splitlines(); str.replace is far cheaper than re.sub for CRLF.
+    if "\r" in source:
+        source = source.replace("\r\n", "\n").replace("\r", "\n")
+    if _OTHER_LINE_BREAKS.search(source):
+        source = _OTHER_LINE_BREAKS.sub("\n", source)
 
     complexity = 1  # Base
-    functions = 0
-    max_nesting = 0
-    func_starts: list[int] = []
-    imports: set[str] = set()
+    indents: list[int] = []
+    func_offsets: list[int] = []
 
-    for i, line in enumerate(lines):
-        if _BRANCH_PATTERN.match(line):
+    for m in _LINE_PATTERN.finditer(source):
+        indents.append(m.end("indent") - m.start())
+        kind = m.lastgroup
+        if kind == "branch":
             complexity += 1
-        if _FUNC_PATTERN.match(line):
-            functions += 1
-            func_starts.append(i)
-        if _IMPORT_PATTERN.match(line):
-            m = _IMPORT_PATTERN.match(line)
-            if m:
-                imports.add(m.group(1).split(".")[0])
-
-        # Nesting: count leading whitespace (assuming 4-space indent)
-        stripped = line.lstrip()
-        if stripped and not stripped.startswith("#"):
-            indent = len(line) - len(stripped)
-            level = indent // 4
-            max_nesting = max(max_nesting, level)
+        elif kind == "func":
+            func_offsets.append(m.start())
 
     # Estimate average function length
     avg_fn_len = 0.0
-    if func_starts:
+    if func_offsets:
+        newlines = [m.start() for m in _NEWLINE.finditer(source)]
+        total_lines = len(newlines) + (0 if source.endswith("\n") else 1)
+        func_starts = [bisect_left(newlines, off) for off in func_offsets]
         lengths: list[int] = []
         for idx, start in enumerate(func_starts):
-            end = func_starts[idx + 1] if idx + 1 < len(func_starts) else len(lines)
+            end = func_starts[idx + 1] if idx + 1 < len(func_starts) else total_lines
             lengths.append(end - start)
-        avg_fn_len = sum(lengths) / len(lengths) if lengths else 0.0
-
-    return {
-        "loc": len(non_empty),
-        "complexity": float(complexity),
-        "functions": functions,
-        "max_nesting": max_nesting,
-        "avg_fn_len": avg_fn_len,
-    }
+        avg_fn_len = sum(lengths) / len(lengths)
+
+    # Nesting: deepest leading whitespace (assuming 4-space indent)
+    return _RegexAnalysis(
+        loc=len(indents),
+        complexity=float(complexity),
+        functions=len(func_offsets),
+        max_nesting=max(indents, default=0) // 4,
+        avg_fn_len=avg_fn_len,
+        indent_sd=_indent_widths_sd(indents),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -674,6 +791,10 @@ def _regex_analyze(source: str) -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
+# compile() flags equivalent to ast.parse(); dont_inherit=True keeps this
+# module's own __future__ imports out of the parse.
+_PARSE_FLAGS = ast.PyCF_ONLY_AST
+
 # Result type: (FileEntry, CKMetrics | None, list[FunctionCC])
 AnalysisResult = Tuple[FileEntry, Optional[CKMetrics], list[FunctionCC]]
 
@@ -681,11 +802,14 @@ AnalysisResult = Tuple[FileEntry, Optional[CKMetrics], list[FunctionCC]]
 def analyze_python_file(
     filepath: str | Path,
     scan_id: int = 0,
+    *,
+    compute_ck: bool = True,
 ) -> AnalysisResult:
     """Analyze a Python source file.
 
     Returns (FileEntry, CKMetrics | None, list[FunctionCC]).
     Uses ast as primary path; falls back to regex on parse failure.
+    Pass compute_ck=False to skip the CK suite when only FileEntry is needed.
     """
     path = Path(filepath)
     try:
@@ -698,26 +822,85 @@ def analyze_python_file(
             [],
         )
 
-    return analyze_python_source(source, str(filepath), scan_id)
+    return analyze_python_source(source, str(filepath), scan_id, compute_ck=compute_ck)
+
+
+# Below this many files, process-pool startup outweighs the parallel speedup.
+_PARALLEL_MIN_FILES = 32
+
+# Each worker is a fresh interpreter that re-imports weave_quality; past a
+# handful the startup cost outweighs the extra parallelism.
+_MAX_WORKERS = 8
+
+# Worker-count override; 1 (or 0) keeps analysis serial in-process.
+_WORKERS_ENV = "WV_QUALITY_WORKERS"
+
+
+def _default_workers() -> int:
+    """Worker count from $WV_QUALITY_WORKERS, else min(cpu_count, _MAX_WORKERS)."""
+    raw = os.environ.get(_WORKERS_ENV, "").strip()
+    if raw:
+        try:
+            return int(raw)
+        except ValueError:
+            log.warning("Ignoring non-integer %s=%r", _WORKERS_ENV, raw)
+    return min(os.cpu_count() or 1, _MAX_WORKERS)
+
+
+def analyze_python_files(
+    paths: Iterable[str | Path],
+    scan_id: int = 0,
+    workers: int | None = None,
+) -> list[AnalysisResult]:
+    """Analyze many Python files, fanning out across worker processes.
+
+    Returns results in input order (same contract as analyze_python_file).
+    workers defaults to _default_workers(), so $WV_QUALITY_WORKERS=1 turns
+    the pool off for `wv quality scan`. Runs serially in-process when
+    workers <= 1 or the batch is smaller than _PARALLEL_MIN_FILES, and
+    falls back to serial if the pool cannot start.
+    Workers use forkserver/spawn, not fork: cmd_scan runs git threads
+    concurrently with analysis, and forking a threaded process is unsafe.
+    """
+    path_list = list(paths)
+    if workers is None:
+        workers = _default_workers()
+    workers = min(workers, len(path_list))
+    if workers <= 1 or len(path_list) < _PARALLEL_MIN_FILES:
+        return [analyze_python_file(p, scan_id) for p in path_list]
+
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    chunksize = max(1, len(path_list) // (workers * 8))
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context(method)
+        ) as pool:
+            return list(
+                pool.map(partial(analyze_python_file, scan_id=scan_id), path_list, chunksize=chunksize)
+            )
+    except (OSError, BrokenProcessPool) as exc:
+        log.debug("process pool unavailable (%s), analyzing serially", exc)
+        return [analyze_python_file(p, scan_id) for p in path_list]
 
 
 def analyze_python_source(
     source: str,
     filepath: str,
     scan_id: int = 0,
+    *,
+    compute_ck: bool = True,
 ) -> AnalysisResult:
     """Analyze Python source code (string).
 
     Primary path: ast.parse() for accurate metrics + CK suite.
     Fallback: regex heuristics if ast fails (no CK/ev in fallback).
+    compute_ck=False skips the CK suite and returns None in its slot, as
+    the fallback does; FileEntry and per-function CC are unaffected.
     """
-    lines = source.splitlines()
-    non_empty = [ln for ln in lines if ln.strip() and not ln.strip().startswith("#")]
-    loc = len(non_empty)
-
     # Try ast path first (D1=Option B)
     try:
-        tree = ast.parse(source, filename=filepath)
+        tree = compile(source, filepath or "<source>", "exec", _PARSE_FLAGS, dont_inherit=True)
+        indents = _code_line_indents(source.splitlines())
         analysis = _single_pass_ast(tree)
 
         # Convert FunctionDetail → FunctionCC for return contract
@@ -735,14 +918,14 @@ def analyze_python_source(
             for f in analysis.functions
         ]
 
-        ck = _ast_ck_metrics(tree, filepath, scan_id, analysis=analysis)
-        indent_sd = _indent_sd(lines)
+        ck = _ast_ck_metrics(tree, filepath, scan_id, analysis=analysis) if compute_ck else None
+        indent_sd = _indent_widths_sd(indents)
 
         entry = FileEntry(
             path=filepath,
             scan_id=scan_id,
             language="python",
-            loc=loc,
+            loc=len(indents),
             complexity=analysis.total_complexity,
             functions=analysis.function_count,
             max_nesting=analysis.max_nesting,
@@ -752,8 +935,8 @@ def analyze_python_source(
         )
         return entry, ck, fn_cc
 
-    except (SyntaxError, ValueError, RecursionError):
-        log.debug("ast.parse failed for %s, using regex fallback", filepath)
+    except (SyntaxError, ValueError, RecursionError) as exc:
+        log.debug("ast.parse failed for %s (%s), using regex fallback", filepath, exc)
 
     # Regex fallback
     result = _regex_analyze(source)
@@ -761,11 +944,11 @@ def analyze_python_source(
         path=filepath,
         scan_id=scan_id,
         language="python",
-        loc=loc,
+        loc=result["loc"],
         complexity=result["complexity"],
         functions=result["functions"],
         max_nesting=result["max_nesting"],
         avg_fn_len=result["avg_fn_len"],
-        indent_sd=_indent_sd(lines),
+        indent_sd=result["indent_sd"],
     )
     return entry, None, []  # No CK/ev/fn_cc from regex path
@@ -0,0 +1,28 @@
+"""Plain test-data builders shared by the top-level Python test modules.
+
+Kept outside conftest.py so modules that need them at collection time
+(parametrize cases) can import them like any other module.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from weave_gh.models import WeaveNode
+
+# Signature of build_node, as handed out by the make_node fixture
+NodeFactory = Callable[..., WeaveNode]
+
+
+def build_node(
+    node_id: str = "n1",
+    text: str = "Test node",
+    status: str = "todo",
+    gh_issue: int | str | None = None,
+    **meta: object,
+) -> WeaveNode:
+    """Build a WeaveNode; gh_issue and extra kwargs go into metadata."""
+    metadata: dict[str, object] = {**meta}
+    if gh_issue is not None:
+        metadata["gh_issue"] = gh_issue
+    return WeaveNode(id=node_id, text=text, status=status, metadata=metadata)
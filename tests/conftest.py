@@ -0,0 +1,12 @@
+"""Shared pytest fixtures for the top-level Python test modules."""
+
+from __future__ import annotations
+
+import pytest
+from _builders import NodeFactory, build_node
+
+
+@pytest.fixture(scope="session")
+def make_node() -> NodeFactory:
+    """Return the shared WeaveNode builder (see _builders.build_node)."""
+    return build_node
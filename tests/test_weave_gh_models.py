@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 
+import pytest
+
+from _builders import NodeFactory
 from weave_gh.models import Edge, GitHubIssue, Mode, SyncStats, WeaveNode
 
 
@@ -12,16 +16,16 @@ from weave_gh.models import Edge, GitHubIssue, Mode, SyncStats, WeaveNode
 
 
 class TestWeaveNodeGhIssue:
-    def test_gh_issue_present(self) -> None:
-        node = WeaveNode(id="n1", text="t", status="todo", metadata={"gh_issue": 42})
+    def test_gh_issue_present(self, make_node: NodeFactory) -> None:
+        node = make_node(gh_issue=42)
         assert node.gh_issue == 42
 
-    def test_gh_issue_string_coerced(self) -> None:
-        node = WeaveNode(id="n1", text="t", status="todo", metadata={"gh_issue": "7"})
+    def test_gh_issue_string_coerced(self, make_node: NodeFactory) -> None:
+        node = make_node(gh_issue="7")
         assert node.gh_issue == 7
 
-    def test_gh_issue_missing(self) -> None:
-        node = WeaveNode(id="n1", text="t", status="todo")
+    def test_gh_issue_missing(self, make_node: NodeFactory) -> None:
+        node = make_node()
         assert node.gh_issue is None
 
     def test_gh_issue_none_explicit(self) -> None:
@@ -30,99 +34,90 @@ class TestWeaveNodeGhIssue:
 
 
 class TestWeaveNodePriority:
-    def test_default_priority(self) -> None:
-        node = WeaveNode(id="n1", text="t", status="todo")
+    def test_default_priority(self, make_node: NodeFactory) -> None:
+        node = make_node()
         assert node.priority == 2
 
-    def test_explicit_priority(self) -> None:
-        node = WeaveNode(id="n1", text="t", status="todo", metadata={"priority": 1})
+    def test_explicit_priority(self, make_node: NodeFactory) -> None:
+        node = make_node(priority=1)
         assert node.priority == 1
 
-    def test_string_priority_coerced(self) -> None:
-        node = WeaveNode(id="n1", text="t", status="todo", metadata={"priority": "3"})
+    def test_string_priority_coerced(self, make_node: NodeFactory) -> None:
+        node = make_node(priority="3")
         assert node.priority == 3
 
 
 class TestWeaveNodeType:
-    def test_default_type(self) -> None:
-        node = WeaveNode(id="n1", text="t", status="todo")
+    def test_default_type(self, make_node: NodeFactory) -> None:
+        node = make_node()
         assert node.node_type == "task"
 
-    def test_explicit_type(self) -> None:
-        node = WeaveNode(id="n1", text="t", status="todo", metadata={"type": "epic"})
+    def test_explicit_type(self, make_node: NodeFactory) -> None:
+        node = make_node(type="epic")
         assert node.node_type == "epic"
 
 
 class TestWeaveNodeDescription:
-    def test_default_empty(self) -> None:
-        node = WeaveNode(id="n1", text="t", status="todo")
+    def test_default_empty(self, make_node: NodeFactory) -> None:
+        node = make_node()
         assert node.description == ""
 
-    def test_explicit(self) -> None:
-        node = WeaveNode(
-            id="n1",
-            text="t",
-            status="todo",
-            metadata={"description": "Build the thing"},
-        )
+    def test_explicit(self, make_node: NodeFactory) -> None:
+        node = make_node(description="Build the thing")
         assert node.description == "Build the thing"
 
 
 class TestWeaveNodeNoSync:
-    def test_default_false(self) -> None:
-        node = WeaveNode(id="n1", text="t", status="todo")
+    def test_default_false(self, make_node: NodeFactory) -> None:
+        node = make_node()
         assert node.no_sync is False
 
-    def test_explicit_true(self) -> None:
-        node = WeaveNode(id="n1", text="t", status="todo", metadata={"no_sync": True})
+    def test_explicit_true(self, make_node: NodeFactory) -> None:
+        node = make_node(no_sync=True)
         assert node.no_sync is True
 
-    def test_truthy_not_true(self) -> None:
+    def test_truthy_not_true(self, make_node: NodeFactory) -> None:
         """no_sync requires literal True, not just truthy."""
-        node = WeaveNode(id="n1", text="t", status="todo", metadata={"no_sync": "yes"})
+        node = make_node(no_sync="yes")
         assert node.no_sync is False
 
 
 class TestWeaveNodeIsTest:
-    def test_not_test(self) -> None:
-        node = WeaveNode(id="n1", text="t", status="todo")
+    def test_not_test(self, make_node: NodeFactory) -> None:
+        node = make_node()
         assert node.is_test is False
 
-    def test_is_test(self) -> None:
-        node = WeaveNode(id="n1", text="t", status="todo", metadata={"type": "test"})
+    def test_is_test(self, make_node: NodeFactory) -> None:
+        node = make_node(type="test")
         assert node.is_test is True
 
 
 class TestWeaveNodeClaimedBy:
-    def test_missing(self) -> None:
-        node = WeaveNode(id="n1", text="t", status="todo")
+    def test_missing(self, make_node: NodeFactory) -> None:
+        node = make_node()
         assert node.claimed_by is None
 
-    def test_present(self) -> None:
-        node = WeaveNode(id="n1", text="t", status="active", metadata={"claimed_by": "alice"})
+    def test_present(self, make_node: NodeFactory) -> None:
+        node = make_node(status="active", claimed_by="alice")
         assert node.claimed_by == "alice"
 
-    def test_coerced_to_str(self) -> None:
-        node = WeaveNode(id="n1", text="t", status="todo", metadata={"claimed_by": 42})
+    def test_coerced_to_str(self, make_node: NodeFactory) -> None:
+        node = make_node(claimed_by=42)
         assert node.claimed_by == "42"
 
 
 class TestWeaveNodeLearningParts:
-    def test_empty(self) -> None:
-        node = WeaveNode(id="n1", text="t", status="done")
+    def test_empty(self, make_node: NodeFactory) -> None:
+        node = make_node(status="done")
         assert node.learning_parts() == {}
 
-    def test_all_parts(self) -> None:
-        node = WeaveNode(
-            id="n1",
-            text="t",
+    def test_all_parts(self, make_node: NodeFactory) -> None:
+        node = make_node(
             status="done",
-            metadata={
-                "decision": "Use SQLite",
-                "pattern": "Singleton",
-                "pitfall": "Race conditions",
-                "learning": "Always lock",
-            },
+            decision="Use SQLite",
+            pattern="Singleton",
+            pitfall="Race conditions",
+            learning="Always lock",
         )
         parts = node.learning_parts()
         assert parts == {
@@ -132,22 +127,12 @@ class TestWeaveNodeLearningParts:
             "learning": "Always lock",
         }
 
-    def test_partial(self) -> None:
-        node = WeaveNode(
-            id="n1",
-            text="t",
-            status="done",
-            metadata={"pitfall": "Overengineering"},
-        )
+    def test_partial(self, make_node: NodeFactory) -> None:
+        node = make_node(status="done", pitfall="Overengineering")
         assert node.learning_parts() == {"pitfall": "Overengineering"}
 
-    def test_falsy_values_excluded(self) -> None:
-        node = WeaveNode(
-            id="n1",
-            text="t",
-            status="done",
-            metadata={"decision": "", "pitfall": "X"},
-        )
+    def test_falsy_values_excluded(self, make_node: NodeFactory) -> None:
+        node = make_node(status="done", decision="", pitfall="X")
         assert node.learning_parts() == {"pitfall": "X"}
 
 
@@ -199,43 +184,41 @@ class TestEdge:
 
 
 class TestSyncStats:
-    def test_no_changes(self) -> None:
-        stats = SyncStats()
-        assert stats.summary() == "[full] no changes"
-
-    def test_single_operation(self) -> None:
-        stats = SyncStats(created_gh=3)
-        assert stats.summary() == "[full] GH created: 3"
-
-    def test_multiple_operations(self) -> None:
-        stats = SyncStats(created_gh=2, closed_gh=1, updated_gh=5)
-        summary = stats.summary()
-        assert "GH created: 2" in summary
-        assert "GH closed: 1" in summary
-        assert "GH updated: 5" in summary
-        # Verify separator
-        assert " | " in summary
-
-    def test_all_operations(self) -> None:
-        stats = SyncStats(
-            created_gh=1,
-            closed_gh=2,
-            reopened_gh=3,
-            updated_gh=4,
-            created_wv=5,
-            closed_wv=6,
-            already_synced=7,
-            skipped=8,
-        )
-        summary = stats.summary()
-        assert summary.count("|") == 7  # 8 parts, 7 separators
-
-    def test_zero_operations_omitted(self) -> None:
-        stats = SyncStats(created_gh=1, skipped=2)
-        summary = stats.summary()
-        assert "GH closed" not in summary
-        assert "GH created: 1" in summary
-        assert "skipped: 2" in summary
+    @pytest.mark.parametrize(
+        ("kwargs", "check"),
+        [
+            ({}, lambda s: s == "[full] no changes"),
+            ({"created_gh": 3}, lambda s: s == "[full] GH created: 3"),
+            (
+                {"created_gh": 2, "closed_gh": 1, "updated_gh": 5},
+                lambda s: "GH created: 2" in s
+                and "GH closed: 1" in s
+                and "GH updated: 5" in s
+                and " | " in s,
+            ),
+            (
+                {
+                    "created_gh": 1,
+                    "closed_gh": 2,
+                    "reopened_gh": 3,
+                    "updated_gh": 4,
+                    "created_wv": 5,
+                    "closed_wv": 6,
+                    "already_synced": 7,
+                    "skipped": 8,
+                },
+                lambda s: s.count("|") == 7,  # 8 parts, 7 separators
+            ),
+            (
+                {"created_gh": 1, "skipped": 2},
+                lambda s: "GH closed" not in s and "GH created: 1" in s and "skipped: 2" in s,
+            ),
+        ],
+        ids=["no-changes", "single", "multiple", "all", "zero-omitted"],
+    )
+    def test_summary(self, kwargs: dict[str, int], check: Callable[[str], bool]) -> None:
+        summary = SyncStats(**kwargs).summary()
+        assert check(summary), summary
 
     def test_mode_prefix_reflects_mode(self) -> None:
         stats = SyncStats(mode=Mode.FAST)
@@ -275,7 +258,5 @@ class TestMode:
         assert Mode.parse("repair") is Mode.REPAIR
 
     def test_parse_invalid_raises(self) -> None:
-        import pytest
-
         with pytest.raises(ValueError, match="invalid sync mode"):
             Mode.parse("turbo")
@@ -4,16 +4,21 @@ from __future__ import annotations
 
 import json
 import subprocess
-from contextlib import contextmanager
-from typing import Any, Generator
-from unittest.mock import patch
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Generator
+from unittest.mock import MagicMock, patch
 
+import pytest
+
+from _builders import build_node
+from weave_gh import phases
 from weave_gh.models import GitHubIssue, Mode, SyncStats, WeaveNode
 from weave_gh.models import Edge
 from weave_gh.phases import (
     _backfill_gh_issue,
     _current_gh_login,
     _desired_assignee_for_node,
+    _find_gh_match_by_body,
     _handle_existing_issue,
     _handle_new_issue,
     _invalid_assignees,
@@ -34,17 +39,7 @@ from weave_gh.phases import (
 # ---------------------------------------------------------------------------
 
 
-def _node(
-    node_id: str,
-    text: str = "Test node",
-    status: str = "todo",
-    gh_issue: int | None = None,
-    **meta: object,
-) -> WeaveNode:
-    metadata: dict[str, object] = {**meta}
-    if gh_issue is not None:
-        metadata["gh_issue"] = gh_issue
-    return WeaveNode(id=node_id, text=text, status=status, metadata=metadata)
+_DEFAULT_LABELS = ("weave-synced",)
 
 
 def _issue(
@@ -59,7 +54,7 @@ def _issue(
         title=title,
         state=state,
         body=body,
-        labels=labels or ["weave-synced"],
+        labels=list(labels or _DEFAULT_LABELS),
     )
 
 
@@ -72,34 +67,27 @@ def _issue(
 class TestWasClosedByWeave:
     """The _was_closed_by_weave helper checks the last GH comment for the marker."""
 
-    def test_detects_weave_close_comment(self) -> None:
-        """Should return True when last comment has the Weave close marker."""
-        with patch(
-            "weave_gh.phases.gh_cli",
-            return_value=f"{_WEAVE_CLOSE_MARKER} `wv-abcd` closed.",
-        ):
-            assert _was_closed_by_weave(100, "owner/repo") is True
+    @pytest.mark.parametrize(
+        ("gh_result", "expected"),
+        [
+            (f"{_WEAVE_CLOSE_MARKER} `wv-abcd` closed.", True),
+            ("Closing this as won't fix.", False),
+            ("", False),
+            # API errors fail open so the reopen is allowed.
+            (subprocess.SubprocessError("API error"), False),
+        ],
+        ids=["weave-marker", "human-comment", "no-comments", "api-error"],
+    )
+    def test_last_comment_marker(
+        self, monkeypatch: pytest.MonkeyPatch, gh_result: str | Exception, expected: bool
+    ) -> None:
+        def fake_gh_cli(*_a: object, **_k: object) -> str:
+            if isinstance(gh_result, Exception):
+                raise gh_result
+            return gh_result
 
-    def test_no_weave_marker(self) -> None:
-        """Should return False when last comment is a human comment."""
-        with patch(
-            "weave_gh.phases.gh_cli",
-            return_value="Closing this as won't fix.",
-        ):
-            assert _was_closed_by_weave(100, "owner/repo") is False
-
-    def test_empty_comments(self) -> None:
-        """Should return False when issue has no comments."""
-        with patch("weave_gh.phases.gh_cli", return_value=""):
-            assert _was_closed_by_weave(100, "owner/repo") is False
-
-    def test_api_error_fails_open(self) -> None:
-        """Should return False on API errors (fail-open allows reopen)."""
-        with patch(
-            "weave_gh.phases.gh_cli",
-            side_effect=subprocess.SubprocessError("API error"),
-        ):
-            assert _was_closed_by_weave(100, "owner/repo") is False
+        monkeypatch.setattr(phases, "gh_cli", fake_gh_cli)
+        assert _was_closed_by_weave(100, "owner/repo") is expected
 
 
 # ---------------------------------------------------------------------------
@@ -107,24 +95,42 @@ class TestWasClosedByWeave:
 # ---------------------------------------------------------------------------
 
 
+# No-op stand-ins for everything _handle_existing_issue reaches in phases.
+_PHASE_MOCKS: dict[str, Any] = {
+    "get_edges_for_node": lambda _: [],
+    "render_issue_body": lambda *_a, **_k: "",
+    "should_update_body": lambda *_a: False,
+    "get_labels_for_node": lambda _: [],
+    "sync_issue_labels": lambda *_a, **_k: None,
+    "gh_cli": lambda *_a, **_k: "",
+    "build_close_comment": lambda *_a, **_k: "close",
+    "_backfill_gh_issue": lambda *_a, **_k: None,
+    "_was_closed_by_weave": lambda *_a: False,
+}
+
+# Built once: a _patch can be re-entered after exit, and patch.object skips
+# the dotted-path resolution patch("weave_gh.phases.x") redoes on every enter.
+_PHASE_PATCHERS = [
+    patch.object(phases, name, new=mock) for name, mock in _PHASE_MOCKS.items()
+]
+
+
+@pytest.fixture
+def stats() -> SyncStats:
+    """Fresh SyncStats for a single phase call."""
+    return SyncStats()
+
+
 class TestReopenGuard:
     """The done_gh_issues guard should block reopens when another node is done."""
 
-    def _with_patches(self, **overrides: Any) -> Any:
-        """Return a patch.multiple context with sensible defaults, overridable per-test."""
-        base: dict[str, Any] = {
-            "get_edges_for_node": lambda _: [],
-            "render_issue_body": lambda *_a, **_k: "",
-            "should_update_body": lambda *_a: False,
-            "get_labels_for_node": lambda _: [],
-            "sync_issue_labels": lambda *_a, **_k: None,
-            "gh_cli": lambda *_a, **_k: "",
-            "build_close_comment": lambda *_a, **_k: "close",
-            "_backfill_gh_issue": lambda *_a, **_k: None,
-            "_was_closed_by_weave": lambda *_a: False,
-        }
-        base.update(overrides)
-        return patch.multiple("weave_gh.phases", **base)
+    @pytest.fixture(autouse=True)
+    def _phase_patches(self) -> Generator[None, None, None]:
+        """Apply _PHASE_PATCHERS; tests layer overrides with monkeypatch."""
+        with ExitStack() as stack:
+            for patcher in _PHASE_PATCHERS:
+                stack.enter_context(patcher)
+            yield
 
     def _call(
         self,
@@ -133,12 +139,11 @@ class TestReopenGuard:
         stats: SyncStats,
         done_gh_issues: set[int] | None = None,
         was_closed_by_weave: bool = False,
+        dry_run: bool = False,
     ) -> None:
         issues_by_num = {issue.number: issue}
         nodes_by_id = {node.id: node}
-        with self._with_patches(
-            _was_closed_by_weave=lambda *_a: was_closed_by_weave,
-        ):
+        with patch.object(phases, "_was_closed_by_weave", lambda *_a: was_closed_by_weave):
             _handle_existing_issue(
                 node,
                 issue.number,
@@ -148,13 +153,13 @@ class TestReopenGuard:
                 "https://github.com/owner/repo",
                 stats,
                 done_gh_issues=done_gh_issues,
+                dry_run=dry_run,
             )
 
-    def test_phantom_todo_blocked_by_done_sibling(self) -> None:
+    def test_phantom_todo_blocked_by_done_sibling(self, stats: SyncStats) -> None:
         """A phantom todo node should NOT reopen an issue if a done node owns it."""
-        phantom = _node("wv-aaaa", status="todo", gh_issue=100)
+        phantom = build_node("wv-aaaa", status="todo", gh_issue=100)
         issue = _issue(100, state="CLOSED")
-        stats = SyncStats()
 
         # done_gh_issues contains 100 (the real done node has this gh_issue)
         self._call(phantom, issue, stats, done_gh_issues={100})
@@ -163,43 +168,39 @@ class TestReopenGuard:
         assert stats.skipped == 1
         assert issue.state == "CLOSED"  # not mutated
 
-    def test_legit_todo_reopens_when_no_done_sibling(self) -> None:
+    def test_legit_todo_reopens_when_no_done_sibling(self, stats: SyncStats) -> None:
         """A real todo node should reopen a closed issue (no done sibling)."""
-        node = _node("wv-bbbb", status="todo", gh_issue=200)
+        node = build_node("wv-bbbb", status="todo", gh_issue=200)
         issue = _issue(200, state="CLOSED")
-        stats = SyncStats()
 
         self._call(node, issue, stats, done_gh_issues=set())
 
         assert stats.reopened_gh == 1
         assert issue.state == "OPEN"  # mutated by reopen
 
-    def test_reopen_guard_with_none(self) -> None:
+    def test_reopen_guard_with_none(self, stats: SyncStats) -> None:
         """When done_gh_issues is None, reopen proceeds normally."""
-        node = _node("wv-cccc", status="active", gh_issue=300)
+        node = build_node("wv-cccc", status="active", gh_issue=300)
         issue = _issue(300, state="CLOSED")
-        stats = SyncStats()
 
         self._call(node, issue, stats, done_gh_issues=None)
 
         assert stats.reopened_gh == 1
 
-    def test_done_node_closes_open_issue(self) -> None:
+    def test_done_node_closes_open_issue(self, stats: SyncStats) -> None:
         """A done node should close its open GH issue (not reopen)."""
-        node = _node("wv-dddd", status="done", gh_issue=400)
+        node = build_node("wv-dddd", status="done", gh_issue=400)
         issue = _issue(400, state="OPEN")
-        stats = SyncStats()
 
         self._call(node, issue, stats, done_gh_issues={400})
 
         assert stats.closed_gh == 1
         assert issue.state == "CLOSED"
 
-    def test_done_node_already_closed_is_noop(self) -> None:
+    def test_done_node_already_closed_is_noop(self, stats: SyncStats) -> None:
         """A done node with already-closed issue is just already_synced."""
-        node = _node("wv-eeee", status="done", gh_issue=500)
+        node = build_node("wv-eeee", status="done", gh_issue=500)
         issue = _issue(500, state="CLOSED")
-        stats = SyncStats()
 
         self._call(node, issue, stats, done_gh_issues={500})
 
@@ -207,7 +208,7 @@ class TestReopenGuard:
         assert stats.closed_gh == 0
         assert stats.already_synced == 1
 
-    def test_weave_closed_issue_not_reopened(self) -> None:
+    def test_weave_closed_issue_not_reopened(self, stats: SyncStats) -> None:
         """An issue closed by Weave should NOT be reopened even if node is active.
 
         Scenario: developer completes work and commits, but forgets `wv done`.
@@ -215,9 +216,8 @@ class TestReopenGuard:
         closed the GH issue (leaving a Weave close marker comment).
         Sync should skip the reopen and suggest `wv done` instead.
         """
-        node = _node("wv-hhhh", status="active", gh_issue=800)
+        node = build_node("wv-hhhh", status="active", gh_issue=800)
         issue = _issue(800, state="CLOSED")
-        stats = SyncStats()
 
         self._call(
             node, issue, stats,
@@ -229,15 +229,14 @@ class TestReopenGuard:
         assert stats.skipped == 1
         assert issue.state == "CLOSED"  # not mutated
 
-    def test_human_closed_issue_reopened(self) -> None:
+    def test_human_closed_issue_reopened(self, stats: SyncStats) -> None:
         """An issue closed by a human SHOULD be reopened if node is still open.
 
         Scenario: someone manually closes a GH issue, but the Weave node is
         still todo/active. Sync should reopen it because the work isn't done.
         """
-        node = _node("wv-iiii", status="todo", gh_issue=900)
+        node = build_node("wv-iiii", status="todo", gh_issue=900)
         issue = _issue(900, state="CLOSED")
-        stats = SyncStats()
 
         self._call(
             node, issue, stats,
@@ -248,83 +247,44 @@ class TestReopenGuard:
         assert stats.reopened_gh == 1
         assert issue.state == "OPEN"  # mutated by reopen
 
-    def test_closed_issue_body_still_updated(self) -> None:
+    def test_closed_issue_body_still_updated(
+        self, monkeypatch: pytest.MonkeyPatch, stats: SyncStats
+    ) -> None:
         """A closed issue whose body changed should still get updated.
 
         Scenario: wv done closes the GH issue directly, then wv sync --gh
         runs. The body (checkboxes, Mermaid) should be refreshed even though
         the issue is already closed.
         """
-        node = _node("wv-gggg", status="done", gh_issue=700)
+        node = build_node("wv-gggg", status="done", gh_issue=700)
         issue = _issue(700, state="CLOSED", body="old body")
-        stats = SyncStats()
-        issues_by_num = {700: issue}
-        nodes_by_id = {node.id: node}
 
-        gh_calls: list[tuple[object, ...]] = []
+        mock_gh = MagicMock(return_value="")
+        monkeypatch.setattr(
+            phases,
+            "render_issue_body",
+            lambda *_a, **_k: "<!-- WEAVE:BEGIN hash=abc123 -->\nnew\n<!-- WEAVE:END -->",
+        )
+        monkeypatch.setattr(phases, "should_update_body", lambda *_a: True)  # body changed
+        monkeypatch.setattr(phases, "extract_human_content", lambda _: "")
+        monkeypatch.setattr(phases, "compose_issue_body", lambda h, w: w)
+        monkeypatch.setattr(phases, "gh_cli", mock_gh)
 
-        def mock_gh_cli(*args: object, **_kwargs: object) -> str:
-            gh_calls.append(args)
-            return ""
-
-        with self._with_patches(
-            render_issue_body=(
-                lambda *_a, **_k: "<!-- WEAVE:BEGIN hash=abc123 -->\nnew\n<!-- WEAVE:END -->"
-            ),
-            should_update_body=lambda *_a: True,  # body changed
-            extract_human_content=lambda _: "",
-            compose_issue_body=lambda h, w: w,
-            gh_cli=mock_gh_cli,
-        ):
-            _handle_existing_issue(
-                node,
-                700,
-                issues_by_num,
-                nodes_by_id,
-                "owner/repo",
-                "https://github.com/owner/repo",
-                stats,
-                done_gh_issues={700},
-            )
+        self._call(node, issue, stats, done_gh_issues={700})
 
         # Body should have been updated even though issue was closed
         assert stats.updated_gh == 1
-        edit_calls = [c for c in gh_calls if "edit" in c]
+        edit_calls = [c for c in mock_gh.call_args_list if "edit" in c.args]
         assert len(edit_calls) == 1
         # Should NOT try to close again (already closed)
         assert stats.closed_gh == 0
 
-    def test_dry_run_reopen(self) -> None:
+    def test_dry_run_reopen(self, stats: SyncStats) -> None:
         """In dry-run, reopen should be counted but not executed."""
-        node = _node("wv-ffff", status="todo", gh_issue=600)
+        node = build_node("wv-ffff", status="todo", gh_issue=600)
         issue = _issue(600, state="CLOSED")
-        stats = SyncStats()
-        issues_by_num = {600: issue}
-        nodes_by_id = {node.id: node}
 
-        with patch.multiple(
-            "weave_gh.phases",
-            get_edges_for_node=lambda _: [],
-            render_issue_body=lambda *_a, **_k: "",
-            should_update_body=lambda *_a: False,
-            get_labels_for_node=lambda _: [],
-            sync_issue_labels=lambda *_a, **_k: None,
-            gh_cli=lambda *_a, **_k: "",
-            build_close_comment=lambda *_a, **_k: "close",
-            _backfill_gh_issue=lambda *_a, **_k: None,
-            _was_closed_by_weave=lambda *_a: False,
-        ):
-            _handle_existing_issue(
-                node,
-                600,
-                issues_by_num,
-                nodes_by_id,
-                "owner/repo",
-                "https://github.com/owner/repo",
-                stats,
-                done_gh_issues=set(),
-                dry_run=True,
-            )
+        self._call(node, issue, stats, done_gh_issues=set(), dry_run=True)
 
         assert stats.reopened_gh == 1
         assert issue.state == "CLOSED"  # not mutated in dry-run
@@ -338,33 +298,22 @@ class TestReopenGuard:
 class TestBodyMarkerMatching:
     """Phase 1 body search should match both Weave ID marker formats."""
 
-    def _find_match(self, node_id: str, issue_body: str) -> int | None:
-        """Simulate the Phase 1 body marker search logic."""
-        marker_bold = f"**Weave ID:** `{node_id}`"
-        marker_plain = f"**Weave ID**: `{node_id}`"
-        if marker_bold in issue_body or marker_plain in issue_body:
-            return 1  # matched
-        return None
-
-    def test_bold_colon_format(self) -> None:
-        """Bold colon variant **Weave ID:** should match."""
-        body = "Some text\n**Weave ID:** `wv-1234`\nMore text"
-        assert self._find_match("wv-1234", body) == 1
-
-    def test_plain_colon_format(self) -> None:
-        """Plain colon variant **Weave ID**: should match."""
-        body = "Some text\n**Weave ID**: `wv-1234`\nMore text"
-        assert self._find_match("wv-1234", body) == 1
-
-    def test_no_match(self) -> None:
-        """Different node ID should not match."""
-        body = "Some text\n**Weave ID:** `wv-9999`\nMore text"
-        assert self._find_match("wv-1234", body) is None
-
-    def test_partial_id_no_match(self) -> None:
-        """wv-123 should NOT match wv-1234."""
-        body = "**Weave ID:** `wv-1234`"
-        assert self._find_match("wv-123", body) is None
+    @pytest.mark.parametrize(
+        ("node_id", "body", "expected"),
+        [
+            ("wv-1234", "Some text\n**Weave ID:** `wv-1234`\nMore text", 7),
+            ("wv-1234", "Some text\n**Weave ID**: `wv-1234`\nMore text", 7),
+            ("wv-1234", "Some text\n**Weave ID:** `wv-9999`\nMore text", None),
+            # wv-123 must not match wv-1234.
+            ("wv-123", "**Weave ID:** `wv-1234`", None),
+        ],
+        ids=["bold-colon", "plain-colon", "other-id", "partial-id"],
+    )
+    def test_find_gh_match_by_body(
+        self, node_id: str, body: str, expected: int | None
+    ) -> None:
+        issues = [_issue(3, body="unrelated"), _issue(7, body=body)]
+        assert _find_gh_match_by_body(node_id, issues) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -372,46 +321,79 @@ class TestBodyMarkerMatching:
 # ---------------------------------------------------------------------------
 
 
-class TestPhase2BodyMarkerDedup:
-    """Phase 2 should skip creating nodes when body contains known Weave IDs."""
+RunSync = Callable[[list[WeaveNode], GitHubIssue], SyncStats]
 
-    def _run(self, nodes: list[WeaveNode], issue: GitHubIssue) -> SyncStats:
+
+@pytest.fixture(scope="class")
+def run_sync() -> RunSync:
+    """Dry-run sync_github_to_weave on one issue and return fresh stats."""
+
+    def _run(nodes: list[WeaveNode], issue: GitHubIssue) -> SyncStats:
         stats = SyncStats()
         sync_github_to_weave(nodes, [issue], "repo", stats, dry_run=True)
         return stats
 
-    def test_skips_bold_colon_marker(self) -> None:
-        """Issue with bold-colon Weave ID marker should not create a node."""
-        nodes = [_node("wv-aaaa", gh_issue=10)]
-        issue = _issue(99, title="Untracked issue", state="OPEN",
-                       body="**Weave ID:** `wv-aaaa`")
-        assert self._run(nodes, issue).created_wv == 0
-
-    def test_skips_plain_colon_marker(self) -> None:
-        """Issue with plain-colon Weave ID marker should not create a node."""
-        nodes = [_node("wv-bbbb", gh_issue=20)]
-        issue = _issue(99, title="Untracked issue", state="OPEN",
-                       body="**Weave ID**: `wv-bbbb`")
-        assert self._run(nodes, issue).created_wv == 0
-
-    def test_creates_when_no_marker(self) -> None:
-        """Issue without any Weave ID marker should create a new node."""
-        nodes = [_node("wv-cccc", gh_issue=30)]
-        issue = _issue(99, title="Brand new issue", state="OPEN",
-                       body="No weave references here")
-        assert self._run(nodes, issue).created_wv == 1
-
-    def test_skips_tracked_by_gh_issue(self) -> None:
-        """Issues already tracked by metadata.gh_issue should be skipped."""
-        nodes = [_node("wv-dddd", gh_issue=99)]
-        issue = _issue(99, title="Already tracked", state="OPEN")
-        assert self._run(nodes, issue).created_wv == 0
-
-    def test_skips_closed_untracked(self) -> None:
-        """Closed GH issues with no Weave node should be skipped."""
-        stats = self._run([], _issue(99, title="Old closed", state="CLOSED"))
-        assert stats.created_wv == 0
-        assert stats.skipped == 1
+    return _run
+
+
+class TestPhase2BodyMarkerDedup:
+    """Phase 2 should skip creating nodes when body contains known Weave IDs."""
+
+    @pytest.mark.parametrize(
+        ("nodes", "issue", "created_wv", "skipped"),
+        [
+            (
+                [build_node("wv-aaaa", gh_issue=10)],
+                _issue(99, title="Untracked issue", body="**Weave ID:** `wv-aaaa`"),
+                0,
+                0,
+            ),
+            (
+                [build_node("wv-bbbb", gh_issue=20)],
+                _issue(99, title="Untracked issue", body="**Weave ID**: `wv-bbbb`"),
+                0,
+                0,
+            ),
+            (
+                [build_node("wv-cccc", gh_issue=30)],
+                _issue(99, title="Brand new issue", body="No weave references here"),
+                1,
+                0,
+            ),
+            (
+                [build_node("wv-eeee", gh_issue=40)],
+                _issue(99, title="Moved issue", body="**Weave ID:** `wv-eeeeee`"),
+                1,
+                0,
+            ),
+            (
+                [build_node("wv-dddd", gh_issue=99)],
+                _issue(99, title="Already tracked"),
+                0,
+                0,
+            ),
+            ([], _issue(99, title="Old closed", state="CLOSED"), 0, 1),
+        ],
+        ids=[
+            "bold-colon-marker",
+            "plain-colon-marker",
+            "no-marker-creates",
+            "unknown-node-marker-creates",
+            "tracked-by-gh-issue",
+            "closed-untracked",
+        ],
+    )
+    def test_dedup(
+        self,
+        run_sync: RunSync,
+        nodes: list[WeaveNode],
+        issue: GitHubIssue,
+        created_wv: int,
+        skipped: int,
+    ) -> None:
+        stats = run_sync(nodes, issue)
+        assert stats.created_wv == created_wv
+        assert stats.skipped == skipped
 
 
 # ---------------------------------------------------------------------------
@@ -428,15 +410,15 @@ class TestRefreshParentBody:
     ) -> Generator[None, None, None]:
         """Context manager: patch get_weave_nodes + get_repo plus any phases overrides."""
         patches: Any = phase_overrides
-        with patch.multiple("weave_gh.phases", **patches), patch(
+        with patch.multiple(phases, **patches), patch(
             "weave_gh.data.get_weave_nodes", return_value=nodes
-        ), patch("weave_gh.phases.get_repo", return_value="owner/repo"):
+        ), patch.object(phases, "get_repo", return_value="owner/repo"):
             yield
 
     def test_updates_parent_body_when_hash_changed(self) -> None:
         """Should update parent GH issue when child status changes content hash."""
-        parent = _node("wv-epic", text="Epic task", status="active", gh_issue=100)
-        child = _node("wv-task", text="Child task", status="done", gh_issue=200)
+        parent = build_node("wv-epic", text="Epic task", status="active", gh_issue=100)
+        child = build_node("wv-task", text="Child task", status="done", gh_issue=200)
         edge = Edge(source="wv-task", target="wv-epic", edge_type="implements")
 
         gh_edit_calls: list[tuple[object, ...]] = []
@@ -466,15 +448,15 @@ class TestRefreshParentBody:
 
     def test_no_parent_returns_false(self) -> None:
         """Should return False when child has no parent."""
-        with patch("weave_gh.phases.get_parent", return_value=None):
+        with patch.object(phases, "get_parent", return_value=None):
             assert refresh_parent_body("wv-orphan") is False
 
     def test_parent_without_gh_issue_returns_false(self) -> None:
         """Should return False when parent has no GH issue linked."""
-        parent = _node("wv-epic", text="Epic", status="active")  # no gh_issue
+        parent = build_node("wv-epic", text="Epic", status="active")  # no gh_issue
 
-        with patch(
-            "weave_gh.phases.get_parent", return_value="wv-epic"
+        with patch.object(
+            phases, "get_parent", return_value="wv-epic"
         ), patch(
             "weave_gh.data.get_weave_nodes",
             return_value=[parent],
@@ -483,7 +465,7 @@ class TestRefreshParentBody:
 
     def test_no_update_when_hash_unchanged(self) -> None:
         """Should return False when body hash hasn't changed."""
-        parent = _node("wv-epic", text="Epic", status="active", gh_issue=100)
+        parent = build_node("wv-epic", text="Epic", status="active", gh_issue=100)
 
         body = "<!-- WEAVE:BEGIN hash=aabb11223344 -->\nsame\n<!-- WEAVE:END -->"
 
@@ -498,8 +480,8 @@ class TestRefreshParentBody:
 
     def test_dry_run_does_not_edit(self) -> None:
         """Dry run should return True but not call gh issue edit."""
-        parent = _node("wv-epic", text="Epic", status="active", gh_issue=100)
-        child = _node("wv-task", text="Child", status="done", gh_issue=200)
+        parent = build_node("wv-epic", text="Epic", status="active", gh_issue=100)
+        child = build_node("wv-task", text="Child", status="done", gh_issue=200)
 
         gh_calls: list[tuple[object, ...]] = []
 
@@ -550,7 +532,7 @@ class TestSyncAssignee:
             calls.append(cmd)
             return self._ok_run(cmd)
 
-        with patch("weave_gh.phases._run", side_effect=_capture_ok):
+        with patch.object(phases, "_run", side_effect=_capture_ok):
             changed = _sync_assignee(1, "alice", ["alice"], "owner/repo")
         assert changed is False
         assert not calls
@@ -564,7 +546,7 @@ class TestSyncAssignee:
             calls.append(cmd)
             return self._ok_run(cmd)
 
-        with patch("weave_gh.phases._run", side_effect=_capture_ok):
+        with patch.object(phases, "_run", side_effect=_capture_ok):
             changed = _sync_assignee(1, "alice", [], "owner/repo")
         assert changed is True
         edit_call = next(c for c in calls if "edit" in c)
@@ -579,7 +561,7 @@ class TestSyncAssignee:
             calls.append(cmd)
             return self._fail_run(cmd)
 
-        with patch("weave_gh.phases._run", side_effect=_capture_fail):
+        with patch.object(phases, "_run", side_effect=_capture_fail):
             changed = _sync_assignee(1, "ghost", [], "owner/repo")
         assert changed is False
         assert "ghost" in _invalid_assignees
@@ -598,7 +580,7 @@ class TestSyncAssignee:
                 return self._ok_run(cmd)
             return self._fail_run(cmd)
 
-        with patch("weave_gh.phases._run", side_effect=_side_effect):
+        with patch.object(phases, "_run", side_effect=_side_effect):
             changed = _sync_assignee(1, "alice", [], "owner/repo")
         assert changed is False
 
@@ -610,14 +592,14 @@ class TestSyncAssignee:
             calls.append(cmd)
             return self._ok_run(cmd)
 
-        with patch("weave_gh.phases._run", side_effect=_capture_ok):
+        with patch.object(phases, "_run", side_effect=_capture_ok):
             changed = _sync_assignee(1, None, ["alice"], "owner/repo")
         assert changed is True
         assert any("--remove-assignee" in c for c in calls[0])
 
     def test_remove_assignee_fails(self) -> None:
         """Should return False when remove-assignee call fails."""
-        with patch("weave_gh.phases._run", side_effect=lambda cmd, **_k: self._fail_run(cmd)):
+        with patch.object(phases, "_run", side_effect=lambda cmd, **_k: self._fail_run(cmd)):
             changed = _sync_assignee(1, None, ["alice"], "owner/repo")
         assert changed is False
 
@@ -629,7 +611,7 @@ class TestSyncAssignee:
             calls.append(cmd)
             return self._ok_run(cmd)
 
-        with patch("weave_gh.phases._run", side_effect=_capture_ok):
+        with patch.object(phases, "_run", side_effect=_capture_ok):
             changed = _sync_assignee(1, "alice", [], "owner/repo", dry_run=True)
         assert changed is True
         assert not calls
@@ -642,7 +624,7 @@ class TestIsValidAssignee:
         """Returns True when gh api returns 0."""
         _invalid_assignees.discard("validuser")
         ok = subprocess.CompletedProcess([], returncode=0, stdout="", stderr="")
-        with patch("weave_gh.phases._run", return_value=ok):
+        with patch.object(phases, "_run", return_value=ok):
             assert _is_valid_assignee("validuser", "owner/repo") is True
         assert "validuser" not in _invalid_assignees
 
@@ -650,7 +632,7 @@ class TestIsValidAssignee:
         """Returns False when gh api returns non-zero, caches the login."""
         _invalid_assignees.discard("noone")
         fail = subprocess.CompletedProcess([], returncode=1, stdout="", stderr="Not Found")
-        with patch("weave_gh.phases._run", return_value=fail):
+        with patch.object(phases, "_run", return_value=fail):
             assert _is_valid_assignee("noone", "owner/repo") is False
         assert "noone" in _invalid_assignees
 
@@ -658,7 +640,7 @@ class TestIsValidAssignee:
         """Second call for a known-invalid user skips the API call."""
         _invalid_assignees.add("cached-bad")
         calls: list[object] = []
-        with patch("weave_gh.phases._run", side_effect=lambda *a, **k: calls.append(a)):
+        with patch.object(phases, "_run", side_effect=lambda *a, **k: calls.append(a)):
             result = _is_valid_assignee("cached-bad", "owner/repo")
         assert result is False
         assert not calls
@@ -672,12 +654,12 @@ class TestDesiredAssigneeForNode:
 
     def test_done_node_skips_assignee_sync(self) -> None:
         """Done nodes should not drive assignee changes."""
-        node = _node("wv-done", status="done", claimed_by="alice")
+        node = build_node("wv-done", status="done", claimed_by="alice")
         assert _desired_assignee_for_node(node) is None
 
     def test_non_local_claim_is_used_verbatim(self) -> None:
         """Explicit collaborator logins should pass through unchanged."""
-        node = _node("wv-active", status="active", claimed_by="alice")
+        node = build_node("wv-active", status="active", claimed_by="alice")
         assert _desired_assignee_for_node(node) == "alice"
 
     def test_local_default_claim_maps_to_authenticated_login(self) -> None:
@@ -686,8 +668,8 @@ class TestDesiredAssigneeForNode:
         ok = subprocess.CompletedProcess([], returncode=0, stdout="octocat\n", stderr="")
         with patch("weave_gh.phases.socket.gethostname", return_value="host"), patch(
             "weave_gh.phases.getpass.getuser", return_value="user"
-        ), patch("weave_gh.phases._run", return_value=ok):
-            node = _node("wv-local", status="active", claimed_by="host-user")
+        ), patch.object(phases, "_run", return_value=ok):
+            node = build_node("wv-local", status="active", claimed_by="host-user")
             assert _desired_assignee_for_node(node) == "octocat"
 
     def test_harness_prefixed_local_claim_maps_to_authenticated_login(self) -> None:
@@ -703,10 +685,10 @@ class TestDesiredAssigneeForNode:
         ok = subprocess.CompletedProcess([], returncode=0, stdout="octocat\n", stderr="")
         with patch("weave_gh.phases.socket.gethostname", return_value="debian"), patch(
             "weave_gh.phases.getpass.getuser", return_value="alistair"
-        ), patch("weave_gh.phases._run", return_value=ok):
+        ), patch.object(phases, "_run", return_value=ok):
             for harness in ("claude", "codex", "copilot", "human"):
                 _current_gh_login.cache_clear()
-                node = _node(
+                node = build_node(
                     "wv-local-harness",
                     status="active",
                     claimed_by=f"{harness}-debian-alistair",
@@ -744,7 +726,7 @@ class TestPhase2ClaimedBy:
                     created_meta.append(json.loads(arg[len("--metadata="):]))
             return "wv-test"
 
-        with patch("weave_gh.phases.wv_cli", side_effect=mock_wv_cli):
+        with patch.object(phases, "wv_cli", side_effect=mock_wv_cli):
             sync_github_to_weave(nodes, [issue], "owner/repo", stats)
 
         assert stats.created_wv == 1
@@ -767,7 +749,7 @@ class TestPhase2ClaimedBy:
                     created_meta.append(json.loads(arg[len("--metadata="):]))
             return "wv-test"
 
-        with patch("weave_gh.phases.wv_cli", side_effect=mock_wv_cli):
+        with patch.object(phases, "wv_cli", side_effect=mock_wv_cli):
             sync_github_to_weave(nodes, [issue], "owner/repo", stats)
 
         assert stats.created_wv == 1
@@ -791,7 +773,7 @@ class TestHandleNewIssueBlockedStatus:
     ) -> None:
         gh_calls: list[str] = created_gh_issues if created_gh_issues is not None else []
         with patch.multiple(
-            "weave_gh.phases",
+            phases,
             get_edges_for_node=lambda _: [],
             render_issue_body=lambda *_a, **_k: "",
             get_labels_for_node=lambda _: [],
@@ -816,7 +798,7 @@ class TestHandleNewIssueBlockedStatus:
 
     def test_blocked_node_creates_gh_issue(self) -> None:
         """A blocked node with no GH issue should have one created (regression #1392)."""
-        node = _node("wv-blck", status="blocked")
+        node = build_node("wv-blck", status="blocked")
         stats = SyncStats()
         calls: list[str] = []
 
@@ -827,7 +809,7 @@ class TestHandleNewIssueBlockedStatus:
 
     def test_todo_node_creates_gh_issue(self) -> None:
         """todo nodes should continue to create GH issues."""
-        node = _node("wv-todo", status="todo")
+        node = build_node("wv-todo", status="todo")
         stats = SyncStats()
 
         self._call(node, stats)
@@ -837,7 +819,7 @@ class TestHandleNewIssueBlockedStatus:
 
     def test_unknown_status_still_skipped(self) -> None:
         """Unknown status values should still be skipped."""
-        node = _node("wv-unkn", status="archived")
+        node = build_node("wv-unkn", status="archived")
         stats = SyncStats()
 
         self._call(node, stats)
@@ -856,26 +838,26 @@ class TestBackfillGhIssue:
 
     def test_dry_run_is_noop(self) -> None:
         """In dry-run mode the function returns immediately without any side effects."""
-        node = _node("wv-aaa1", gh_issue=None)
-        with patch("weave_gh.phases._run") as mock_run:
+        node = build_node("wv-aaa1", gh_issue=None)
+        with patch.object(phases, "_run") as mock_run:
             _backfill_gh_issue(node, 42, dry_run=True)
         mock_run.assert_not_called()
         assert node.metadata.get("gh_issue") is None
 
     def test_dedup_guard_skips_when_already_claimed(self) -> None:
         """Skips backfill when another node already claims the same gh_issue."""
-        node = _node("wv-new1")
-        other = _node("wv-old1", gh_issue=99)
-        with patch("weave_gh.phases._run") as mock_run:
+        node = build_node("wv-new1")
+        other = build_node("wv-old1", gh_issue=99)
+        with patch.object(phases, "_run") as mock_run:
             _backfill_gh_issue(node, 99, all_nodes=[node, other])
         mock_run.assert_not_called()
         assert node.metadata.get("gh_issue") is None
 
     def test_done_only_duplicate_is_silent(self) -> None:
         """Historical done-only duplicates should skip backfill without warning."""
-        node = _node("wv-newdone", status="done")
-        other = _node("wv-olddone", status="done", gh_issue=99)
-        with patch("weave_gh.phases._run") as mock_run, patch(
+        node = build_node("wv-newdone", status="done")
+        other = build_node("wv-olddone", status="done", gh_issue=99)
+        with patch.object(phases, "_run") as mock_run, patch(
             "weave_gh.phases.log.warning"
         ) as warn:
             _backfill_gh_issue(node, 99, all_nodes=[node, other])
@@ -885,18 +867,18 @@ class TestBackfillGhIssue:
 
     def test_backfill_updates_in_memory(self) -> None:
         """Successful backfill updates node.metadata['gh_issue'] in-memory."""
-        node = _node("wv-new2")
-        with patch("weave_gh.phases._run"), patch(
-            "weave_gh.phases._resolve_db_path", return_value="/tmp/test.db"
+        node = build_node("wv-new2")
+        with patch.object(phases, "_run"), patch.object(
+            phases, "_resolve_db_path", return_value="/tmp/test.db"
         ):
             _backfill_gh_issue(node, 77, all_nodes=[node])
         assert node.metadata["gh_issue"] == 77
 
     def test_backfill_no_all_nodes(self) -> None:
         """When all_nodes is None, dedup guard is skipped and backfill proceeds."""
-        node = _node("wv-new3")
-        with patch("weave_gh.phases._run"), patch(
-            "weave_gh.phases._resolve_db_path", return_value="/tmp/test.db"
+        node = build_node("wv-new3")
+        with patch.object(phases, "_run"), patch.object(
+            phases, "_resolve_db_path", return_value="/tmp/test.db"
         ):
             _backfill_gh_issue(node, 55, all_nodes=None)
         assert node.metadata["gh_issue"] == 55
@@ -925,12 +907,12 @@ class TestSyncWeaveToGithub:
             "compose_issue_body": lambda h, w: w,
         }
         base.update(overrides)
-        return patch.multiple("weave_gh.phases", **base)
+        return patch.multiple(phases, **base)
 
     def test_duplicate_gh_issue_dedup_logs_skip(self) -> None:
         """When two nodes share a gh_issue, the second is skipped."""
-        n1 = _node("wv-dup1", gh_issue=10)
-        n2 = _node("wv-dup2", gh_issue=10)
+        n1 = build_node("wv-dup1", gh_issue=10)
+        n2 = build_node("wv-dup2", gh_issue=10)
         issue = _issue(10, state="OPEN")
         stats = SyncStats()
 
@@ -950,8 +932,8 @@ class TestSyncWeaveToGithub:
 
     def test_done_only_duplicate_gh_issue_is_silent(self) -> None:
         """Historical done-only duplicates should still dedup processing without warning."""
-        n1 = _node("wv-done1", status="done", gh_issue=10)
-        n2 = _node("wv-done2", status="done", gh_issue=10)
+        n1 = build_node("wv-done1", status="done", gh_issue=10)
+        n2 = build_node("wv-done2", status="done", gh_issue=10)
         issue = _issue(10, state="CLOSED")
         stats = SyncStats()
 
@@ -971,7 +953,7 @@ class TestSyncWeaveToGithub:
 
     def test_no_gh_match_routes_to_handle_new(self) -> None:
         """Nodes without a GH issue are routed to _handle_new_issue (dry-run)."""
-        node = _node("wv-newo", status="todo")
+        node = build_node("wv-newo", status="todo")
         stats = SyncStats()
 
         with self._patches():
@@ -1028,7 +1010,7 @@ class TestSyncWeaveToGithub:
 
     def test_gh_match_via_body_marker_routes_to_handle_existing(self) -> None:
         """Nodes matched via body marker are routed to _handle_existing_issue."""
-        node = _node("wv-mark", status="active")
+        node = build_node("wv-mark", status="active")
         issue = _issue(55, body=f"**Weave ID:** `{node.id}`")
         stats = SyncStats()
 
@@ -1068,7 +1050,7 @@ class TestHandleNewIssuePaths:
             "gh_cli": lambda *_a, **_k: "",
         }
         defaults.update(gh_override)
-        with patch.multiple("weave_gh.phases", **defaults):
+        with patch.multiple(phases, **defaults):
             _handle_new_issue(
                 node,
                 nodes_by_id={},
@@ -1083,7 +1065,7 @@ class TestHandleNewIssuePaths:
 
     def test_dry_run_increments_count_without_gh_call(self) -> None:
         """Dry-run logs intent and increments created_gh without calling gh_cli."""
-        node = _node("wv-dryy", status="todo")
+        node = build_node("wv-dryy", status="todo")
         stats = SyncStats()
         gh_calls: list[object] = []
         self._call(
@@ -1095,13 +1077,13 @@ class TestHandleNewIssuePaths:
 
     def test_weave_synced_title_match_backfills_and_returns(self) -> None:
         """If title matches a weave-synced issue, backfills gh_issue and skips creation."""
-        node = _node("wv-titl", text="Existing task", status="todo")
+        node = build_node("wv-titl", text="Existing task", status="todo")
         existing = _issue(77, title="Existing task", labels=["weave-synced"])
         stats = SyncStats()
         backfill_calls: list[object] = []
 
         with patch.multiple(
-            "weave_gh.phases",
+            phases,
             get_edges_for_node=lambda _: [],
             render_issue_body=lambda *_a, **_k: "",
             get_labels_for_node=lambda _: [],
@@ -1127,7 +1109,7 @@ class TestHandleNewIssuePaths:
 
     def test_done_title_match_closes_existing_issue(self) -> None:
         """Done nodes that title-match an open synced issue must close it."""
-        node = _node("wv-done-title", text="Existing task", status="done")
+        node = build_node("wv-done-title", text="Existing task", status="done")
         existing = _issue(77, title="Existing task", state="OPEN", labels=["weave-synced"])
         stats = SyncStats()
         backfill_calls: list[object] = []
@@ -1138,7 +1120,7 @@ class TestHandleNewIssuePaths:
             return ""
 
         with patch.multiple(
-            "weave_gh.phases",
+            phases,
             get_edges_for_node=lambda _: [],
             render_issue_body=lambda *_a, **_k: "",
             get_labels_for_node=lambda _: [],
@@ -1168,14 +1150,14 @@ class TestHandleNewIssuePaths:
 
     def test_done_only_title_match_duplicate_skips_silently(self) -> None:
         """Historical done-only title duplicates should not emit title-match/backfill chatter."""
-        node = _node("wv-titl2", text="Existing task", status="done")
-        claimant = _node("wv-claim", text="Existing task", status="done", gh_issue=77)
+        node = build_node("wv-titl2", text="Existing task", status="done")
+        claimant = build_node("wv-claim", text="Existing task", status="done", gh_issue=77)
         existing = _issue(77, title="Existing task", labels=["weave-synced"])
         stats = SyncStats()
         backfill_calls: list[object] = []
 
         with patch.multiple(
-            "weave_gh.phases",
+            phases,
             get_edges_for_node=lambda _: [],
             render_issue_body=lambda *_a, **_k: "",
             get_labels_for_node=lambda _: [],
@@ -1213,7 +1195,7 @@ class TestHandleNewIssuePaths:
         stats = SyncStats()
 
         with patch.multiple(
-            "weave_gh.phases",
+            phases,
             get_edges_for_node=lambda _: [],
             render_issue_body=lambda *_a, **_k: "",
             get_labels_for_node=lambda _: ["bug", "enhancement"],
@@ -1245,12 +1227,12 @@ class TestHandleNewIssuePaths:
 
     def test_done_node_closes_issue_after_create(self) -> None:
         """If node is done, the newly created issue is immediately closed."""
-        node = _node("wv-done", status="done")
+        node = build_node("wv-done", status="done")
         gh_calls: list[tuple[object, ...]] = []
         stats = SyncStats()
 
         with patch.multiple(
-            "weave_gh.phases",
+            phases,
             get_edges_for_node=lambda _: [],
             render_issue_body=lambda *_a, **_k: "",
             get_labels_for_node=lambda _: [],
@@ -1309,7 +1291,7 @@ class TestHandleExistingIssuePaths:
             "compose_issue_body": lambda h, w: w,
         }
         base.update(overrides)
-        with patch.multiple("weave_gh.phases", **base):
+        with patch.multiple(phases, **base):
             _handle_existing_issue(
                 node,
                 issue.number,
@@ -1397,7 +1379,7 @@ class TestHandleExistingIssuePaths:
 
     def test_dry_run_close_increments_count(self) -> None:
         """Dry-run close increments closed_gh without calling gh_cli."""
-        node = _node("wv-dryc", status="done", gh_issue=20)
+        node = build_node("wv-dryc", status="done", gh_issue=20)
         issue = _issue(20, state="OPEN")
         stats = SyncStats()
         gh_calls: list[object] = []
@@ -1447,7 +1429,7 @@ class TestHandleExistingIssuePaths:
 
     def test_dry_run_body_update_increments_stats(self) -> None:
         """Dry-run body update increments updated_gh without gh_cli call."""
-        node = _node("wv-bdyu", status="active", gh_issue=40)
+        node = build_node("wv-bdyu", status="active", gh_issue=40)
         issue = _issue(40, state="OPEN", body="<!-- WEAVE:BEGIN hash=old -->\nold\n<!-- WEAVE:END -->")
         stats = SyncStats()
         gh_calls: list[object] = []
@@ -1501,7 +1483,7 @@ class TestSyncGithubToWeavePaths:
                     created_meta.append(json.loads(arg[len("--metadata="):]))
             return "wv-new"
 
-        with patch("weave_gh.phases.wv_cli", side_effect=mock_wv):
+        with patch.object(phases, "wv_cli", side_effect=mock_wv):
             sync_github_to_weave([], [issue], "owner/repo", stats)
 
         assert stats.created_wv == 1
@@ -1517,8 +1499,8 @@ class TestSyncGithubToWeavePaths:
         )
         stats = SyncStats()
 
-        with patch(
-            "weave_gh.phases.wv_cli",
+        with patch.object(
+            phases, "wv_cli",
             side_effect=subprocess.CalledProcessError(1, "wv", stderr="err"),
         ):
             sync_github_to_weave([], [issue], "owner/repo", stats)
@@ -1536,11 +1518,11 @@ class TestSyncClosedToWeave:
 
     def test_closes_open_weave_node_for_closed_gh_issue(self) -> None:
         """Node with non-done status and closed GH issue gets closed."""
-        node = _node("wv-todc", status="active", gh_issue=50)
+        node = build_node("wv-todc", status="active", gh_issue=50)
         issue = _issue(50, state="CLOSED")
         stats = SyncStats()
 
-        with patch("weave_gh.phases.wv_cli") as mock_wv:
+        with patch.object(phases, "wv_cli") as mock_wv:
             mock_wv.return_value = ""
             sync_closed_to_weave([node], [issue], stats)
 
@@ -1553,11 +1535,11 @@ class TestSyncClosedToWeave:
 
     def test_dry_run_increments_without_wv_call(self) -> None:
         """Dry-run increments closed_wv but does not call wv_cli."""
-        node = _node("wv-dcdr", status="todo", gh_issue=51)
+        node = build_node("wv-dcdr", status="todo", gh_issue=51)
         issue = _issue(51, state="CLOSED")
         stats = SyncStats()
 
-        with patch("weave_gh.phases.wv_cli") as mock_wv:
+        with patch.object(phases, "wv_cli") as mock_wv:
             sync_closed_to_weave([node], [issue], stats, dry_run=True)
 
         assert stats.closed_wv == 1
@@ -1565,11 +1547,11 @@ class TestSyncClosedToWeave:
 
     def test_already_done_node_not_closed_again(self) -> None:
         """Nodes already done are not closed again."""
-        node = _node("wv-alrd", status="done", gh_issue=52)
+        node = build_node("wv-alrd", status="done", gh_issue=52)
         issue = _issue(52, state="CLOSED")
         stats = SyncStats()
 
-        with patch("weave_gh.phases.wv_cli") as mock_wv:
+        with patch.object(phases, "wv_cli") as mock_wv:
             sync_closed_to_weave([node], [issue], stats)
 
         assert stats.closed_wv == 0
@@ -1577,11 +1559,11 @@ class TestSyncClosedToWeave:
 
     def test_open_gh_issue_not_closed(self) -> None:
         """Nodes linked to open GH issues are not closed."""
-        node = _node("wv-open", status="active", gh_issue=53)
+        node = build_node("wv-open", status="active", gh_issue=53)
         issue = _issue(53, state="OPEN")
         stats = SyncStats()
 
-        with patch("weave_gh.phases.wv_cli") as mock_wv:
+        with patch.object(phases, "wv_cli") as mock_wv:
             sync_closed_to_weave([node], [issue], stats)
 
         assert stats.closed_wv == 0
@@ -1598,11 +1580,11 @@ class TestRefreshParentBodyErrorPaths:
 
     def test_get_repo_exception_returns_false(self) -> None:
         """Returns False when get_repo raises CalledProcessError."""
-        parent = _node("wv-repoerr", text="Epic", status="active", gh_issue=100)
-        with patch("weave_gh.phases.get_parent", return_value="wv-repoerr"), patch(
+        parent = build_node("wv-repoerr", text="Epic", status="active", gh_issue=100)
+        with patch.object(phases, "get_parent", return_value="wv-repoerr"), patch(
             "weave_gh.data.get_weave_nodes", return_value=[parent]
-        ), patch(
-            "weave_gh.phases.get_repo",
+        ), patch.object(
+            phases, "get_repo",
             side_effect=subprocess.CalledProcessError(1, "gh"),
         ):
             result = refresh_parent_body("wv-child")
@@ -1610,13 +1592,13 @@ class TestRefreshParentBodyErrorPaths:
 
     def test_empty_raw_body_returns_false(self) -> None:
         """Returns False when gh issue view returns empty body."""
-        parent = _node("wv-emptbod", text="Epic", status="active", gh_issue=200)
-        with patch("weave_gh.phases.get_parent", return_value="wv-emptbod"), patch(
+        parent = build_node("wv-emptbod", text="Epic", status="active", gh_issue=200)
+        with patch.object(phases, "get_parent", return_value="wv-emptbod"), patch(
             "weave_gh.data.get_weave_nodes", return_value=[parent]
-        ), patch(
-            "weave_gh.phases.get_repo", return_value="owner/repo"
-        ), patch(
-            "weave_gh.phases.gh_cli", return_value=""
+        ), patch.object(
+            phases, "get_repo", return_value="owner/repo"
+        ), patch.object(
+            phases, "gh_cli", return_value=""
         ):
             result = refresh_parent_body("wv-child")
         assert result is False
@@ -1631,20 +1613,20 @@ class TestSelectCandidates:
     """select_candidates determines which nodes Phase 1 traverses per mode."""
 
     def test_full_mode_returns_all_nodes(self) -> None:
-        nodes = [_node("wv-a"), _node("wv-b"), _node("wv-c")]
+        nodes = [build_node("wv-a"), build_node("wv-b"), build_node("wv-c")]
         result = select_candidates(nodes, mode=Mode.FULL)
         assert [n.id for n in result] == ["wv-a", "wv-b", "wv-c"]
 
     def test_repair_mode_returns_all_nodes(self) -> None:
-        nodes = [_node("wv-a"), _node("wv-b")]
+        nodes = [build_node("wv-a"), build_node("wv-b")]
         result = select_candidates(nodes, mode=Mode.REPAIR)
         assert [n.id for n in result] == ["wv-a", "wv-b"]
 
     def test_fast_mode_with_focus_returns_impacted_subset(self) -> None:
-        focus = _node("wv-focus")
-        parent = _node("wv-parent")
-        sibling = _node("wv-sibling")
-        unrelated = _node("wv-other")
+        focus = build_node("wv-focus")
+        parent = build_node("wv-parent")
+        sibling = build_node("wv-sibling")
+        unrelated = build_node("wv-other")
         nodes = [focus, parent, sibling, unrelated]
         edges = [
             Edge(source="wv-focus", target="wv-parent",
@@ -1662,9 +1644,9 @@ class TestSelectCandidates:
         assert "wv-other" not in ids
 
     def test_fast_mode_without_focus_uses_active_nodes(self) -> None:
-        active1 = _node("wv-act1", status="active")
-        active2 = _node("wv-act2", status="active")
-        todo = _node("wv-todo", status="todo")
+        active1 = build_node("wv-act1", status="active")
+        active2 = build_node("wv-act2", status="active")
+        todo = build_node("wv-todo", status="todo")
         nodes = [active1, active2, todo]
         with patch("weave_gh.data.get_edges_for_node", return_value=[]):
             result = select_candidates(nodes, mode=Mode.FAST, focus_node_id=None)
@@ -1674,7 +1656,7 @@ class TestSelectCandidates:
         assert "wv-todo" not in ids
 
     def test_fast_mode_no_focus_no_active_returns_empty(self) -> None:
-        nodes = [_node("wv-a", status="todo"), _node("wv-b", status="todo")]
+        nodes = [build_node("wv-a", status="todo"), build_node("wv-b", status="todo")]
         with patch("weave_gh.data.get_edges_for_node", return_value=[]):
             result = select_candidates(nodes, mode=Mode.FAST, focus_node_id=None)
         assert result == []
@@ -1689,14 +1671,14 @@ class TestFastVsFullTraversal:
     """FAST and FULL traversal share the same loop body; verify parity."""
 
     def test_fast_mode_records_candidate_count(self) -> None:
-        focus = _node("wv-focus", status="active")
-        other = _node("wv-other", status="todo")
+        focus = build_node("wv-focus", status="active")
+        other = build_node("wv-other", status="todo")
         nodes = [focus, other]
         stats = SyncStats()
-        with patch("weave_gh.data.get_edges_for_node", return_value=[]), patch(
-            "weave_gh.phases._handle_new_issue", return_value=None
-        ), patch(
-            "weave_gh.phases._handle_existing_issue", return_value=None
+        with patch("weave_gh.data.get_edges_for_node", return_value=[]), patch.object(
+            phases, "_handle_new_issue", return_value=None
+        ), patch.object(
+            phases, "_handle_existing_issue", return_value=None
         ):
             sync_weave_to_github(
                 nodes, [], "owner/repo", "https://github.com/owner/repo",
@@ -1708,10 +1690,10 @@ class TestFastVsFullTraversal:
         assert stats.processed == 1
 
     def test_full_mode_processes_all_nodes(self) -> None:
-        nodes = [_node("wv-a"), _node("wv-b"), _node("wv-c")]
+        nodes = [build_node("wv-a"), build_node("wv-b"), build_node("wv-c")]
         stats = SyncStats()
-        with patch("weave_gh.phases._handle_new_issue", return_value=None), patch(
-            "weave_gh.phases._handle_existing_issue", return_value=None
+        with patch.object(phases, "_handle_new_issue", return_value=None), patch.object(
+            phases, "_handle_existing_issue", return_value=None
         ):
             sync_weave_to_github(
                 nodes, [], "owner/repo", "https://github.com/owner/repo",
@@ -1747,11 +1729,11 @@ class TestPhaseCDigestCache:
             "compose_issue_body": lambda h, w: w,
         }
         base.update(overrides)
-        return patch.multiple("weave_gh.phases", **base)
+        return patch.multiple(phases, **base)
 
     def test_cache_hit_skips_body_render(self) -> None:
         """When cache contains a matching digest, render_issue_body must not run."""
-        node = _node("wv-c1", status="todo", gh_issue=42)
+        node = build_node("wv-c1", status="todo", gh_issue=42)
         issue = _issue(42, state="OPEN", body="old")
         stats = SyncStats()
 
@@ -1789,7 +1771,7 @@ class TestPhaseCDigestCache:
 
     def test_cache_miss_renders_and_updates_cache(self) -> None:
         """On miss, body is rendered and cache is populated with new digest."""
-        node = _node("wv-c2", status="todo", gh_issue=43)
+        node = build_node("wv-c2", status="todo", gh_issue=43)
         issue = _issue(43, state="OPEN", body="old")
         stats = SyncStats()
         cache: dict[str, Any] = {"schema": 1, "entries": {}}
@@ -1809,7 +1791,7 @@ class TestPhaseCDigestCache:
 
     def test_dry_run_does_not_update_cache(self) -> None:
         """In dry-run, cache should remain untouched even after render."""
-        node = _node("wv-c3", status="todo", gh_issue=44)
+        node = build_node("wv-c3", status="todo", gh_issue=44)
         issue = _issue(44, state="OPEN", body="old")
         stats = SyncStats()
         cache: dict[str, Any] = {"schema": 1, "entries": {}}
@@ -1825,7 +1807,7 @@ class TestPhaseCDigestCache:
 
     def test_no_cache_passed_preserves_legacy_behaviour(self) -> None:
         """cache=None keeps the pre-Phase-C path (always render, no digest_skipped)."""
-        node = _node("wv-c4", status="todo", gh_issue=45)
+        node = build_node("wv-c4", status="todo", gh_issue=45)
         issue = _issue(45, state="OPEN", body="old")
         stats = SyncStats()
 
@@ -1866,12 +1848,12 @@ class TestPhaseDRepairCheckpoint:
             "save_checkpoint": lambda *_a, **_k: None,  # avoid touching disk in tests
         }
         base.update(overrides)
-        return patch.multiple("weave_gh.phases", **base)
+        return patch.multiple(phases, **base)
 
     def test_processed_nodes_in_checkpoint_are_skipped(self) -> None:
         """A node id already in checkpoint['processed'] is skipped and counted as resumed."""
-        n1 = _node("wv-d001", status="todo", gh_issue=10)
-        n2 = _node("wv-d002", status="todo", gh_issue=11)
+        n1 = build_node("wv-d001", status="todo", gh_issue=10)
+        n2 = build_node("wv-d002", status="todo", gh_issue=11)
         i1 = _issue(10, state="OPEN")
         i2 = _issue(11, state="OPEN")
         stats = SyncStats()
@@ -1898,7 +1880,7 @@ class TestPhaseDRepairCheckpoint:
 
     def test_no_checkpoint_preserves_legacy_behaviour(self) -> None:
         """checkpoint=None keeps stats.resumed_from at 0."""
-        node = _node("wv-d003", status="todo", gh_issue=12)
+        node = build_node("wv-d003", status="todo", gh_issue=12)
         issue = _issue(12, state="OPEN")
         stats = SyncStats()
 
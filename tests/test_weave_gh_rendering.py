@@ -6,13 +6,15 @@ from __future__ import annotations
 
 import re
 import subprocess
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import patch
 
+import pytest
 
+from weave_gh import rendering
 from weave_gh.models import Edge, WeaveNode
 from weave_gh.rendering import (
-    MERMAID_NODE_THRESHOLD,
     _mermaid_id,
     _mermaid_label,
     build_close_comment,
@@ -27,6 +29,8 @@ from weave_gh.rendering import (
 # Helpers
 # ---------------------------------------------------------------------------
 
+_HASH_RE = re.compile(r"hash=([a-f0-9]+)")
+
 
 def _node(
     node_id: str = "abc123",
@@ -38,24 +42,46 @@ def _node(
     return WeaveNode(id=node_id, text=text, status=status, metadata=dict(meta), alias=alias)
 
 
+@pytest.fixture(scope="module")
+def graph() -> SimpleNamespace:
+    """Small parent/child graphs shared by rendering tests; read-only."""
+    epic = _node(node_id="p1", text="Epic", type="epic")
+    task_parent = _node(node_id="t1", text="Task parent")
+    task_child = _node(node_id="c1", text="Task child", status="todo")
+    return SimpleNamespace(
+        epic=epic,
+        epic_nodes={
+            "p1": epic,
+            "c1": _node(node_id="c1", text="Task 1", status="todo"),
+            "c2": _node(node_id="c2", text="Task 2", status="done"),
+        },
+        task_parent=task_parent,
+        task_parent_nodes={"t1": task_parent, "c1": task_child},
+    )
+
+
 # ---------------------------------------------------------------------------
 # content_hash
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def hello_hash() -> str:
+    return content_hash("hello")
+
+
 class TestContentHash:
-    def test_deterministic(self) -> None:
-        assert content_hash("hello") == content_hash("hello")
+    def test_deterministic(self, hello_hash: str) -> None:
+        assert content_hash("hello") == hello_hash
 
     def test_different_inputs(self) -> None:
         assert content_hash("a") != content_hash("b")
 
-    def test_length(self) -> None:
-        assert len(content_hash("any string")) == 12
+    def test_length(self, hello_hash: str) -> None:
+        assert len(hello_hash) == 12
 
-    def test_hex_chars(self) -> None:
-        h = content_hash("test")
-        assert all(c in "0123456789abcdef" for c in h)
+    def test_hex_chars(self, hello_hash: str) -> None:
+        assert set(hello_hash) <= set("0123456789abcdef")
 
 
 # ---------------------------------------------------------------------------
@@ -98,19 +124,18 @@ class TestMermaidLabel:
 # render_mermaid_graph
 # ---------------------------------------------------------------------------
 
+# Threshold tests patch MERMAID_NODE_THRESHOLD down to this; the branches
+# only care about "more than threshold", not the production value.
+_SMALL_THRESHOLD = 3
+
 
 class TestRenderMermaidGraph:
     def test_empty_children(self) -> None:
         parent = _node(node_id="p1", text="Epic")
         assert render_mermaid_graph(parent, [], {}, []) == ""
 
-    def test_basic_graph(self) -> None:
-        parent = _node(node_id="p1", text="Epic", type="epic")
-        c1 = _node(node_id="c1", text="Task 1", status="todo")
-        c2 = _node(node_id="c2", text="Task 2", status="done")
-        nodes = {"p1": parent, "c1": c1, "c2": c2}
-
-        result = render_mermaid_graph(parent, ["c1", "c2"], nodes, [])
+    def test_basic_graph(self, graph: SimpleNamespace) -> None:
+        result = render_mermaid_graph(graph.epic, ["c1", "c2"], graph.epic_nodes, [])
         assert "graph TD" in result
         assert "p1" in result
         assert "c1" in result
@@ -118,14 +143,10 @@ class TestRenderMermaidGraph:
         assert ":::done" in result
         assert ":::todo" in result
 
-    def test_blocking_edges(self) -> None:
-        parent = _node(node_id="p1", text="Epic", type="epic")
-        c1 = _node(node_id="c1", text="Task 1")
-        c2 = _node(node_id="c2", text="Task 2")
-        nodes = {"p1": parent, "c1": c1, "c2": c2}
+    def test_blocking_edges(self, graph: SimpleNamespace) -> None:
         edges = [Edge(source="c1", target="c2", edge_type="blocks")]
 
-        result = render_mermaid_graph(parent, ["c1", "c2"], nodes, edges)
+        result = render_mermaid_graph(graph.epic, ["c1", "c2"], graph.epic_nodes, edges)
         assert "blocks" in result
         assert "c1" in result.split("blocks", maxsplit=1)[0]  # c1 on left of blocks
 
@@ -137,14 +158,15 @@ class TestRenderMermaidGraph:
         result = render_mermaid_graph(parent, ["c1"], nodes, [])
         assert ":::active" in result
 
-    def test_threshold_filtering(self) -> None:
+    def test_threshold_filtering(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """When > threshold children, only non-done are shown."""
+        monkeypatch.setattr(rendering, "MERMAID_NODE_THRESHOLD", _SMALL_THRESHOLD)
         parent = _node(node_id="p1", text="Big Epic")
         nodes = {"p1": parent}
         child_ids = []
 
-        # Create threshold + 5 children, all done except 2
-        for i in range(MERMAID_NODE_THRESHOLD + 5):
+        # Create threshold + 2 children, all done except 2
+        for i in range(_SMALL_THRESHOLD + 2):
             cid = f"c{i}"
             status = "todo" if i < 2 else "done"
             nodes[cid] = _node(node_id=cid, text=f"Task {i}", status=status)
@@ -155,14 +177,15 @@ class TestRenderMermaidGraph:
         assert "c0" in result
         assert "c1" in result
         # Done children should be filtered out
-        assert "c5" not in result
+        assert "c4" not in result
 
-    def test_all_done_keeps_full_graph(self) -> None:
+    def test_all_done_keeps_full_graph(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """When > threshold and all done, keep full graph (not a summary stub)."""
+        monkeypatch.setattr(rendering, "MERMAID_NODE_THRESHOLD", _SMALL_THRESHOLD)
         parent = _node(node_id="p1", text="Done Epic")
         nodes = {"p1": parent}
         child_ids = []
-        for i in range(MERMAID_NODE_THRESHOLD + 1):
+        for i in range(_SMALL_THRESHOLD + 1):
             cid = f"c{i}"
             nodes[cid] = _node(node_id=cid, text=f"Task {i}", status="done")
             child_ids.append(cid)
@@ -171,8 +194,7 @@ class TestRenderMermaidGraph:
         assert ":::done" in result
         assert "classDef done" in result
         # All children should be present in the full graph
-        for i in range(MERMAID_NODE_THRESHOLD + 1):
-            assert f"c{i}" in result
+        assert set(re.findall(r"\bc\d+\b", result)) >= set(child_ids)
 
     def test_unresolved_children_skipped(self) -> None:
         parent = _node(node_id="p1", text="Epic")
@@ -184,7 +206,7 @@ class TestRenderMermaidGraph:
     def test_alias_in_labels(self) -> None:
         parent = _node(node_id="p1", text="Epic with long name", alias="my-epic")
         c1 = _node(
-            id="c1", text="Very long child task name", status="todo", alias="child-1"
+            node_id="c1", text="Very long child task name", status="todo", alias="child-1"
         )
         c2 = _node(node_id="c2", text="Another child task", status="done")
         nodes = {"p1": parent, "c1": c1, "c2": c2}
@@ -237,12 +259,16 @@ class TestRenderMermaidFromTree:
 
 
 class TestRenderIssueBody:
-    @patch("weave_gh.rendering.get_children", return_value=[])
-    @patch("weave_gh.rendering.get_blockers", return_value=[])
-    @patch("weave_gh.rendering.get_parent", return_value=None)
-    def test_basic_body(
-        self, _mock_parent: Any, _mock_blockers: Any, _mock_children: Any
-    ) -> None:
+    @pytest.fixture(autouse=True)
+    def graph_links(self, monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+        """Stub the data.py edge lookups; tests set children/blockers/parent."""
+        links = SimpleNamespace(children=[], blockers=[], parent=None)
+        monkeypatch.setattr(rendering, "get_children", lambda *_a: links.children)
+        monkeypatch.setattr(rendering, "get_blockers", lambda *_a: links.blockers)
+        monkeypatch.setattr(rendering, "get_parent", lambda *_a: links.parent)
+        return links
+
+    def test_basic_body(self) -> None:
         node = _node(node_id="abc123", text="Test task", type="task", priority=2)
         nodes = {"abc123": node}
         edges: list[Edge] = []
@@ -254,32 +280,18 @@ class TestRenderIssueBody:
         assert "Task" in body
         assert "P2" in body
 
-    @patch("weave_gh.rendering.get_children", return_value=[])
-    @patch("weave_gh.rendering.get_blockers", return_value=[])
-    @patch("weave_gh.rendering.get_parent", return_value=None)
-    def test_with_alias(
-        self, _mock_parent: Any, _mock_blockers: Any, _mock_children: Any
-    ) -> None:
+    def test_with_alias(self) -> None:
         node = _node(node_id="a1", text="Long task name", alias="short-name", type="task")
         body = render_issue_body(node, {"a1": node}, [])
         assert "**Alias:** `short-name`" in body
 
-    @patch("weave_gh.rendering.get_children", return_value=[])
-    @patch("weave_gh.rendering.get_blockers", return_value=[])
-    @patch("weave_gh.rendering.get_parent", return_value=None)
-    def test_without_alias(
-        self, _mock_parent: Any, _mock_blockers: Any, _mock_children: Any
-    ) -> None:
+    def test_without_alias(self) -> None:
         node = _node(node_id="a2", text="Task without alias")
         body = render_issue_body(node, {"a2": node}, [])
         assert "Alias" not in body
 
-    @patch("weave_gh.rendering.get_children", return_value=[])
-    @patch("weave_gh.rendering.get_blockers", return_value=[])
-    @patch("weave_gh.rendering.get_parent", return_value="parent1")
-    def test_with_parent(
-        self, _mock_parent: Any, _mock_blockers: Any, _mock_children: Any
-    ) -> None:
+    def test_with_parent(self, graph_links: SimpleNamespace) -> None:
+        graph_links.parent = "parent1"
         node = _node(node_id="c1", text="Child task")
         parent = _node(node_id="parent1", text="Parent epic", gh_issue=10)
         nodes = {"c1": node, "parent1": parent}
@@ -288,12 +300,8 @@ class TestRenderIssueBody:
         assert "Part of" in body
         assert "#10" in body
 
-    @patch("weave_gh.rendering.get_children", return_value=[])
-    @patch("weave_gh.rendering.get_blockers", return_value=["b1"])
-    @patch("weave_gh.rendering.get_parent", return_value=None)
-    def test_with_blockers(
-        self, _mock_parent: Any, _mock_blockers: Any, _mock_children: Any
-    ) -> None:
+    def test_with_blockers(self, graph_links: SimpleNamespace) -> None:
+        graph_links.blockers = ["b1"]
         node = _node(node_id="n1", text="Blocked task")
         blocker = _node(node_id="b1", text="Dependency", gh_issue=5)
         nodes = {"n1": node, "b1": blocker}
@@ -302,12 +310,8 @@ class TestRenderIssueBody:
         assert "Blocked by" in body
         assert "#5" in body
 
-    @patch("weave_gh.rendering.get_children", return_value=[])
-    @patch("weave_gh.rendering.get_blockers", return_value=["b1", "b2"])
-    @patch("weave_gh.rendering.get_parent", return_value=None)
-    def test_filters_done_blockers_from_body(
-        self, _mock_parent: Any, _mock_blockers: Any, _mock_children: Any
-    ) -> None:
+    def test_filters_done_blockers_from_body(self, graph_links: SimpleNamespace) -> None:
+        graph_links.blockers = ["b1", "b2"]
         node = _node(node_id="n1", text="Blocked task")
         done_blocker = _node(node_id="b1", text="Done dependency", status="done", gh_issue=5)
         active_blocker = _node(
@@ -320,12 +324,10 @@ class TestRenderIssueBody:
         assert "#6" in body
         assert "#5" not in body
 
-    @patch("weave_gh.rendering.get_children", return_value=[])
-    @patch("weave_gh.rendering.get_blockers", return_value=["b1"])
-    @patch("weave_gh.rendering.get_parent", return_value=None)
     def test_omits_blocked_by_when_all_blockers_are_done(
-        self, _mock_parent: Any, _mock_blockers: Any, _mock_children: Any
+        self, graph_links: SimpleNamespace
     ) -> None:
+        graph_links.blockers = ["b1"]
         node = _node(node_id="n1", text="Previously blocked task")
         done_blocker = _node(node_id="b1", text="Done dependency", status="done", gh_issue=5)
         nodes = {"n1": node, "b1": done_blocker}
@@ -333,12 +335,7 @@ class TestRenderIssueBody:
         body = render_issue_body(node, nodes, [])
         assert "Blocked by" not in body
 
-    @patch("weave_gh.rendering.get_children", return_value=[])
-    @patch("weave_gh.rendering.get_blockers", return_value=[])
-    @patch("weave_gh.rendering.get_parent", return_value=None)
-    def test_with_description(
-        self, _mock_parent: Any, _mock_blockers: Any, _mock_children: Any
-    ) -> None:
+    def test_with_description(self) -> None:
         node = _node(node_id="n1", text="Task", description="Build the widget")
         nodes = {"n1": node}
 
@@ -346,12 +343,8 @@ class TestRenderIssueBody:
         assert "## Goal" in body
         assert "Build the widget" in body
 
-    @patch("weave_gh.rendering.get_children", return_value=["c1", "c2"])
-    @patch("weave_gh.rendering.get_blockers", return_value=[])
-    @patch("weave_gh.rendering.get_parent", return_value=None)
-    def test_with_children_checkboxes(
-        self, _mock_parent: Any, _mock_blockers: Any, _mock_children: Any
-    ) -> None:
+    def test_with_children_checkboxes(self, graph_links: SimpleNamespace) -> None:
+        graph_links.children = ["c1", "c2"]
         parent = _node(node_id="ep1", text="Epic", type="epic")
         c1 = _node(node_id="c1", text="Task 1", status="done")
         c2 = _node(node_id="c2", text="Task 2", status="todo")
@@ -363,31 +356,19 @@ class TestRenderIssueBody:
         assert "[x] Task 1" in body
         assert "[ ] Task 2" in body
 
-    @patch("weave_gh.rendering.get_children", return_value=["c1"])
-    @patch("weave_gh.rendering.get_blockers", return_value=[])
-    @patch("weave_gh.rendering.get_parent", return_value=None)
     def test_with_children_renders_mermaid_for_task_parent(
-        self, _mock_parent: Any, _mock_blockers: Any, _mock_children: Any
+        self, graph_links: SimpleNamespace, graph: SimpleNamespace
     ) -> None:
-        parent = _node(node_id="t1", text="Task parent")
-        child = _node(node_id="c1", text="Task child", status="todo")
-        nodes = {"t1": parent, "c1": child}
-
+        graph_links.children = ["c1"]
         with patch("weave_gh.rendering.render_mermaid_from_tree", return_value=""):
-            body = render_issue_body(parent, nodes, [])
+            body = render_issue_body(graph.task_parent, graph.task_parent_nodes, [])
         assert "## Dependency Graph" in body
         assert "```mermaid" in body
 
-    @patch("weave_gh.rendering.get_children", return_value=["c1"])
-    @patch("weave_gh.rendering.get_blockers", return_value=[])
-    @patch("weave_gh.rendering.get_parent", return_value=None)
     def test_prefers_tree_mermaid_output_over_fallback(
-        self, _mock_parent: Any, _mock_blockers: Any, _mock_children: Any
+        self, graph_links: SimpleNamespace, graph: SimpleNamespace
     ) -> None:
-        parent = _node(node_id="t1", text="Task parent")
-        child = _node(node_id="c1", text="Task child", status="todo")
-        nodes = {"t1": parent, "c1": child}
-
+        graph_links.children = ["c1"]
         with (
             patch(
                 "weave_gh.rendering.render_mermaid_from_tree",
@@ -398,17 +379,12 @@ class TestRenderIssueBody:
                 return_value="graph TD\n    fallback --> child",
             ),
         ):
-            body = render_issue_body(parent, nodes, [])
+            body = render_issue_body(graph.task_parent, graph.task_parent_nodes, [])
 
         assert "root --> child" in body
         assert "fallback --> child" not in body
 
-    @patch("weave_gh.rendering.get_children", return_value=[])
-    @patch("weave_gh.rendering.get_blockers", return_value=[])
-    @patch("weave_gh.rendering.get_parent", return_value=None)
-    def test_content_hash_in_markers(
-        self, _mock_parent: Any, _mock_blockers: Any, _mock_children: Any
-    ) -> None:
+    def test_content_hash_in_markers(self) -> None:
         node = _node(node_id="n1", text="Task")
         nodes = {"n1": node}
 
@@ -416,7 +392,7 @@ class TestRenderIssueBody:
         # Hash should be in the BEGIN marker
         assert "hash=" in body
         # Hash should be 12 hex chars
-        m = re.search(r"hash=([a-f0-9]+)", body)
+        m = _HASH_RE.search(body)
         assert m is not None
         assert len(m.group(1)) == 12
 
@@ -435,7 +411,7 @@ class TestBuildCloseComment:
 
     def test_with_learnings(self) -> None:
         node = _node(
-            id="n1",
+            node_id="n1",
             text="Task",
             status="done",
             decision="Use REST",
@@ -7,7 +7,7 @@ import time
 
 import pytest
 
-from weave_quality.ast_cache import ASTCache
+from weave_quality.ast_cache import ASTCache, content_blob_sha
 from weave_quality.models import CKMetrics, FileEntry, FunctionCC
 
 
@@ -193,3 +193,31 @@ def test_open_anchors_cache_at_git_toplevel(tmp_path):
     # Cache anchored at repo root, not the subdir scan path.
     assert (tmp_path / ".weave" / "ast_cache.db").exists()
     assert not (subdir / ".weave").exists()
+
+
+def test_content_blob_sha_matches_git_hash_object(tmp_path):
+    target = tmp_path / "untracked.py"
+    target.write_text("def foo():\n    return 1\n")
+    expected = subprocess.run(
+        ["git", "hash-object", str(target)],
+        capture_output=True, text=True, check=True,
+    ).stdout.strip()
+    assert content_blob_sha(target) == expected
+
+
+def test_content_blob_sha_missing_file_is_empty(tmp_path):
+    assert content_blob_sha(tmp_path / "nope.py") == ""
+
+
+def test_scan_files_caches_untracked_file_by_content(tmp_path):
+    from weave_quality.__main__ import _scan_files
+
+    (tmp_path / "mod.py").write_text("def foo(x):\n    if x:\n        return 1\n")
+    c = ASTCache.open(tmp_path, scanner_version="1.0.0")
+    first = _scan_files(str(tmp_path), ["mod.py"], 1, None, blob_map={}, ast_cache=c)
+    second = _scan_files(str(tmp_path), ["mod.py"], 2, None, blob_map={}, ast_cache=c)
+    assert c.misses == 1
+    assert c.hits == 1
+    assert second[0][0].complexity == first[0][0].complexity
+    assert second[0][0].scan_id == 2
+    c.close()
@@ -4,13 +4,13 @@
 
 from __future__ import annotations
 
-import textwrap
 from pathlib import Path
 
 import pytest
 
 from weave_quality.bash_heuristic import (
     _count_nesting,
+    _detect_from_header,
     _find_function_end,
     _function_name,
     _heredoc_end_pattern,
@@ -20,11 +20,17 @@ from weave_quality.bash_heuristic import (
     _indent_sd,
 )
 
-REPO = str(Path(__file__).resolve().parent.parent.parent)
+REPO = Path(__file__).resolve().parents[2]
+_WV = REPO / "scripts" / "wv"
+_WV_EXISTS = _WV.is_file()
 
 
 def _src(code: str) -> str:
-    return textwrap.dedent(code).lstrip()
+    """Strip the common leading indent of non-blank lines, then leading whitespace."""
+    lines = code.split("\n")
+    indents = [len(ln) - len(ln.lstrip(" \t")) for ln in lines if ln.strip()]
+    n = min(indents, default=0)
+    return "\n".join(ln[n:] if ln.strip() else "" for ln in lines).lstrip()
 
 
 # ---------------------------------------------------------------------------
@@ -32,57 +38,59 @@ def _src(code: str) -> str:
 # ---------------------------------------------------------------------------
 
 
-class TestComplexity:
-    def test_if_elif_else(self) -> None:
-        source = _src("""
-            #!/bin/bash
-            if [ -z "$1" ]; then
-                echo "missing"
-            elif [ "$1" = "foo" ]; then
-                echo "foo"
-            else
-                echo "other"
-            fi
-        """)
-        entry, _ = analyze_bash_source(source, "test.sh")
-        assert entry.language == "bash"
-        # if + elif = 2 branches minimum
-        assert entry.complexity >= 2
-
-    def test_case_statement(self) -> None:
-        source = _src("""
-            case "$1" in
-                start) echo "starting" ;;
-                stop)  echo "stopping" ;;
-                *)     echo "unknown" ;;
-            esac
-        """)
-        entry, _ = analyze_bash_source(source, "test.sh")
-        # case keyword itself is 1 branch; arms don't have separate branch keywords
-        assert entry.complexity >= 2
+SRC_IF_ELIF_ELSE = _src("""
+    #!/bin/bash
+    if [ -z "$1" ]; then
+        echo "missing"
+    elif [ "$1" = "foo" ]; then
+        echo "foo"
+    else
+        echo "other"
+    fi
+""")
+
+SRC_CASE_STATEMENT = _src("""
+    case "$1" in
+        start) echo "starting" ;;
+        stop)  echo "stopping" ;;
+        *)     echo "unknown" ;;
+    esac
+""")
+
+SRC_FOR_WHILE_UNTIL = _src("""
+    for f in *.txt; do
+        echo "$f"
+    done
+    while read -r line; do
+        echo "$line"
+    done
+    until false; do
+        break
+    done
+""")
+
+SRC_LOGICAL_OPERATORS = _src("""
+    [ -f file ] && echo "exists"
+    [ -d dir ] || echo "missing"
+""")
 
-    def test_for_while_until(self) -> None:
-        source = _src("""
-            for f in *.txt; do
-                echo "$f"
-            done
-            while read -r line; do
-                echo "$line"
-            done
-            until false; do
-                break
-            done
-        """)
-        entry, _ = analyze_bash_source(source, "test.sh")
-        assert entry.complexity >= 3
 
-    def test_logical_operators(self) -> None:
-        source = _src("""
-            [ -f file ] && echo "exists"
-            [ -d dir ] || echo "missing"
-        """)
+class TestComplexity:
+    @pytest.mark.parametrize(
+        ("source", "min_complexity"),
+        [
+            (SRC_IF_ELIF_ELSE, 2),  # if + elif = 2 branches minimum
+            # case keyword itself is 1 branch; arms don't have separate branch keywords
+            (SRC_CASE_STATEMENT, 2),
+            (SRC_FOR_WHILE_UNTIL, 3),
+            (SRC_LOGICAL_OPERATORS, 2),
+        ],
+        ids=["if_elif_else", "case", "for_while_until", "logical_ops"],
+    )
+    def test_complexity(self, source: str, min_complexity: int) -> None:
         entry, _ = analyze_bash_source(source, "test.sh")
-        assert entry.complexity >= 2
+        assert entry.language == "bash"
+        assert entry.complexity >= min_complexity
 
 
 # ---------------------------------------------------------------------------
@@ -90,55 +98,61 @@ class TestComplexity:
 # ---------------------------------------------------------------------------
 
 
-class TestFunctions:
-    def test_posix_style(self) -> None:
-        source = _src("""
-            my_func() {
-                echo "hello"
-            }
-        """)
-        entry, _ = analyze_bash_source(source, "test.sh")
-        assert entry.functions == 1
+SRC_POSIX_STYLE = _src("""
+    my_func() {
+        echo "hello"
+    }
+""")
+
+SRC_BASH_KEYWORD_STYLE = _src("""
+    function do_stuff {
+        echo "stuff"
+    }
+""")
+
+SRC_MULTIPLE_FUNCTIONS = _src("""
+    func_a() {
+        echo "a"
+    }
+    func_b() {
+        echo "b"
+    }
+    function func_c {
+        echo "c"
+    }
+""")
+
+SRC_AVG_FN_LEN = _src("""
+    short_fn() {
+        echo "1"
+    }
+
+    long_fn() {
+        echo "1"
+        echo "2"
+        echo "3"
+        echo "4"
+        echo "5"
+    }
+""")
 
-    def test_bash_keyword_style(self) -> None:
-        source = _src("""
-            function do_stuff {
-                echo "stuff"
-            }
-        """)
-        entry, _ = analyze_bash_source(source, "test.sh")
-        assert entry.functions == 1
 
-    def test_multiple_functions(self) -> None:
-        source = _src("""
-            func_a() {
-                echo "a"
-            }
-            func_b() {
-                echo "b"
-            }
-            function func_c {
-                echo "c"
-            }
-        """)
+class TestFunctions:
+    @pytest.mark.parametrize(
+        ("source", "functions"),
+        [
+            (SRC_POSIX_STYLE, 1),
+            (SRC_BASH_KEYWORD_STYLE, 1),
+            (SRC_MULTIPLE_FUNCTIONS, 3),
+        ],
+        ids=["posix_style", "bash_keyword_style", "multiple"],
+    )
+    def test_function_count(self, source: str, functions: int) -> None:
         entry, _ = analyze_bash_source(source, "test.sh")
-        assert entry.functions == 3
+        assert entry.functions == functions
 
     def test_avg_fn_len(self) -> None:
-        source = _src("""
-            short_fn() {
-                echo "1"
-            }
-
-            long_fn() {
-                echo "1"
-                echo "2"
-                echo "3"
-                echo "4"
-                echo "5"
-            }
-        """)
-        entry, _ = analyze_bash_source(source, "test.sh")
+        entry, _ = analyze_bash_source(SRC_AVG_FN_LEN, "test.sh")
         assert entry.functions == 2
         assert entry.avg_fn_len > 0
 
@@ -148,30 +162,34 @@ class TestFunctions:
 # ---------------------------------------------------------------------------
 
 
+SRC_SHALLOW = _src("""
+    if true; then
+        echo "level 1"
+    fi
+""")
+
+SRC_DEEP_NESTING = _src("""
+    if true; then
+        for f in *; do
+            while read -r line; do
+                if [ -n "$line" ]; then
+                    echo "$line"
+                fi
+            done
+        done
+    fi
+""")
+
+
 class TestNesting:
-    def test_shallow(self) -> None:
-        source = _src("""
-            if true; then
-                echo "level 1"
-            fi
-        """)
+    @pytest.mark.parametrize(
+        ("source", "min_nesting"),
+        [(SRC_SHALLOW, 1), (SRC_DEEP_NESTING, 3)],
+        ids=["shallow", "deep"],
+    )
+    def test_max_nesting(self, source: str, min_nesting: int) -> None:
         entry, _ = analyze_bash_source(source, "test.sh")
-        assert entry.max_nesting >= 1
-
-    def test_deep_nesting(self) -> None:
-        source = _src("""
-            if true; then
-                for f in *; do
-                    while read -r line; do
-                        if [ -n "$line" ]; then
-                            echo "$line"
-                        fi
-                    done
-                done
-            fi
-        """)
-        entry, _ = analyze_bash_source(source, "test.sh")
-        assert entry.max_nesting >= 3
+        assert entry.max_nesting >= min_nesting
 
 
 # ---------------------------------------------------------------------------
@@ -180,25 +198,36 @@ class TestNesting:
 
 
 class TestDetectBash:
-    def test_sh_extension(self, tmp_path: Path) -> None:
-        f = tmp_path / "test.sh"
-        f.write_text("#!/bin/bash\necho hi\n")
-        assert detect_bash(str(f)) is True
-
-    def test_bash_extension(self, tmp_path: Path) -> None:
-        f = tmp_path / "test.bash"
-        f.write_text("echo hi\n")
-        assert detect_bash(str(f)) is True
-
-    def test_shebang_no_extension(self, tmp_path: Path) -> None:
-        f = tmp_path / "myscript"
-        f.write_text("#!/usr/bin/env bash\necho hi\n")
-        assert detect_bash(str(f)) is True
-
-    def test_python_file(self, tmp_path: Path) -> None:
-        f = tmp_path / "test.py"
-        f.write_text("print('hi')\n")
-        assert detect_bash(str(f)) is False
+    @pytest.mark.parametrize(
+        ("header", "filename", "expected"),
+        [
+            ("#!/bin/bash\n", "test.sh", True),
+            ("echo hi\n", "test.bash", True),
+            ("#!/usr/bin/env bash\n", "myscript", True),
+            ("#!/bin/sh\n", "myscript", True),
+            ("print('hi')\n", "test.py", False),
+            ("#!/usr/bin/env python3\n", "myscript", False),
+            ("", "myscript", False),
+        ],
+        ids=[
+            "sh_ext",
+            "bash_ext",
+            "env_bash",
+            "bin_sh",
+            "python",
+            "env_python",
+            "empty",
+        ],
+    )
+    def test_detect_from_header(
+        self, header: str, filename: str, expected: bool
+    ) -> None:
+        assert _detect_from_header(header, filename) is expected
+
+    def test_shebang_read_from_file(self, tmp_path: Path) -> None:
+        script = tmp_path / "myscript"
+        script.write_text("#!/usr/bin/env bash\necho hi\n")
+        assert detect_bash(str(script)) is True
 
     def test_missing_file(self) -> None:
         assert detect_bash("/tmp/NO_SUCH_FILE_12345") is False
@@ -210,11 +239,11 @@ class TestDetectBash:
 
 
 class TestFileAnalysis:
+    @pytest.mark.slow
     def test_analyze_real_bash_file(self) -> None:
-        target = Path(REPO) / "scripts" / "wv"
-        if not target.exists():
+        if not _WV_EXISTS:
             pytest.skip("wv script not found")
-        entry, fn_cc = analyze_bash_file(str(target))
+        entry, fn_cc = analyze_bash_file(_WV)
         assert entry.language == "bash"
         assert entry.loc > 50
         assert entry.functions > 0
@@ -239,24 +268,39 @@ class TestFileAnalysis:
 # ---------------------------------------------------------------------------
 
 
+SRC_PER_FUNCTION_CC = _src("""
+    simple_fn() {
+        echo "hello"
+    }
+
+    complex_fn() {
+        if [ -z "$1" ]; then
+            echo "missing"
+        elif [ "$1" = "foo" ]; then
+            for i in 1 2 3; do
+                echo "$i"
+            done
+        fi
+    }
+""")
+
+SRC_FUNCTION_KEYWORD_SYNTAX = _src("""
+    function my_func {
+        if [ "$1" ]; then
+            echo "yes"
+        fi
+    }
+""")
+
+SRC_NO_FUNCTIONS = _src("""
+    echo "no functions here"
+    if [ -f foo ]; then echo "exists"; fi
+""")
+
+
 class TestFunctionCC:
     def test_per_function_cc(self) -> None:
-        source = _src("""
-            simple_fn() {
-                echo "hello"
-            }
-
-            complex_fn() {
-                if [ -z "$1" ]; then
-                    echo "missing"
-                elif [ "$1" = "foo" ]; then
-                    for i in 1 2 3; do
-                        echo "$i"
-                    done
-                fi
-            }
-        """)
-        _, fn_cc = analyze_bash_source(source, "test.sh")
+        _, fn_cc = analyze_bash_source(SRC_PER_FUNCTION_CC, "test.sh")
         assert len(fn_cc) == 2
         simple = fn_cc[0]
         assert simple.function_name == "simple_fn"
@@ -267,24 +311,13 @@ class TestFunctionCC:
         assert complex_.complexity >= 4  # base + if + elif + for
 
     def test_function_keyword_syntax(self) -> None:
-        source = _src("""
-            function my_func {
-                if [ "$1" ]; then
-                    echo "yes"
-                fi
-            }
-        """)
-        _, fn_cc = analyze_bash_source(source, "test.sh")
+        _, fn_cc = analyze_bash_source(SRC_FUNCTION_KEYWORD_SYNTAX, "test.sh")
         assert len(fn_cc) == 1
         assert fn_cc[0].function_name == "my_func"
         assert fn_cc[0].complexity >= 2  # base + if
 
     def test_no_functions(self) -> None:
-        source = _src("""
-            echo "no functions here"
-            if [ -f foo ]; then echo "exists"; fi
-        """)
-        _, fn_cc = analyze_bash_source(source, "test.sh")
+        _, fn_cc = analyze_bash_source(SRC_NO_FUNCTIONS, "test.sh")
         assert not fn_cc
 
 
@@ -293,6 +326,18 @@ class TestFunctionCC:
 # ---------------------------------------------------------------------------
 
 
+SRC_SOURCE_COUPLING = _src("""
+    source ./lib/helpers.sh
+    . ./lib/utils.sh
+""")
+
+SRC_TOOL_COUPLING = _src("""
+    jq '.foo' file.json
+    sqlite3 test.db "SELECT 1"
+    gh issue list
+""")
+
+
 class TestCoupling:
     def test_source_coupling(self) -> None:
         """Source/tool coupling detected but not stored in FileEntry.
@@ -301,21 +346,12 @@ class TestCoupling:
         doesn't have a coupling field -- these patterns contribute to
         complexity counting instead.
         """
-        source = _src("""
-            source ./lib/helpers.sh
-            . ./lib/utils.sh
-        """)
-        entry, _ = analyze_bash_source(source, "test.sh")
+        entry, _ = analyze_bash_source(SRC_SOURCE_COUPLING, "test.sh")
         # Source coupling detected as complexity contributor
         assert entry.loc > 0
 
     def test_tool_coupling(self) -> None:
-        source = _src("""
-            jq '.foo' file.json
-            sqlite3 test.db "SELECT 1"
-            gh issue list
-        """)
-        entry, _ = analyze_bash_source(source, "test.sh")
+        entry, _ = analyze_bash_source(SRC_TOOL_COUPLING, "test.sh")
         assert entry.loc > 0
 
 
@@ -324,64 +360,59 @@ class TestCoupling:
 # ---------------------------------------------------------------------------
 
 
+SRC_INDENTED_PROCESS = _src("""
+    #!/bin/bash
+    process() {
+      if [ -f "$1" ]; then
+        for line in $(cat "$1"); do
+          echo "$line"
+        done
+      fi
+    }
+    process "$1"
+""")
+
+LINES_FLAT = ("echo hello", "x=1", "echo $x")
+LINES_MIXED = (
+    "#!/bin/bash",
+    "do_thing() {",
+    '  if [ -z "$1" ]; then',
+    "    for f in *.txt; do",
+    '      echo "$f"',
+    "    done",
+    "  fi",
+    "}",
+    "do_thing",
+)
+LINES_TABS = ("func() {", "\tif true; then", "\t\techo ok", "\tfi", "}")
+LINES_CLEAN = ("x=1", "y=2")
+LINES_WITH_COMMENTS = ("# a comment", "x=1", "  # indented comment", "y=2")
+
+
 class TestIndentSD:
     def test_flat_bash_zero_sd(self) -> None:
         """Top-level commands with no indentation have zero SD."""
-        lines = ["echo hello", "x=1", "echo $x"]
-        assert _indent_sd(lines) == 0.0
+        assert _indent_sd(LINES_FLAT) == 0.0
 
     def test_mixed_nesting_nonzero_sd(self) -> None:
         """Bash with conditionals and loops has non-zero SD."""
-        lines = [
-            "#!/bin/bash",
-            "do_thing() {",
-            '  if [ -z "$1" ]; then',
-            "    for f in *.txt; do",
-            '      echo "$f"',
-            "    done",
-            "  fi",
-            "}",
-            "do_thing",
-        ]
-        sd = _indent_sd(lines)
-        assert sd > 0.0
+        assert _indent_sd(LINES_MIXED) > 0.0
 
     def test_tab_indented_bash(self) -> None:
         """Tab-indented Bash is handled (each tab = one indent unit)."""
-        lines = [
-            "func() {",
-            "\tif true; then",
-            "\t\techo ok",
-            "\tfi",
-            "}",
-        ]
-        sd = _indent_sd(lines)
-        assert sd > 0.0
+        assert _indent_sd(LINES_TABS) > 0.0
 
     def test_comments_ignored(self) -> None:
         """Comment lines don't contribute to indent SD."""
-        lines_clean = ["x=1", "y=2"]
-        lines_with_comments = ["# a comment", "x=1", "  # indented comment", "y=2"]
-        assert _indent_sd(lines_clean) == _indent_sd(lines_with_comments)
+        assert _indent_sd(LINES_CLEAN) == _indent_sd(LINES_WITH_COMMENTS)
 
-    def test_fewer_than_two_lines(self) -> None:
-        assert _indent_sd([]) == 0.0
-        assert _indent_sd(["echo hi"]) == 0.0
+    @pytest.mark.parametrize("lines", [(), ("echo hi",)], ids=["empty", "one_line"])
+    def test_fewer_than_two_lines(self, lines: tuple[str, ...]) -> None:
+        assert _indent_sd(lines) == 0.0
 
     def test_indent_sd_stored_in_file_entry(self) -> None:
         """analyze_bash_source populates indent_sd on the FileEntry."""
-        source = _src("""
-            #!/bin/bash
-            process() {
-              if [ -f "$1" ]; then
-                for line in $(cat "$1"); do
-                  echo "$line"
-                done
-              fi
-            }
-            process "$1"
-        """)
-        entry, _ = analyze_bash_source(source, "test.sh")
+        entry, _ = analyze_bash_source(SRC_INDENTED_PROCESS, "test.sh")
         assert entry.indent_sd >= 0.0
         assert entry.indent_sd > 0.0  # has nesting
 
@@ -515,17 +546,19 @@ class TestFunctionName:
 # ---------------------------------------------------------------------------
 
 
+SRC_FUNCTION_WITH_HEREDOC = _src("""
+    deploy() {
+        cat <<EOF
+    { "key": "value" }
+    EOF
+        echo "done"
+    }
+""")
+
+
 class TestStructuralIntegration:
     def test_function_with_heredoc(self) -> None:
-        source = _src("""
-            deploy() {
-                cat <<EOF
-            { "key": "value" }
-            EOF
-                echo "done"
-            }
-        """)
-        entry, fn_cc = analyze_bash_source(source, "test.sh")
+        entry, fn_cc = analyze_bash_source(SRC_FUNCTION_WITH_HEREDOC, "test.sh")
         assert entry.functions == 1
         assert fn_cc[0].function_name == "deploy"
 
@@ -12,12 +12,14 @@ import json
 import os
 import sqlite3
 import subprocess
+import sys
 from collections.abc import Generator
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from weave_quality import __main__ as quality_cli
 from weave_quality.__main__ import (
     _discover_files,
     _finding_id,
@@ -61,10 +63,22 @@ from weave_quality.models import FileEntry, FunctionCC, GitStats
 def db(tmp_path: Path) -> Generator[sqlite3.Connection, None, None]:
     """Fresh quality.db in a temp directory."""
     conn = init_db(hot_zone=str(tmp_path))
+    # Throwaway DB: skip fsync on the seeding connection. Only per-connection
+    # PRAGMAs are safe here -- cmd_* reopen the same file and reassert WAL,
+    # so journal_mode=OFF or locking_mode=EXCLUSIVE would fight or lock them out.
+    conn.execute("PRAGMA synchronous = OFF")
     yield conn
     conn.close()
 
 
+@pytest.fixture()
+def mock_wv(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Stub the CLI's _wv_cmd; tests set return_value or side_effect."""
+    mock = MagicMock(return_value=(0, "[]"))
+    monkeypatch.setattr(quality_cli, "_wv_cmd", mock)
+    return mock
+
+
 def _configure_temp_git_repo(repo: Path) -> None:
     """Keep temp git repos independent from user signing identity config."""
     subprocess.run(["git", "config", "user.email", "t@t"], cwd=repo, check=True)
@@ -100,6 +114,11 @@ def _entry(
     )
 
 
+def _entries(scan_id: int, specs: list[tuple[str, float]]) -> list[FileEntry]:
+    """Build one _entry per (path, complexity) pair."""
+    return [_entry(path, scan_id, complexity=cc) for path, cc in specs]
+
+
 def _stats(
     path: str,
     churn: int = 50,
@@ -122,13 +141,39 @@ def _populate_scan(
 ) -> None:
     """Populate a scan with entries and git stats.
 
-    Commits the transaction since db.py upserts no longer auto-commit
-    (single-transaction scan model).
+    Runs as one transaction committed on exit, since db.py upserts no
+    longer auto-commit (single-transaction scan model).
     """
-    bulk_upsert_file_entries(conn, entries)
-    compute_hotspots(entries, stats)
-    bulk_upsert_git_stats(conn, stats)
-    conn.commit()
+    with conn:
+        bulk_upsert_file_entries(conn, entries)
+        compute_hotspots(entries, stats)
+        bulk_upsert_git_stats(conn, stats)
+
+
+# Churn per path for the two-scan diff tests; stable across both scans.
+_DIFF_CHURN = {"a.py": 5, "b.py": 10}
+
+# cmd_diff JSON buckets, reduced to (path, delta) / path, when nothing changed
+_NO_DIFF: dict[str, list[object]] = {
+    "improved": [],
+    "degraded": [],
+    "new_files": [],
+    "removed_files": [],
+}
+
+
+def _seed_two_scans(
+    conn: sqlite3.Connection,
+    scan1: list[tuple[str, float]],
+    scan2: list[tuple[str, float]],
+) -> None:
+    """Record two finished scans from (path, complexity) pairs."""
+    for head, files in (("abc123", scan1), ("abc456", scan2)):
+        scan_id = begin_scan(conn, head)
+        entries = _entries(scan_id, files)
+        stats = [_stats(path, churn=_DIFF_CHURN[path]) for path, _ in files]
+        _populate_scan(conn, scan_id, entries, stats)
+        finish_scan(conn, scan_id, len(files), 100)
 
 
 # ---------------------------------------------------------------------------
@@ -185,15 +230,21 @@ class TestCmdPatternsScan:
 # ---------------------------------------------------------------------------
 
 
+def _make_hotspots_args(
+    hot_zone: str, top: int = 10, json_out: bool = False
+) -> argparse.Namespace:
+    return argparse.Namespace(
+        hot_zone=hot_zone,
+        top=top,
+        json=json_out,
+        scope="production",
+    )
+
+
 class TestCmdHotspots:
     def test_no_db_returns_error(self, tmp_path: Path) -> None:
         """hotspots with no quality.db returns error."""
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path / "nonexistent"),
-            top=10,
-            json=False,
-            scope="production",
-        )
+        args = _make_hotspots_args(str(tmp_path / "nonexistent"))
         result = cmd_hotspots(args)
         assert result == 1
 
@@ -202,12 +253,7 @@ class TestCmdHotspots:
     ) -> None:
         """hotspots with empty db returns error."""
         _ = db  # ensure DB is created
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            top=10,
-            json=False,
-            scope="production",
-        )
+        args = _make_hotspots_args(str(tmp_path))
         result = cmd_hotspots(args)
         assert result == 1
 
@@ -219,10 +265,7 @@ class TestCmdHotspots:
     ) -> None:
         """hotspots with data returns ranked text output."""
         scan_id = begin_scan(db, "abc123")
-        entries = [
-            _entry("a.py", scan_id, complexity=100),
-            _entry("b.py", scan_id, complexity=10),
-        ]
+        entries = _entries(scan_id, [("a.py", 100), ("b.py", 10)])
         stats = [
             _stats("a.py", churn=50),
             _stats("b.py", churn=5),
@@ -231,12 +274,7 @@ class TestCmdHotspots:
         finish_scan(db, scan_id, 2, 100)
         db.close()
 
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            top=10,
-            json=False,
-            scope="production",
-        )
+        args = _make_hotspots_args(str(tmp_path))
         result = cmd_hotspots(args)
         assert result == 0
         captured = capsys.readouterr()
@@ -250,10 +288,7 @@ class TestCmdHotspots:
     ) -> None:
         """hotspots --json returns valid JSON with expected schema."""
         scan_id = begin_scan(db, "abc123")
-        entries = [
-            _entry("a.py", scan_id, complexity=100),
-            _entry("b.py", scan_id, complexity=10),
-        ]
+        entries = _entries(scan_id, [("a.py", 100), ("b.py", 10)])
         stats = [
             _stats("a.py", churn=50),
             _stats("b.py", churn=5),
@@ -262,12 +297,7 @@ class TestCmdHotspots:
         finish_scan(db, scan_id, 2, 100)
         db.close()
 
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            top=10,
-            json=True,
-            scope="production",
-        )
+        args = _make_hotspots_args(str(tmp_path), json_out=True)
         result = cmd_hotspots(args)
         assert result == 0
         captured = capsys.readouterr()
@@ -288,11 +318,7 @@ class TestCmdHotspots:
     ) -> None:
         """--top=1 limits to 1 result."""
         scan_id = begin_scan(db, "abc123")
-        entries = [
-            _entry("a.py", scan_id, complexity=100),
-            _entry("b.py", scan_id, complexity=90),
-            _entry("c.py", scan_id, complexity=80),
-        ]
+        entries = _entries(scan_id, [("a.py", 100), ("b.py", 90), ("c.py", 80)])
         stats = [
             _stats("a.py", churn=50, hotspot=0.9),
             _stats("b.py", churn=40, hotspot=0.8),
@@ -302,12 +328,7 @@ class TestCmdHotspots:
         finish_scan(db, scan_id, 3, 100)
         db.close()
 
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            top=1,
-            json=True,
-            scope="production",
-        )
+        args = _make_hotspots_args(str(tmp_path), top=1, json_out=True)
         result = cmd_hotspots(args)
         assert result == 0
         data = json.loads(capsys.readouterr().out)
@@ -319,14 +340,18 @@ class TestCmdHotspots:
 # ---------------------------------------------------------------------------
 
 
+def _make_diff_args(hot_zone: str, json_out: bool = False) -> argparse.Namespace:
+    return argparse.Namespace(
+        hot_zone=hot_zone,
+        json=json_out,
+        scope="production",
+    )
+
+
 class TestCmdDiff:
     def test_no_db_returns_error(self, tmp_path: Path) -> None:
         """diff with no quality.db returns error."""
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path / "nonexistent"),
-            json=False,
-            scope="production",
-        )
+        args = _make_diff_args(str(tmp_path / "nonexistent"))
         result = cmd_diff(args)
         assert result == 1
 
@@ -342,11 +367,7 @@ class TestCmdDiff:
         db.commit()
         db.close()
 
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            json=False,
-            scope="production",
-        )
+        args = _make_diff_args(str(tmp_path))
         result = cmd_diff(args)
         assert result == 0
         captured = capsys.readouterr()
@@ -364,190 +385,67 @@ class TestCmdDiff:
         db.commit()
         db.close()
 
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            json=True,
-            scope="production",
-        )
+        args = _make_diff_args(str(tmp_path), json_out=True)
         result = cmd_diff(args)
         assert result == 0
         data = json.loads(capsys.readouterr().out)
         assert data["scan_previous"] is None
         assert data["scan_current"] == scan_id
 
-    def test_diff_two_scans_no_change(
-        self,
-        db: sqlite3.Connection,
-        tmp_path: Path,
-        capsys: pytest.CaptureFixture[str],
-    ) -> None:
-        """diff between identical scans shows no significant changes."""
-        # Scan 1
-        s1 = begin_scan(db, "abc123")
-        entries1 = [_entry("a.py", s1, complexity=10)]
-        stats1 = [_stats("a.py", churn=5)]
-        _populate_scan(db, s1, entries1, stats1)
-        finish_scan(db, s1, 1, 100)
-
-        # Scan 2 (same data)
-        s2 = begin_scan(db, "abc456")
-        entries2 = [_entry("a.py", s2, complexity=10)]
-        stats2 = [_stats("a.py", churn=5)]
-        _populate_scan(db, s2, entries2, stats2)
-        finish_scan(db, s2, 1, 100)
-        db.close()
-
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            json=True,
-            scope="production",
-        )
-        result = cmd_diff(args)
-        assert result == 0
-        data = json.loads(capsys.readouterr().out)
-        assert data["improved"] == []
-        assert data["degraded"] == []
-        assert data["new_files"] == []
-        assert data["removed_files"] == []
-
-    def test_diff_shows_degraded(
-        self,
-        db: sqlite3.Connection,
-        tmp_path: Path,
-        capsys: pytest.CaptureFixture[str],
-    ) -> None:
-        """diff reports files where complexity increased."""
-        # Scan 1
-        s1 = begin_scan(db, "abc123")
-        entries1 = [_entry("a.py", s1, complexity=10)]
-        stats1 = [_stats("a.py", churn=5)]
-        _populate_scan(db, s1, entries1, stats1)
-        finish_scan(db, s1, 1, 100)
-
-        # Scan 2 (complexity increased)
-        s2 = begin_scan(db, "abc456")
-        entries2 = [_entry("a.py", s2, complexity=30)]
-        stats2 = [_stats("a.py", churn=5)]
-        _populate_scan(db, s2, entries2, stats2)
-        finish_scan(db, s2, 1, 100)
-        db.close()
-
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            json=True,
-            scope="production",
-        )
-        result = cmd_diff(args)
-        assert result == 0
-        data = json.loads(capsys.readouterr().out)
-        assert len(data["degraded"]) == 1
-        assert data["degraded"][0]["path"] == "a.py"
-        assert data["degraded"][0]["delta"] == 20.0
-
-    def test_diff_shows_improved(
-        self,
-        db: sqlite3.Connection,
-        tmp_path: Path,
-        capsys: pytest.CaptureFixture[str],
-    ) -> None:
-        """diff reports files where complexity decreased."""
-        # Scan 1
-        s1 = begin_scan(db, "abc123")
-        entries1 = [_entry("a.py", s1, complexity=30)]
-        stats1 = [_stats("a.py", churn=5)]
-        _populate_scan(db, s1, entries1, stats1)
-        finish_scan(db, s1, 1, 100)
-
-        # Scan 2 (complexity decreased)
-        s2 = begin_scan(db, "abc456")
-        entries2 = [_entry("a.py", s2, complexity=10)]
-        stats2 = [_stats("a.py", churn=5)]
-        _populate_scan(db, s2, entries2, stats2)
-        finish_scan(db, s2, 1, 100)
-        db.close()
-
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            json=True,
-            scope="production",
-        )
-        result = cmd_diff(args)
-        assert result == 0
-        data = json.loads(capsys.readouterr().out)
-        assert len(data["improved"]) == 1
-        assert data["improved"][0]["path"] == "a.py"
-        assert data["improved"][0]["delta"] == -20.0
-
-    def test_diff_shows_new_files(
-        self,
-        db: sqlite3.Connection,
-        tmp_path: Path,
-        capsys: pytest.CaptureFixture[str],
-    ) -> None:
-        """diff reports files that appear in current but not previous scan."""
-        # Scan 1 (only a.py)
-        s1 = begin_scan(db, "abc123")
-        entries1 = [_entry("a.py", s1, complexity=10)]
-        stats1 = [_stats("a.py", churn=5)]
-        _populate_scan(db, s1, entries1, stats1)
-        finish_scan(db, s1, 1, 100)
-
-        # Scan 2 (a.py + b.py)
-        s2 = begin_scan(db, "abc456")
-        entries2 = [
-            _entry("a.py", s2, complexity=10),
-            _entry("b.py", s2, complexity=20),
-        ]
-        stats2 = [_stats("a.py", churn=5), _stats("b.py", churn=10)]
-        _populate_scan(db, s2, entries2, stats2)
-        finish_scan(db, s2, 2, 100)
-        db.close()
-
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            json=True,
-            scope="production",
-        )
-        result = cmd_diff(args)
-        assert result == 0
-        data = json.loads(capsys.readouterr().out)
-        assert len(data["new_files"]) == 1
-        assert data["new_files"][0]["path"] == "b.py"
-
-    def test_diff_shows_removed_files(
+    @pytest.mark.parametrize(
+        ("scan1", "scan2", "expected"),
+        [
+            (
+                [("a.py", 10)],
+                [("a.py", 10)],
+                _NO_DIFF,
+            ),
+            (
+                [("a.py", 10)],
+                [("a.py", 30)],
+                {**_NO_DIFF, "degraded": [("a.py", 20.0)]},
+            ),
+            (
+                [("a.py", 30)],
+                [("a.py", 10)],
+                {**_NO_DIFF, "improved": [("a.py", -20.0)]},
+            ),
+            (
+                [("a.py", 10)],
+                [("a.py", 10), ("b.py", 20)],
+                {**_NO_DIFF, "new_files": ["b.py"]},
+            ),
+            (
+                [("a.py", 10), ("b.py", 20)],
+                [("a.py", 10)],
+                {**_NO_DIFF, "removed_files": ["b.py"]},
+            ),
+        ],
+        ids=["no_change", "degraded", "improved", "new_files", "removed_files"],
+    )
+    def test_diff_two_scans(
         self,
         db: sqlite3.Connection,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
+        scan1: list[tuple[str, float]],
+        scan2: list[tuple[str, float]],
+        expected: dict[str, list[object]],
     ) -> None:
-        """diff reports files that disappeared from current scan."""
-        # Scan 1 (a.py + b.py)
-        s1 = begin_scan(db, "abc123")
-        entries1 = [
-            _entry("a.py", s1, complexity=10),
-            _entry("b.py", s1, complexity=20),
-        ]
-        stats1 = [_stats("a.py", churn=5), _stats("b.py", churn=10)]
-        _populate_scan(db, s1, entries1, stats1)
-        finish_scan(db, s1, 2, 100)
-
-        # Scan 2 (only a.py)
-        s2 = begin_scan(db, "abc456")
-        entries2 = [_entry("a.py", s2, complexity=10)]
-        stats2 = [_stats("a.py", churn=5)]
-        _populate_scan(db, s2, entries2, stats2)
-        finish_scan(db, s2, 1, 100)
+        """diff buckets files into improved/degraded/new/removed between two scans."""
+        _seed_two_scans(db, scan1, scan2)
         db.close()
 
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            json=True,
-            scope="production",
-        )
+        args = _make_diff_args(str(tmp_path), json_out=True)
         result = cmd_diff(args)
         assert result == 0
         data = json.loads(capsys.readouterr().out)
-        assert "b.py" in data["removed_files"]
+        assert {
+            "improved": [(d["path"], d["delta"]) for d in data["improved"]],
+            "degraded": [(d["path"], d["delta"]) for d in data["degraded"]],
+            "new_files": [d["path"] for d in data["new_files"]],
+            "removed_files": data["removed_files"],
+        } == expected
 
     def test_diff_quality_score_delta(
         self,
@@ -556,26 +454,10 @@ class TestCmdDiff:
         capsys: pytest.CaptureFixture[str],
     ) -> None:
         """diff JSON includes quality_score_current and quality_score_previous."""
-        # Scan 1
-        s1 = begin_scan(db, "abc123")
-        entries1 = [_entry("a.py", s1, complexity=10)]
-        stats1 = [_stats("a.py", churn=5)]
-        _populate_scan(db, s1, entries1, stats1)
-        finish_scan(db, s1, 1, 100)
-
-        # Scan 2
-        s2 = begin_scan(db, "abc456")
-        entries2 = [_entry("a.py", s2, complexity=10)]
-        stats2 = [_stats("a.py", churn=5)]
-        _populate_scan(db, s2, entries2, stats2)
-        finish_scan(db, s2, 1, 100)
+        _seed_two_scans(db, [("a.py", 10)], [("a.py", 10)])
         db.close()
 
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            json=True,
-            scope="production",
-        )
+        args = _make_diff_args(str(tmp_path), json_out=True)
         result = cmd_diff(args)
         assert result == 0
         data = json.loads(capsys.readouterr().out)
@@ -590,6 +472,11 @@ class TestCmdDiff:
 # ---------------------------------------------------------------------------
 
 
+# Finding IDs for paths that tests pre-seed as already-promoted nodes
+_DUP_FID = _finding_id("dup.py")
+_HOT_FID = _finding_id("hot.py")
+
+
 def _make_promote_args(
     hot_zone: str,
     parent: str = "wv-abcdef",
@@ -663,13 +550,11 @@ class TestCmdPromote:
         db: sqlite3.Connection,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
+        mock_wv: MagicMock,
     ) -> None:
         """dry-run prints plan without calling wv."""
         scan_id = begin_scan(db, str(tmp_path))
-        entries = [
-            _entry("a.py", scan_id, complexity=50.0),
-            _entry("b.py", scan_id, complexity=30.0),
-        ]
+        entries = _entries(scan_id, [("a.py", 50.0), ("b.py", 30.0)])
         stats = [
             _stats("a.py", churn=100),
             _stats("b.py", churn=80),
@@ -679,10 +564,9 @@ class TestCmdPromote:
 
         args = _make_promote_args(str(tmp_path), dry_run=True)
 
-        with patch("weave_quality.__main__._wv_cmd") as mock_wv:
-            # _wv_cmd for idempotency check returns empty list
-            mock_wv.return_value = (0, "[]")
-            result = cmd_promote(args)
+        # _wv_cmd for idempotency check returns empty list
+        mock_wv.return_value = (0, "[]")
+        result = cmd_promote(args)
 
         assert result == 0
         captured = capsys.readouterr()
@@ -695,13 +579,11 @@ class TestCmdPromote:
         db: sqlite3.Connection,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
+        mock_wv: MagicMock,
     ) -> None:
         """promote creates nodes and links them via references edge."""
         scan_id = begin_scan(db, str(tmp_path))
-        entries = [
-            _entry("hot.py", scan_id, complexity=60.0),
-            _entry("cold.py", scan_id, complexity=5.0),
-        ]
+        entries = _entries(scan_id, [("hot.py", 60.0), ("cold.py", 5.0)])
         stats = [
             _stats("hot.py", churn=120),
             _stats("cold.py", churn=10),
@@ -720,8 +602,8 @@ class TestCmdPromote:
                 return 0, ""
             return 1, "unknown"
 
-        with patch("weave_quality.__main__._wv_cmd", side_effect=fake_wv):
-            result = cmd_promote(args)
+        mock_wv.side_effect = fake_wv
+        result = cmd_promote(args)
 
         assert result == 0
         data = json.loads(capsys.readouterr().out)
@@ -735,13 +617,11 @@ class TestCmdPromote:
         db: sqlite3.Connection,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
+        mock_wv: MagicMock,
     ) -> None:
         """promote skips findings that already have Weave nodes."""
         scan_id = begin_scan(db, str(tmp_path))
-        entries = [
-            _entry("dup.py", scan_id, complexity=40.0),
-            _entry("other.py", scan_id, complexity=5.0),
-        ]
+        entries = _entries(scan_id, [("dup.py", 40.0), ("other.py", 5.0)])
         stats = [
             _stats("dup.py", churn=90),
             _stats("other.py", churn=10),
@@ -749,23 +629,21 @@ class TestCmdPromote:
         _populate_scan(db, scan_id, entries, stats)
         finish_scan(db, scan_id, 2, 100)
 
-        # Compute the finding ID for dup.py so we can simulate existing node
-        fid = _finding_id("dup.py")
-
+        # Simulate an existing node carrying dup.py's finding ID
         existing_node = json.dumps(
             [
                 {
                     "id": "wv-exists",
                     "text": "old finding",
-                    "metadata": json.dumps({"quality_finding_id": fid}),
+                    "metadata": json.dumps({"quality_finding_id": _DUP_FID}),
                 }
             ]
         )
 
         args = _make_promote_args(str(tmp_path), top=1, json_out=True)
 
-        with patch("weave_quality.__main__._wv_cmd", return_value=(0, existing_node)):
-            result = cmd_promote(args)
+        mock_wv.return_value = (0, existing_node)
+        result = cmd_promote(args)
 
         assert result == 0
         data = json.loads(capsys.readouterr().out)
@@ -777,13 +655,11 @@ class TestCmdPromote:
         db: sqlite3.Connection,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
+        mock_wv: MagicMock,
     ) -> None:
         """promote --json output has required fields."""
         scan_id = begin_scan(db, str(tmp_path))
-        entries = [
-            _entry("schema.py", scan_id, complexity=45.0),
-            _entry("low.py", scan_id, complexity=5.0),
-        ]
+        entries = _entries(scan_id, [("schema.py", 45.0), ("low.py", 5.0)])
         stats = [
             _stats("schema.py", churn=70),
             _stats("low.py", churn=10),
@@ -793,8 +669,8 @@ class TestCmdPromote:
 
         args = _make_promote_args(str(tmp_path), top=1, json_out=True, dry_run=True)
 
-        with patch("weave_quality.__main__._wv_cmd", return_value=(0, "[]")):
-            result = cmd_promote(args)
+        mock_wv.return_value = (0, "[]")
+        result = cmd_promote(args)
 
         assert result == 0
         data = json.loads(capsys.readouterr().out)
@@ -2402,10 +2278,7 @@ class TestCmdHealthInfo:
     ) -> None:
         """health-info with scan data returns score and metadata."""
         scan_id = begin_scan(db, str(tmp_path))
-        entries = [
-            _entry("a.py", scan_id, complexity=50.0),
-            _entry("b.py", scan_id, complexity=5.0),
-        ]
+        entries = _entries(scan_id, [("a.py", 50.0), ("b.py", 5.0)])
         stats = [
             _stats("a.py", churn=100),
             _stats("b.py", churn=10),
@@ -2438,12 +2311,13 @@ class TestCmdContextFiles:
         self,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """context-files with no db returns empty quality list."""
         no_db_path = str(tmp_path / "nonexistent")
         args = _make_context_files_args(no_db_path)
-        with patch("sys.stdin", io.StringIO("a.py\nb.py\n")):
-            cmd_context_files(args)
+        monkeypatch.setattr(sys, "stdin", io.StringIO("a.py\nb.py\n"))
+        cmd_context_files(args)
         data = json.loads(capsys.readouterr().out)
         assert data["code_quality"] == []
         assert data["quality_as_of"] is None
@@ -2453,12 +2327,13 @@ class TestCmdContextFiles:
         db: sqlite3.Connection,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """context-files with empty db (no scan) returns empty."""
         _ = db
         args = _make_context_files_args(str(tmp_path))
-        with patch("sys.stdin", io.StringIO("a.py\n")):
-            cmd_context_files(args)
+        monkeypatch.setattr(sys, "stdin", io.StringIO("a.py\n"))
+        cmd_context_files(args)
         data = json.loads(capsys.readouterr().out)
         assert data["code_quality"] == []
         assert data["quality_as_of"] is None
@@ -2468,6 +2343,7 @@ class TestCmdContextFiles:
         db: sqlite3.Connection,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """context-files with no stdin paths returns empty."""
         scan_id = begin_scan(db, str(tmp_path))
@@ -2478,8 +2354,8 @@ class TestCmdContextFiles:
 
         args = _make_context_files_args(str(tmp_path))
         # Simulate tty (no piped stdin) - empty StringIO with isatty=True
-        with patch("sys.stdin", io.StringIO("")):
-            cmd_context_files(args)
+        monkeypatch.setattr(sys, "stdin", io.StringIO(""))
+        cmd_context_files(args)
         data = json.loads(capsys.readouterr().out)
         assert data["code_quality"] == []
 
@@ -2488,13 +2364,11 @@ class TestCmdContextFiles:
         db: sqlite3.Connection,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """context-files returns quality data for files in quality.db."""
         scan_id = begin_scan(db, str(tmp_path))
-        entries = [
-            _entry("a.py", scan_id, complexity=45.0),
-            _entry("b.py", scan_id, complexity=12.0),
-        ]
+        entries = _entries(scan_id, [("a.py", 45.0), ("b.py", 12.0)])
         stats = [
             _stats("a.py", churn=67),
             _stats("b.py", churn=18),
@@ -2503,8 +2377,8 @@ class TestCmdContextFiles:
         finish_scan(db, scan_id, 2, 100)
 
         args = _make_context_files_args(str(tmp_path))
-        with patch("sys.stdin", io.StringIO("a.py\nb.py\nunknown.py\n")):
-            cmd_context_files(args)
+        monkeypatch.setattr(sys, "stdin", io.StringIO("a.py\nb.py\nunknown.py\n"))
+        cmd_context_files(args)
         data = json.loads(capsys.readouterr().out)
 
         assert data["quality_as_of"] is not None
@@ -2530,6 +2404,7 @@ class TestCmdContextFiles:
         db: sqlite3.Connection,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """context-files returns data for files with only git stats."""
         scan_id = begin_scan(db, str(tmp_path))
@@ -2540,8 +2415,8 @@ class TestCmdContextFiles:
         db.commit()
 
         args = _make_context_files_args(str(tmp_path))
-        with patch("sys.stdin", io.StringIO("c.py\n")):
-            cmd_context_files(args)
+        monkeypatch.setattr(sys, "stdin", io.StringIO("c.py\n"))
+        cmd_context_files(args)
         data = json.loads(capsys.readouterr().out)
         assert len(data["code_quality"]) == 1
         assert data["code_quality"][0]["path"] == "c.py"
@@ -2554,6 +2429,11 @@ class TestCmdContextFiles:
 # ---------------------------------------------------------------------------
 
 
+# Keys every `wv quality functions --json` payload and row must carry
+_FUNCTIONS_JSON_KEYS = frozenset({"functions", "histogram", "cc_gini"})
+_FUNCTION_ROW_KEYS = frozenset({"line_start", "line_end"})
+
+
 def _make_functions_args(
     hot_zone: str, path: str | None = None, use_json: bool = False
 ) -> argparse.Namespace:
@@ -2564,6 +2444,67 @@ def _make_functions_args(
     )
 
 
+def _populate_fn_cc(
+    db: sqlite3.Connection,
+    scan_id: int,
+) -> None:
+    """Insert file entry + function CC metrics for testing."""
+    entry = FileEntry(
+        path="src/foo.py",
+        scan_id=scan_id,
+        language="python",
+        loc=100,
+        complexity=25.0,
+    )
+    fns = [
+        FunctionCC(
+            path="src/foo.py",
+            scan_id=scan_id,
+            function_name="process",
+            complexity=15.0,
+            line_start=10,
+            line_end=50,
+            is_dispatch=False,
+        ),
+        FunctionCC(
+            path="src/foo.py",
+            scan_id=scan_id,
+            function_name="dispatch_fn",
+            complexity=12.0,
+            line_start=55,
+            line_end=80,
+            is_dispatch=True,
+        ),
+        FunctionCC(
+            path="src/foo.py",
+            scan_id=scan_id,
+            function_name="helper",
+            complexity=3.0,
+            line_start=85,
+            line_end=100,
+            is_dispatch=False,
+        ),
+    ]
+    with db:
+        bulk_upsert_file_entries(db, [entry])
+        bulk_upsert_function_cc(db, fns)
+
+
+@pytest.fixture(scope="class")
+def functions_hot_zone(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """hot_zone holding one finished scan of _populate_fn_cc data.
+
+    cmd_functions only reads, so the cmd_functions tests share it.
+    """
+    hot_zone = tmp_path_factory.mktemp("functions")
+    conn = init_db(hot_zone=str(hot_zone))
+    scan_id = begin_scan(conn, "abc")
+    _populate_fn_cc(conn, scan_id)
+    finish_scan(conn, scan_id, 1, 100)
+    conn.close()
+    return str(hot_zone)
+
+
 class TestCmdFunctions:
     def test_no_db_returns_error(
         self,
@@ -2586,86 +2527,30 @@ class TestCmdFunctions:
         result = cmd_functions(args)
         assert result == 1
 
-    def _populate_fn_cc(
-        self,
-        db: sqlite3.Connection,
-        scan_id: int,
-    ) -> None:
-        """Insert file entry + function CC metrics for testing."""
-        entry = FileEntry(
-            path="src/foo.py",
-            scan_id=scan_id,
-            language="python",
-            loc=100,
-            complexity=25.0,
-        )
-        bulk_upsert_file_entries(db, [entry])
-        fns = [
-            FunctionCC(
-                path="src/foo.py",
-                scan_id=scan_id,
-                function_name="process",
-                complexity=15.0,
-                line_start=10,
-                line_end=50,
-                is_dispatch=False,
-            ),
-            FunctionCC(
-                path="src/foo.py",
-                scan_id=scan_id,
-                function_name="dispatch_fn",
-                complexity=12.0,
-                line_start=55,
-                line_end=80,
-                is_dispatch=True,
-            ),
-            FunctionCC(
-                path="src/foo.py",
-                scan_id=scan_id,
-                function_name="helper",
-                complexity=3.0,
-                line_start=85,
-                line_end=100,
-                is_dispatch=False,
-            ),
-        ]
-        bulk_upsert_function_cc(db, fns)
-        db.commit()
-
     def test_text_output_sorted_by_complexity(
         self,
-        db: sqlite3.Connection,
-        tmp_path: Path,
+        functions_hot_zone: str,
         capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Text output lists functions sorted by CC descending."""
-        scan_id = begin_scan(db, "abc")
-        self._populate_fn_cc(db, scan_id)
-        finish_scan(db, scan_id, 1, 100)
-
-        args = _make_functions_args(str(tmp_path))
+        args = _make_functions_args(functions_hot_zone)
         result = cmd_functions(args)
         assert result == 0
 
         out = capsys.readouterr().err
-        fn_lines = [ln for ln in out.splitlines() if "\u2713" in ln or "\u2717" in ln]
-        assert len(fn_lines) == 3
-        assert "process" in fn_lines[0]
-        assert "dispatch_fn" in fn_lines[1]
-        assert "helper" in fn_lines[2]
+        assert out.count("\u2713") + out.count("\u2717") == 3
+        # Skip the header line, which names the cwd and could contain any word
+        body = out[out.index("\n"):]
+        p, d, h = (body.find(f" {name} ") for name in ("process", "dispatch_fn", "helper"))
+        assert 0 <= p < d < h
 
     def test_text_output_flags_over_threshold(
         self,
-        db: sqlite3.Connection,
-        tmp_path: Path,
+        functions_hot_zone: str,
         capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Functions over threshold are marked \u2717; compliant functions marked \u2713."""
-        scan_id = begin_scan(db, "abc")
-        self._populate_fn_cc(db, scan_id)
-        finish_scan(db, scan_id, 1, 100)
-
-        args = _make_functions_args(str(tmp_path))
+        args = _make_functions_args(functions_hot_zone)
         cmd_functions(args)
         out = capsys.readouterr().err
 
@@ -2674,68 +2559,48 @@ class TestCmdFunctions:
 
     def test_dispatch_exempt_label(
         self,
-        db: sqlite3.Connection,
-        tmp_path: Path,
+        functions_hot_zone: str,
         capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Dispatch functions get [dispatch \u2014 exempt] label and \u2713 mark."""
-        scan_id = begin_scan(db, "abc")
-        self._populate_fn_cc(db, scan_id)
-        finish_scan(db, scan_id, 1, 100)
-
-        args = _make_functions_args(str(tmp_path))
+        args = _make_functions_args(functions_hot_zone)
         cmd_functions(args)
         out = capsys.readouterr().err
 
         assert "[dispatch" in out
-        for line in out.splitlines():
-            if "dispatch_fn" in line and "exempt" in line:
-                assert "\u2713" in line
-                break
-        else:
-            raise AssertionError("No dispatch-exempt line found in output")
+        assert any(
+            "dispatch_fn" in ln and "exempt" in ln and "\u2713" in ln
+            for ln in out.splitlines()
+        ), "No \u2713 dispatch-exempt line found in output"
 
     def test_json_output_schema(
         self,
-        db: sqlite3.Connection,
-        tmp_path: Path,
+        functions_hot_zone: str,
         capsys: pytest.CaptureFixture[str],
     ) -> None:
         """JSON output contains expected keys for each function."""
-        scan_id = begin_scan(db, "abc")
-        self._populate_fn_cc(db, scan_id)
-        finish_scan(db, scan_id, 1, 100)
-
-        args = _make_functions_args(str(tmp_path), use_json=True)
+        args = _make_functions_args(functions_hot_zone, use_json=True)
         result = cmd_functions(args)
         assert result == 0
 
         data = json.loads(capsys.readouterr().out)
         assert isinstance(data, dict)
-        assert "functions" in data
-        assert "histogram" in data
-        assert "cc_gini" in data
+        assert _FUNCTIONS_JSON_KEYS <= data.keys()
         fns = data["functions"]
         assert len(fns) == 3
         first = fns[0]  # sorted by CC desc
         assert first["function"] == "process"
         assert first["cc"] == 15.0
         assert first["is_dispatch"] is False
-        assert "line_start" in first
-        assert "line_end" in first
+        assert _FUNCTION_ROW_KEYS <= first.keys()
 
     def test_summary_line_format(
         self,
-        db: sqlite3.Connection,
-        tmp_path: Path,
+        functions_hot_zone: str,
         capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Summary line correctly counts flagged vs exempt."""
-        scan_id = begin_scan(db, "abc")
-        self._populate_fn_cc(db, scan_id)
-        finish_scan(db, scan_id, 1, 100)
-
-        args = _make_functions_args(str(tmp_path))
+        args = _make_functions_args(functions_hot_zone)
         cmd_functions(args)
         out = capsys.readouterr().err
 
@@ -3196,12 +3061,7 @@ class TestCmdHotspotsStale:
         finish_scan(db, scan_id, 1, 100)
         db.close()
 
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            top=10,
-            json=False,
-            scope="production",
-        )
+        args = _make_hotspots_args(str(tmp_path))
         with patch(
             "weave_quality.__main__._get_current_head",
             return_value="newhead000000000000000000000000000000000000",
@@ -3226,12 +3086,7 @@ class TestCmdHotspotsStale:
         finish_scan(db, scan_id, 1, 100)
         db.close()
 
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            top=10,
-            json=False,
-            scope="production",
-        )
+        args = _make_hotspots_args(str(tmp_path))
         result = cmd_hotspots(args)
         assert result == 0
         out = capsys.readouterr().err
@@ -3277,11 +3132,7 @@ class TestCmdDiffTextOutput:
     ) -> None:
         """Text diff shows Degraded: section when complexity increases."""
         self._two_scan_setup(db, complexity1=10.0, complexity2=30.0)
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            json=False,
-            scope="production",
-        )
+        args = _make_diff_args(str(tmp_path))
         result = cmd_diff(args)
         assert result == 0
         out = capsys.readouterr().err
@@ -3296,11 +3147,7 @@ class TestCmdDiffTextOutput:
     ) -> None:
         """Text diff shows Improved: section when complexity decreases."""
         self._two_scan_setup(db, complexity1=30.0, complexity2=10.0)
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            json=False,
-            scope="production",
-        )
+        args = _make_diff_args(str(tmp_path))
         result = cmd_diff(args)
         assert result == 0
         out = capsys.readouterr().err
@@ -3315,11 +3162,7 @@ class TestCmdDiffTextOutput:
     ) -> None:
         """Text diff shows 'No significant changes' when identical."""
         self._two_scan_setup(db, complexity1=10.0, complexity2=10.0)
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            json=False,
-            scope="production",
-        )
+        args = _make_diff_args(str(tmp_path))
         result = cmd_diff(args)
         assert result == 0
         out = capsys.readouterr().err
@@ -3332,11 +3175,7 @@ class TestCmdDiffTextOutput:
     ) -> None:
         """diff with db but no scan returns exit 1."""
         _ = db
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            json=False,
-            scope="production",
-        )
+        args = _make_diff_args(str(tmp_path))
         result = cmd_diff(args)
         assert result == 1
 
@@ -3366,11 +3205,7 @@ class TestCmdDiffTextOutput:
         finish_scan(db, s2, 2, 100)
         db.close()
 
-        args = argparse.Namespace(
-            hot_zone=str(tmp_path),
-            json=False,
-            scope="production",
-        )
+        args = _make_diff_args(str(tmp_path))
         result = cmd_diff(args)
         assert result == 0
         out = capsys.readouterr().err
@@ -3416,13 +3251,11 @@ class TestCmdPromoteExtended:
         db: sqlite3.Connection,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
+        mock_wv: MagicMock,
     ) -> None:
         """promote --upsert updates an existing promoted node."""
         scan_id = begin_scan(db, str(tmp_path))
-        entries = [
-            _entry("hot.py", scan_id, complexity=60.0),
-            _entry("cold.py", scan_id, complexity=5.0),
-        ]
+        entries = _entries(scan_id, [("hot.py", 60.0), ("cold.py", 5.0)])
         stats = [
             _stats("hot.py", churn=120),
             _stats("cold.py", churn=5),
@@ -3430,13 +3263,12 @@ class TestCmdPromoteExtended:
         _populate_scan(db, scan_id, entries, stats)
         finish_scan(db, scan_id, 2, 100)
 
-        fid = _finding_id("hot.py")
         existing = json.dumps(
             [
                 {
                     "id": "wv-existing",
                     "text": "old node",
-                    "metadata": json.dumps({"quality_finding_id": fid}),
+                    "metadata": json.dumps({"quality_finding_id": _HOT_FID}),
                 }
             ]
         )
@@ -3455,8 +3287,8 @@ class TestCmdPromoteExtended:
                 return 0, existing
             return 0, ""
 
-        with patch("weave_quality.__main__._wv_cmd", side_effect=fake_wv):
-            result = cmd_promote(args)
+        mock_wv.side_effect = fake_wv
+        result = cmd_promote(args)
 
         assert result == 0
         data = json.loads(capsys.readouterr().out)
@@ -3469,13 +3301,11 @@ class TestCmdPromoteExtended:
         db: sqlite3.Connection,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
+        mock_wv: MagicMock,
     ) -> None:
         """promote skips a hotspot if wv add fails."""
         scan_id = begin_scan(db, str(tmp_path))
-        entries = [
-            _entry("err.py", scan_id, complexity=60.0),
-            _entry("low.py", scan_id, complexity=5.0),
-        ]
+        entries = _entries(scan_id, [("err.py", 60.0), ("low.py", 5.0)])
         stats = [
             _stats("err.py", churn=100),
             _stats("low.py", churn=5),
@@ -3492,8 +3322,8 @@ class TestCmdPromoteExtended:
                 return 1, "error: something went wrong"
             return 0, ""
 
-        with patch("weave_quality.__main__._wv_cmd", side_effect=fake_wv):
-            result = cmd_promote(args)
+        mock_wv.side_effect = fake_wv
+        result = cmd_promote(args)
 
         assert result == 0
         data = json.loads(capsys.readouterr().out)
@@ -3504,13 +3334,11 @@ class TestCmdPromoteExtended:
         db: sqlite3.Connection,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
+        mock_wv: MagicMock,
     ) -> None:
         """Text mode: skipped message shown when findings already promoted."""
         scan_id = begin_scan(db, str(tmp_path))
-        entries = [
-            _entry("dup.py", scan_id, complexity=50.0),
-            _entry("other.py", scan_id, complexity=5.0),
-        ]
+        entries = _entries(scan_id, [("dup.py", 50.0), ("other.py", 5.0)])
         stats = [
             _stats("dup.py", churn=80),
             _stats("other.py", churn=5),
@@ -3518,13 +3346,12 @@ class TestCmdPromoteExtended:
         _populate_scan(db, scan_id, entries, stats)
         finish_scan(db, scan_id, 2, 100)
 
-        fid = _finding_id("dup.py")
         existing = json.dumps(
             [
                 {
                     "id": "wv-dup",
                     "text": "old",
-                    "metadata": json.dumps({"quality_finding_id": fid}),
+                    "metadata": json.dumps({"quality_finding_id": _DUP_FID}),
                 }
             ]
         )
@@ -3537,8 +3364,8 @@ class TestCmdPromoteExtended:
             dry_run=False,
             upsert=False,
         )
-        with patch("weave_quality.__main__._wv_cmd", return_value=(0, existing)):
-            result = cmd_promote(args)
+        mock_wv.return_value = (0, existing)
+        result = cmd_promote(args)
 
         assert result == 0
         out = capsys.readouterr().err
@@ -3549,13 +3376,11 @@ class TestCmdPromoteExtended:
         db: sqlite3.Connection,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
+        mock_wv: MagicMock,
     ) -> None:
         """promote --upsert --dry-run prints update plan without calling wv update."""
         scan_id = begin_scan(db, str(tmp_path))
-        entries = [
-            _entry("dry.py", scan_id, complexity=55.0),
-            _entry("low.py", scan_id, complexity=5.0),
-        ]
+        entries = _entries(scan_id, [("dry.py", 55.0), ("low.py", 5.0)])
         stats = [
             _stats("dry.py", churn=90),
             _stats("low.py", churn=5),
@@ -3588,8 +3413,8 @@ class TestCmdPromoteExtended:
                 return 0, existing
             return 0, ""
 
-        with patch("weave_quality.__main__._wv_cmd", side_effect=fake_wv) as mock_wv:
-            result = cmd_promote(args)
+        mock_wv.side_effect = fake_wv
+        result = cmd_promote(args)
 
         assert result == 0
         data = json.loads(capsys.readouterr().out)
@@ -3815,24 +3640,24 @@ class TestCmdPromoteMetadataParsing:
         db: sqlite3.Connection,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
+        mock_wv: MagicMock,
     ) -> None:
         """When metadata is already a dict (not string), branch at line 996 is exercised."""
         self._setup_with_hotspot(db, "hot.py")
-        fid = _finding_id("hot.py")
         # metadata is a dict, not a JSON string
         existing = json.dumps(
             [
                 {
                     "id": "wv-dictmeta",
                     "text": "old",
-                    "metadata": {"quality_finding_id": fid},
+                    "metadata": {"quality_finding_id": _HOT_FID},
                 }
             ]
         )
 
         args = _make_promote_args(str(tmp_path), top=5, json_out=True)
-        with patch("weave_quality.__main__._wv_cmd", return_value=(0, existing)):
-            result = cmd_promote(args)
+        mock_wv.return_value = (0, existing)
+        result = cmd_promote(args)
 
         assert result == 0
         data = json.loads(capsys.readouterr().out)
@@ -3843,15 +3668,14 @@ class TestCmdPromoteMetadataParsing:
         db: sqlite3.Connection,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
+        mock_wv: MagicMock,
     ) -> None:
         """Malformed JSON in node list doesn't crash (exception caught at line 1000)."""
         self._setup_with_hotspot(db, "hot2.py")
         # Return invalid JSON from wv list
         args = _make_promote_args(str(tmp_path), top=5, json_out=True)
-        with patch(
-            "weave_quality.__main__._wv_cmd", return_value=(0, "not valid json")
-        ):
-            result = cmd_promote(args)
+        mock_wv.return_value = (0, "not valid json")
+        result = cmd_promote(args)
 
         assert result == 0
 
@@ -3860,6 +3684,7 @@ class TestCmdPromoteMetadataParsing:
         db: sqlite3.Connection,
         tmp_path: Path,
         capsys: pytest.CaptureFixture[str],
+        mock_wv: MagicMock,
     ) -> None:
         """Text mode with upsert shows 'Updated N existing findings' (line 1111)."""
         self._setup_with_hotspot(db, "upd.py")
@@ -3888,8 +3713,8 @@ class TestCmdPromoteMetadataParsing:
                 return 0, existing
             return 0, ""
 
-        with patch("weave_quality.__main__._wv_cmd", side_effect=fake_wv):
-            result = cmd_promote(args)
+        mock_wv.side_effect = fake_wv
+        result = cmd_promote(args)
 
         assert result == 0
         out = capsys.readouterr().err
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import dataclasses
 import sqlite3
 from collections.abc import Generator
 from pathlib import Path
@@ -11,6 +12,9 @@ from pathlib import Path
 import pytest
 
 from weave_quality.db import (
+    _FILE_ENTRY_COLUMNS,
+    _GIT_STATS_COLUMNS,
+    _apply_schema,
     begin_scan,
     bulk_insert_pattern_findings,
     bulk_upsert_co_changes,
@@ -57,14 +61,53 @@ from weave_quality.models import (
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def schema_template() -> Generator[sqlite3.Connection, None, None]:
+    """Empty in-memory quality.db with the full schema and migrations applied once."""
+    conn = sqlite3.connect(":memory:")
+    _apply_schema(conn)
+    yield conn
+    conn.close()
+
+
 @pytest.fixture()
-def db(tmp_path: Path) -> Generator[sqlite3.Connection, None, None]:
-    """Fresh quality.db in a temp directory."""
-    conn = init_db(hot_zone=str(tmp_path))
+def db(schema_template: sqlite3.Connection) -> Generator[sqlite3.Connection, None, None]:
+    """Fresh in-memory quality.db cloned from the schema template.
+
+    On-disk behaviour (path resolution, reopening) is covered by the tests
+    that call init_db with tmp_path directly.
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    schema_template.backup(conn)
+    # Connection-level setting; backup() copies pages, not PRAGMA state
+    conn.execute("PRAGMA foreign_keys = ON")
     yield conn
     conn.close()
 
 
+_SQL_TABLES = "SELECT name FROM sqlite_master WHERE type='table'"
+
+
+def _tables(conn: sqlite3.Connection) -> set[str]:
+    """Names of all tables in the database."""
+    return {r[0] for r in conn.execute(_SQL_TABLES)}
+
+
+def _columns(conn: sqlite3.Connection, table: str) -> set[str]:
+    """Column names of ``table`` (PRAGMA arguments cannot be bound)."""
+    return {r[1] for r in conn.execute(f"PRAGMA table_info({table})")}
+
+
+def _seed_scans(db: sqlite3.Connection, heads: list[str]) -> list[int]:
+    """begin_scan once per head, in order; returns the new scan ids.
+
+    Does not commit -- callers wrap it in ``with db:`` alongside their
+    other setup writes.
+    """
+    return [begin_scan(db, h) for h in heads]
+
+
 # ---------------------------------------------------------------------------
 # Schema
 # ---------------------------------------------------------------------------
@@ -72,39 +115,48 @@ def db(tmp_path: Path) -> Generator[sqlite3.Connection, None, None]:
 
 class TestSchema:
     def test_init_creates_tables(self, db: sqlite3.Connection) -> None:
-        tables = {
-            row[0]
-            for row in db.execute(
-                "SELECT name FROM sqlite_master WHERE type='table'"
-            ).fetchall()
-        }
-        expected = {
+        expected = (
             "scan_meta",
             "files",
             "file_metrics",
             "git_stats",
             "co_change",
             "file_state",
-        }
-        assert expected.issubset(tables)
-
-    def test_init_idempotent(self, db: sqlite3.Connection, tmp_path: Path) -> None:
-        # db fixture ensures first init_db ran; second call tests idempotency
-        _ = db
-        conn2 = init_db(hot_zone=str(tmp_path))
+        )
+        placeholders = ",".join("?" * len(expected))
         tables = {
             row[0]
-            for row in conn2.execute(
-                "SELECT name FROM sqlite_master WHERE type='table'"
-            ).fetchall()
+            for row in db.execute(
+                "SELECT name FROM sqlite_master "
+                f"WHERE type='table' AND name IN ({placeholders})",
+                expected,
+            )
         }
-        assert "scan_meta" in tables
+        assert tables == set(expected)
+
+    def test_init_idempotent(self, tmp_path: Path) -> None:
+        init_db(hot_zone=str(tmp_path)).close()
+        conn2 = init_db(hot_zone=str(tmp_path))
+        row = conn2.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='scan_meta'"
+        ).fetchone()
+        assert row is not None
         conn2.close()
 
     def test_foreign_keys_on(self, db: sqlite3.Connection) -> None:
         val = db.execute("PRAGMA foreign_keys").fetchone()[0]
         assert val == 1
 
+    @pytest.mark.parametrize(
+        "columns, model",
+        [(_FILE_ENTRY_COLUMNS, FileEntry), (_GIT_STATS_COLUMNS, GitStats)],
+        ids=["files", "git_stats"],
+    )
+    def test_select_columns_follow_model_fields(self, columns: str, model: type) -> None:
+        """Read paths build models positionally, so column order must match."""
+        names = [c.strip() for c in columns.split(",")]
+        assert names == [f.name for f in dataclasses.fields(model)]
+
 
 # ---------------------------------------------------------------------------
 # Scan lifecycle
@@ -143,8 +195,8 @@ class TestScanLifecycle:
 
     def test_retention_prunes_old(self, db: sqlite3.Connection) -> None:
         # _MAX_SCANS = 5 — need 6 scans to trigger prune
-        for _, h in enumerate(["h1", "h2", "h3", "h4", "h5", "h6"]):
-            begin_scan(db, h)
+        with db:
+            _seed_scans(db, ["h1", "h2", "h3", "h4", "h5", "h6"])
         count = db.execute("SELECT COUNT(*) FROM scan_meta").fetchone()[0]
         assert count == 5
         sm = latest_scan(db)
@@ -152,14 +204,15 @@ class TestScanLifecycle:
         assert sm.git_head == "h6"
 
     def test_cascade_deletes_files(self, db: sqlite3.Connection) -> None:
-        sid1 = begin_scan(db, "head1")
-        upsert_file_entry(db, FileEntry(path="a.py", scan_id=sid1, loc=10))
-        db.commit()
-        begin_scan(db, "head2")
-        begin_scan(db, "head3")
+        with db:
+            sid1 = begin_scan(db, "head1")
+            upsert_file_entry(db, FileEntry(path="a.py", scan_id=sid1, loc=10))
+            _seed_scans(db, ["head2", "head3"])
         # scan1 pruned, its files should be gone
-        rows = db.execute("SELECT * FROM files WHERE scan_id = ?", (sid1,)).fetchall()
-        assert len(rows) == 0
+        exists = db.execute(
+            "SELECT EXISTS(SELECT 1 FROM files WHERE scan_id = ?)", (sid1,)
+        ).fetchone()[0]
+        assert exists == 0
 
 
 # ---------------------------------------------------------------------------
@@ -200,18 +253,18 @@ class TestFileEntries:
 
     def test_get_by_path(self, db: sqlite3.Connection) -> None:
         sid = begin_scan(db, "abc123")
-        upsert_file_entry(db, FileEntry(path="a.py", scan_id=sid, loc=10))
-        upsert_file_entry(db, FileEntry(path="b.py", scan_id=sid, loc=20))
-        db.commit()
+        with db:
+            upsert_file_entry(db, FileEntry(path="a.py", scan_id=sid, loc=10))
+            upsert_file_entry(db, FileEntry(path="b.py", scan_id=sid, loc=20))
         results = get_file_entries(db, sid, path="a.py")
         assert len(results) == 1
         assert results[0].loc == 10
 
     def test_upsert_updates_existing(self, db: sqlite3.Connection) -> None:
         sid = begin_scan(db, "abc123")
-        upsert_file_entry(db, FileEntry(path="a.py", scan_id=sid, loc=10))
-        upsert_file_entry(db, FileEntry(path="a.py", scan_id=sid, loc=99))
-        db.commit()
+        with db:
+            upsert_file_entry(db, FileEntry(path="a.py", scan_id=sid, loc=10))
+            upsert_file_entry(db, FileEntry(path="a.py", scan_id=sid, loc=99))
         results = get_file_entries(db, sid)
         assert len(results) == 1
         assert results[0].loc == 99
@@ -397,7 +450,7 @@ class TestSchemaV2:
         self,
         db: sqlite3.Connection,
     ) -> None:
-        cols = {r[1] for r in db.execute("PRAGMA table_info(files)").fetchall()}
+        cols = _columns(db, "files")
         assert "essential_complexity" in cols
         assert "indent_sd" in cols
 
@@ -405,19 +458,14 @@ class TestSchemaV2:
         self,
         db: sqlite3.Connection,
     ) -> None:
-        cols = {r[1] for r in db.execute("PRAGMA table_info(file_metrics)").fetchall()}
+        cols = _columns(db, "file_metrics")
         assert "detail" in cols
 
     def test_complexity_trend_table_exists(
         self,
         db: sqlite3.Connection,
     ) -> None:
-        tables = {
-            r[0]
-            for r in db.execute(
-                "SELECT name FROM sqlite_master WHERE type='table'"
-            ).fetchall()
-        }
+        tables = _tables(db)
         assert "complexity_trend" in tables
 
     def test_migration_idempotent(
@@ -428,7 +476,7 @@ class TestSchemaV2:
         conn1 = init_db(hot_zone=str(tmp_path))
         conn1.close()
         conn2 = init_db(hot_zone=str(tmp_path))
-        cols = {r[1] for r in conn2.execute("PRAGMA table_info(files)").fetchall()}
+        cols = _columns(conn2, "files")
         assert "essential_complexity" in cols
         conn2.close()
 
@@ -617,15 +665,13 @@ class TestComplexityTrend:
         db: sqlite3.Connection,
     ) -> None:
         """Pruning old scans cascades to complexity_trend."""
-        s1 = begin_scan(db, "aaa")
-        upsert_complexity_trend(db, "a.py", s1, 20.0, 5.0)
-        db.commit()
-        s2 = begin_scan(db, "bbb")
-        upsert_complexity_trend(db, "a.py", s2, 18.0, 4.0)
-        db.commit()
-        # Need 6 scans total to push s1 beyond _MAX_SCANS=5
-        for h in ["ccc", "ddd", "eee", "fff"]:
-            begin_scan(db, h)
+        with db:
+            s1 = begin_scan(db, "aaa")
+            upsert_complexity_trend(db, "a.py", s1, 20.0, 5.0)
+            s2 = begin_scan(db, "bbb")
+            upsert_complexity_trend(db, "a.py", s2, 18.0, 4.0)
+            # Need 6 scans total to push s1 beyond _MAX_SCANS=5
+            _seed_scans(db, ["ccc", "ddd", "eee", "fff"])
         rows = db.execute(
             "SELECT scan_id FROM complexity_trend WHERE path = ?",
             ("a.py",),
@@ -647,23 +693,20 @@ class TestSplitRetention:
 
     def test_files_pruned_at_two_scans(self, db: sqlite3.Connection) -> None:
         """After 3 scans, scan-1 files should be gone (files window = 2)."""
-        s1 = begin_scan(db, "s1")
-        upsert_file_entry(db, FileEntry(path="a.py", scan_id=s1, loc=10))
-        db.commit()
-        begin_scan(db, "s2")
-        begin_scan(db, "s3")
+        with db:
+            s1 = begin_scan(db, "s1")
+            upsert_file_entry(db, FileEntry(path="a.py", scan_id=s1, loc=10))
+            _seed_scans(db, ["s2", "s3"])
 
         rows = db.execute("SELECT * FROM files WHERE scan_id = ?", (s1,)).fetchall()
         assert len(rows) == 0, "scan-1 file row should be pruned after 3 scans"
 
     def test_complexity_trend_retains_five_scans(self, db: sqlite3.Connection) -> None:
         """complexity_trend keeps up to _MAX_SCANS=5 even when files are pruned."""
-        scans = []
-        for i, h in enumerate(["a", "b", "c", "d", "e"]):
-            sid = begin_scan(db, h)
-            upsert_complexity_trend(db, "x.py", sid, float(i), 1.0)
-            db.commit()
-            scans.append(sid)
+        with db:
+            for i, h in enumerate(["a", "b", "c", "d", "e"]):
+                sid = begin_scan(db, h)
+                upsert_complexity_trend(db, "x.py", sid, float(i), 1.0)
 
         rows = db.execute(
             "SELECT scan_id FROM complexity_trend WHERE path = ? ORDER BY scan_id",
@@ -674,11 +717,8 @@ class TestSplitRetention:
 
     def test_scan_meta_retains_five_then_prunes(self, db: sqlite3.Connection) -> None:
         """Six scans: scan_meta should keep exactly 5 (oldest dropped)."""
-        first = None
-        for _, h in enumerate(["h1", "h2", "h3", "h4", "h5", "h6"]):
-            sid = begin_scan(db, h)
-            if first is None:
-                first = sid
+        with db:
+            first = _seed_scans(db, ["h1", "h2", "h3", "h4", "h5", "h6"])[0]
         count = db.execute("SELECT COUNT(*) FROM scan_meta").fetchone()[0]
         assert count == 5
         # Oldest scan should be gone
@@ -707,43 +747,36 @@ class TestSplitRetention:
 class TestComputeTrendDirection:
     """Unit tests for compute_trend_direction slope classification."""
 
-    def test_stable_single_point(self) -> None:
-        """Single data point returns stable."""
-        assert compute_trend_direction([42.0]) == "stable"
-
-    def test_stable_empty(self) -> None:
-        """Empty list returns stable."""
-        assert compute_trend_direction([]) == "stable"
-
-    def test_stable_no_change(self) -> None:
-        """Flat complexity series is stable."""
-        assert compute_trend_direction([20.0, 20.0, 20.0]) == "stable"
-
-    def test_stable_small_increase(self) -> None:
-        """Tiny relative slope (< 3%) stays stable."""
-        # +0.1 per scan relative to mean 100 = 0.1% -- well within stable band
-        assert compute_trend_direction([100.0, 100.1, 100.2]) == "stable"
-
-    def test_deteriorating_two_points(self) -> None:
-        """Two points: clear upward slope marks deteriorating."""
-        # slope = 10 / mean 15 = 67% per scan
-        assert compute_trend_direction([10.0, 20.0]) == "deteriorating"
-
-    def test_deteriorating_multi_scan(self) -> None:
-        """Rising complexity over multiple scans is deteriorating."""
-        assert compute_trend_direction([10.0, 15.0, 20.0, 25.0]) == "deteriorating"
-
-    def test_refactored_two_points(self) -> None:
-        """Two points: clear downward slope marks refactored."""
-        assert compute_trend_direction([20.0, 10.0]) == "refactored"
-
-    def test_refactored_multi_scan(self) -> None:
-        """Falling complexity over multiple scans is refactored."""
-        assert compute_trend_direction([80.0, 60.0, 40.0, 20.0]) == "refactored"
-
-    def test_zero_mean_returns_stable(self) -> None:
-        """Zero mean guard: no division by zero."""
-        assert compute_trend_direction([0.0, 0.0]) == "stable"
+    @pytest.mark.parametrize(
+        ("series", "expected"),
+        [
+            ([42.0], "stable"),
+            ([], "stable"),
+            ([20.0, 20.0, 20.0], "stable"),
+            # +0.1 per scan relative to mean 100 = 0.1% -- well within stable band
+            ([100.0, 100.1, 100.2], "stable"),
+            # slope = 10 / mean 15 = 67% per scan
+            ([10.0, 20.0], "deteriorating"),
+            ([10.0, 15.0, 20.0, 25.0], "deteriorating"),
+            ([20.0, 10.0], "refactored"),
+            ([80.0, 60.0, 40.0, 20.0], "refactored"),
+            # Zero mean guard: no division by zero
+            ([0.0, 0.0], "stable"),
+        ],
+        ids=[
+            "single_point",
+            "empty",
+            "no_change",
+            "small_increase",
+            "rising_two_points",
+            "rising_multi_scan",
+            "falling_two_points",
+            "falling_multi_scan",
+            "zero_mean",
+        ],
+    )
+    def test_classifies_series(self, series: list[float], expected: str) -> None:
+        assert compute_trend_direction(series) == expected
 
 
 class TestGetAllTrendDirections:
@@ -754,47 +787,41 @@ class TestGetAllTrendDirections:
         result = get_all_trend_directions(db)
         assert result == {}
 
-    def test_single_file_stable(self, db: sqlite3.Connection) -> None:
-        """A file with identical complexity across scans is stable."""
-        s1 = begin_scan(db, "h1")
-        s2 = begin_scan(db, "h2")
-        upsert_complexity_trend(db, "a.py", s1, 30.0, 2.0)
-        upsert_complexity_trend(db, "a.py", s2, 30.0, 2.0)
-        db.commit()
-        result = get_all_trend_directions(db)
-        assert result["a.py"] == "stable"
-
-    def test_single_file_deteriorating(self, db: sqlite3.Connection) -> None:
-        """A file with rising complexity is deteriorating."""
-        s1 = begin_scan(db, "h1")
-        s2 = begin_scan(db, "h2")
-        upsert_complexity_trend(db, "a.py", s1, 10.0, 1.0)
-        upsert_complexity_trend(db, "a.py", s2, 30.0, 3.0)
-        db.commit()
-        result = get_all_trend_directions(db)
-        assert result["a.py"] == "deteriorating"
-
-    def test_single_file_refactored(self, db: sqlite3.Connection) -> None:
-        """A file with falling complexity is refactored."""
-        s1 = begin_scan(db, "h1")
-        s2 = begin_scan(db, "h2")
-        upsert_complexity_trend(db, "a.py", s1, 50.0, 5.0)
-        upsert_complexity_trend(db, "a.py", s2, 10.0, 1.0)
-        db.commit()
+    @pytest.mark.parametrize(
+        ("first", "second", "expected"),
+        [
+            ((30.0, 2.0), (30.0, 2.0), "stable"),
+            ((10.0, 1.0), (30.0, 3.0), "deteriorating"),
+            ((50.0, 5.0), (10.0, 1.0), "refactored"),
+        ],
+        ids=["stable", "deteriorating", "refactored"],
+    )
+    def test_single_file(
+        self,
+        db: sqlite3.Connection,
+        first: tuple[float, float],
+        second: tuple[float, float],
+        expected: str,
+    ) -> None:
+        """A file's direction follows its complexity across two scans."""
+        with db:
+            s1, s2 = _seed_scans(db, ["h1", "h2"])
+            upsert_complexity_trend(db, "a.py", s1, *first)
+            upsert_complexity_trend(db, "a.py", s2, *second)
         result = get_all_trend_directions(db)
-        assert result["a.py"] == "refactored"
+        assert result["a.py"] == expected
 
     def test_multiple_files_independent(self, db: sqlite3.Connection) -> None:
         """Different files can have different trend directions."""
-        s1 = begin_scan(db, "h1")
-        s2 = begin_scan(db, "h2")
-        upsert_complexity_trend(db, "rising.py", s1, 10.0, 0.0)
-        upsert_complexity_trend(db, "rising.py", s2, 40.0, 0.0)
-        upsert_complexity_trend(db, "falling.py", s1, 80.0, 0.0)
-        upsert_complexity_trend(db, "falling.py", s2, 20.0, 0.0)
-        upsert_complexity_trend(db, "flat.py", s1, 25.0, 0.0)
-        upsert_complexity_trend(db, "flat.py", s2, 25.0, 0.0)
-        db.commit()
+        with db:
+            s1 = begin_scan(db, "h1")
+            s2 = begin_scan(db, "h2")
+            upsert_complexity_trend(db, "rising.py", s1, 10.0, 0.0)
+            upsert_complexity_trend(db, "rising.py", s2, 40.0, 0.0)
+            upsert_complexity_trend(db, "falling.py", s1, 80.0, 0.0)
+            upsert_complexity_trend(db, "falling.py", s2, 20.0, 0.0)
+            upsert_complexity_trend(db, "flat.py", s1, 25.0, 0.0)
+            upsert_complexity_trend(db, "flat.py", s2, 25.0, 0.0)
         result = get_all_trend_directions(db)
         assert result["rising.py"] == "deteriorating"
         assert result["falling.py"] == "refactored"
@@ -812,7 +839,7 @@ class TestSchemaV3:
         db: sqlite3.Connection,
     ) -> None:
         """A freshly initialised DB has a category column in files."""
-        cols = {r[1] for r in db.execute("PRAGMA table_info(files)").fetchall()}
+        cols = _columns(db, "files")
         assert "category" in cols
 
     def test_category_default_is_production(
@@ -882,7 +909,7 @@ class TestSchemaV3:
 
         # Now run init_db which should apply _migrate_v3
         conn = init_db(hot_zone=str(tmp_path))
-        cols = {r[1] for r in conn.execute("PRAGMA table_info(files)").fetchall()}
+        cols = _columns(conn, "files")
         conn.close()
         assert "category" in cols
 
@@ -894,7 +921,7 @@ class TestSchemaV3:
         conn1 = init_db(hot_zone=str(tmp_path))
         conn1.close()
         conn2 = init_db(hot_zone=str(tmp_path))
-        cols = {r[1] for r in conn2.execute("PRAGMA table_info(files)").fetchall()}
+        cols = _columns(conn2, "files")
         conn2.close()
         assert "category" in cols
 
@@ -906,7 +933,7 @@ class TestSchemaV3:
 
 class TestSchemaV5:
     def test_new_db_has_bash_cc_backend(self, db: sqlite3.Connection) -> None:
-        cols = {r[1] for r in db.execute("PRAGMA table_info(scan_meta)").fetchall()}
+        cols = _columns(db, "scan_meta")
         assert "bash_cc_backend" in cols
 
     def test_begin_scan_stores_backend(self, db: sqlite3.Connection) -> None:
@@ -934,17 +961,14 @@ class TestSchemaV5:
         raw.commit()
         raw.close()
         conn = init_db(hot_zone=str(tmp_path))
-        cols = {r[1] for r in conn.execute("PRAGMA table_info(scan_meta)").fetchall()}
+        cols = _columns(conn, "scan_meta")
         conn.close()
         assert "bash_cc_backend" in cols
 
 
 class TestSchemaV6:
     def test_new_db_has_pattern_findings_table(self, db: sqlite3.Connection) -> None:
-        tables = {
-            r[0]
-            for r in db.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
-        }
+        tables = _tables(db)
         assert "pattern_findings" in tables
 
     def test_bulk_insert_and_query(self, db: sqlite3.Connection) -> None:
@@ -1022,10 +1046,7 @@ class TestSchemaV6:
         raw.commit()
         raw.close()
         conn = init_db(hot_zone=str(tmp_path))
-        tables = {
-            r[0]
-            for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
-        }
+        tables = _tables(conn)
         conn.close()
         assert "pattern_findings" in tables
 
@@ -1050,7 +1071,7 @@ class TestSchemaV6:
 
 class TestSchemaV7:
     def test_new_db_has_ts_cc_backend(self, db: sqlite3.Connection) -> None:
-        cols = {r[1] for r in db.execute("PRAGMA table_info(scan_meta)").fetchall()}
+        cols = _columns(db, "scan_meta")
         assert "ts_cc_backend" in cols
 
     def test_begin_scan_stores_ts_backend(self, db: sqlite3.Connection) -> None:
@@ -1110,6 +1131,40 @@ class TestSchemaV7:
         raw.commit()
         raw.close()
         conn = init_db(hot_zone=str(tmp_path))
-        cols = {r[1] for r in conn.execute("PRAGMA table_info(scan_meta)").fetchall()}
+        cols = _columns(conn, "scan_meta")
         conn.close()
         assert "ts_cc_backend" in cols
+
+
+# ---------------------------------------------------------------------------
+# Schema v8 migration (covering file_metrics index)
+# ---------------------------------------------------------------------------
+
+
+class TestSchemaV8:
+    def test_ck_lookup_uses_covering_index(self, db: sqlite3.Connection) -> None:
+        plan = " ".join(
+            str(r[3])
+            for r in db.execute(
+                "EXPLAIN QUERY PLAN SELECT path, scan_id, metric, value "
+                "FROM file_metrics WHERE scan_id = ? AND path = ?",
+                (1, "a.py"),
+            )
+        )
+        assert "COVERING INDEX idx_fm_scan_path" in plan
+
+    def test_migration_drops_old_scan_index(self, tmp_path: Path) -> None:
+        conn = init_db(hot_zone=str(tmp_path))
+        conn.execute("CREATE INDEX idx_fm_scan ON file_metrics(scan_id)")
+        conn.commit()
+        conn.close()
+        conn = init_db(hot_zone=str(tmp_path))
+        indexes = {
+            r[0]
+            for r in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='file_metrics'"
+            )
+        }
+        conn.close()
+        assert "idx_fm_scan" not in indexes
+        assert "idx_fm_scan_path" in indexes
@@ -6,24 +6,28 @@ from __future__ import annotations
 
 import ast
 import textwrap
+import threading
 from pathlib import Path
 
 import pytest
 
+from weave_quality import python_parser
 from weave_quality.python_parser import (
+    _ComplexityVisitor,
     _ast_ck_metrics,
-    _ast_complexity,
     _ast_essential_complexity,
     _ast_file_essential_complexity,
-    _ast_function_count,
-    _ast_function_lengths,
-    _ast_nesting_depth,
     _ast_per_function_cc,
+    _ast_scalar_metrics,
+    _code_line_indents,
     _compute_lcom,
     _indent_sd,
     _is_dispatch_function,
+    _iter_nodes,
+    _regex_analyze,
     _single_pass_ast,
     analyze_python_file,
+    analyze_python_files,
     analyze_python_source,
 )
 
@@ -40,6 +44,18 @@ def _src(code: str) -> str:
     return textwrap.dedent(code).lstrip()
 
 
+def _write_modules(tmp_path: Path, count: int) -> list[Path]:
+    """Write ``count`` small one-class modules and return their paths."""
+    paths = []
+    for i in range(count):
+        target = tmp_path / f"mod{i}.py"
+        target.write_text(
+            f"class C{i}:\n    def m(self):\n        if self.x:\n            return {i}\n"
+        )
+        paths.append(target)
+    return paths
+
+
 # ---------------------------------------------------------------------------
 # AST path (primary)
 # ---------------------------------------------------------------------------
@@ -162,6 +178,21 @@ class TestCKMetrics:
         if ck is not None:
             assert "wmc" not in ck.metrics
 
+    def test_compute_ck_false_skips_ck(self) -> None:
+        source = _src("""
+            class MyClass:
+                def method(self) -> int:
+                    if self.x:
+                        return 1
+                    return 0
+        """)
+        full_entry, full_ck, full_fn = analyze_python_source(source, "test.py")
+        entry, ck, fn = analyze_python_source(source, "test.py", compute_ck=False)
+        assert full_ck is not None
+        assert ck is None
+        assert entry == full_entry
+        assert fn == full_fn
+
     def test_lcom_high_cohesion(self) -> None:
         source = _src("""
             class Cohesive:
@@ -266,6 +297,58 @@ class TestFileAnalysis:
         assert entry.loc == 0
         assert ck is None
 
+    def test_analyze_files_parallel_matches_serial(self, tmp_path: Path) -> None:
+        paths = _write_modules(tmp_path, 40)
+        paths.append(tmp_path / "missing.py")
+        serial = analyze_python_files(paths, scan_id=3, workers=1)
+        parallel = analyze_python_files(paths, scan_id=3, workers=2)
+        assert parallel == serial
+        assert [r[0].path for r in parallel] == [str(p) for p in paths]
+        assert parallel[0][0].scan_id == 3
+        assert parallel[-1][0].loc == 0  # unreadable file → empty entry, same as serial
+
+    def test_analyze_files_parallel_with_live_thread(self, tmp_path: Path) -> None:
+        """cmd_scan runs git threads alongside analysis; the pool must still work."""
+        paths = _write_modules(tmp_path, 40)
+        release = threading.Event()
+        worker = threading.Thread(target=release.wait, daemon=True)
+        worker.start()
+        try:
+            parallel = analyze_python_files(paths, workers=2)
+        finally:
+            release.set()
+            worker.join()
+        assert parallel == analyze_python_files(paths, workers=1)
+
+    def test_default_workers_capped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv(python_parser._WORKERS_ENV, raising=False)
+        monkeypatch.setattr(python_parser.os, "cpu_count", lambda: 64)
+        assert python_parser._default_workers() == python_parser._MAX_WORKERS
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [("1", 1), (" 3 ", 3), ("many", 2)],
+        ids=["serial", "explicit", "invalid_falls_back"],
+    )
+    def test_default_workers_env(
+        self, monkeypatch: pytest.MonkeyPatch, raw: str, expected: int
+    ) -> None:
+        monkeypatch.setenv(python_parser._WORKERS_ENV, raw)
+        monkeypatch.setattr(python_parser.os, "cpu_count", lambda: 2)
+        assert python_parser._default_workers() == expected
+
+    def test_env_opt_out_skips_pool(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv(python_parser._WORKERS_ENV, "1")
+
+        def _no_pool(*_args: object, **_kwargs: object) -> None:
+            raise AssertionError("process pool started despite WV_QUALITY_WORKERS=1")
+
+        monkeypatch.setattr(python_parser, "ProcessPoolExecutor", _no_pool)
+        results = analyze_python_files(_write_modules(tmp_path, 40))
+        assert len(results) == 40
+
 
 # ---------------------------------------------------------------------------
 # Per-function CC (Sprint 1)
@@ -593,6 +676,10 @@ class TestIndentSD:
         sd2 = _indent_sd(lines_without)
         assert sd1 == sd2
 
+    def test_code_line_indents_skip_blank_and_comment_lines(self) -> None:
+        lines = ["def f():", "", "    # note", "    if x:", "\t\treturn 1", "   "]
+        assert _code_line_indents(lines) == [0, 4, 2]
+
     def test_fewer_than_two_lines_returns_zero(self) -> None:
         assert _indent_sd([]) == 0.0
         assert _indent_sd(["x = 1"]) == 0.0
@@ -634,7 +721,7 @@ class TestSinglePassAST:
     """Tests for _single_pass_ast — consolidated single-walk visitor."""
 
     def test_matches_old_complexity(self) -> None:
-        """Total complexity must match _ast_complexity (full-tree visitor)."""
+        """Total complexity must match _ast_scalar_metrics (full-tree visitor)."""
         source = textwrap.dedent("""\
             def foo(x):
                 if x > 0:
@@ -656,7 +743,7 @@ class TestSinglePassAST:
         assert result.total_complexity == 4.0
 
     def test_matches_old_nesting(self) -> None:
-        """Max nesting must match _ast_nesting_depth."""
+        """Max nesting must match _ast_scalar_metrics."""
         source = textwrap.dedent("""\
             def deep():
                 if True:
@@ -695,6 +782,30 @@ class TestSinglePassAST:
         result = _single_pass_ast(tree)
         assert result.imports == {"os", "pathlib", "json"}
 
+    def test_nested_defs_collected_in_source_order(self) -> None:
+        """Functions, classes and imports nested anywhere are collected in one pass."""
+        source = textwrap.dedent("""\
+            def outer():
+                import json
+
+                def inner():
+                    pass
+
+                class Local:
+                    def method(self):
+                        pass
+
+            def last():
+                pass
+        """)
+        tree = ast.parse(source)
+        result = _single_pass_ast(tree)
+        names = [f.name for f in result.functions]
+        assert names == ["outer", "inner", "method", "last"]
+        assert [c.name for c in result.class_nodes] == ["Local"]
+        assert result.imports == {"json"}
+        assert [f.name for f in result.functions if f.parent_is_class] == ["method"]
+
     def test_class_methods_flagged(self) -> None:
         """parent_is_class=True for direct class methods, False for top-level."""
         source = textwrap.dedent("""\
@@ -788,7 +899,7 @@ class TestSinglePassAST:
 
 
 class TestPrivateAstHelpers:
-    def test_ast_function_lengths(self) -> None:
+    def test_ast_scalar_metrics_function_lengths(self) -> None:
         source = _src("""
             def short():
                 pass
@@ -799,11 +910,11 @@ class TestPrivateAstHelpers:
                 return x + y
         """)
         tree = ast.parse(source)
-        lengths = _ast_function_lengths(tree)
-        assert len(lengths) == 2
-        assert all(n > 0 for n in lengths)
+        _cc, _nesting, count, lengths = _ast_scalar_metrics(tree)
+        assert count == 2
+        assert lengths == [2, 4]
 
-    def test_ast_nesting_depth(self) -> None:
+    def test_ast_scalar_metrics_nesting_depth(self) -> None:
         source = _src("""
             def f():
                 if True:
@@ -811,9 +922,9 @@ class TestPrivateAstHelpers:
                         pass
         """)
         tree = ast.parse(source)
-        assert _ast_nesting_depth(tree) >= 2
+        assert _ast_scalar_metrics(tree)[1] >= 2
 
-    def test_ast_complexity(self) -> None:
+    def test_ast_scalar_metrics_complexity(self) -> None:
         source = _src("""
             def f(x):
                 if x > 0:
@@ -822,12 +933,31 @@ class TestPrivateAstHelpers:
         """)
         tree = ast.parse(source)
         # base(1) + if(1) = 2
-        assert _ast_complexity(tree) >= 2.0
+        assert _ast_scalar_metrics(tree)[0] >= 2.0
 
-    def test_ast_function_count(self) -> None:
+    def test_ast_scalar_metrics_function_count(self) -> None:
         source = "def a(): pass\ndef b(): pass\n"
         tree = ast.parse(source)
-        assert _ast_function_count(tree) == 2
+        assert _ast_scalar_metrics(tree)[2] == 2
+
+    def test_ast_scalar_metrics_match_single_pass(self) -> None:
+        source = _src("""
+            class A:
+                def m(self, x):
+                    if x:
+                        for i in x:
+                            pass
+            def g():
+                return [y for y in range(3) if y]
+        """)
+        tree = ast.parse(source)
+        analysis = _single_pass_ast(tree)
+        cc, nesting, count, _lengths = _ast_scalar_metrics(tree)
+        assert (cc, nesting, count) == (
+            analysis.total_complexity,
+            analysis.max_nesting,
+            analysis.function_count,
+        )
 
     def test_ast_file_essential_complexity_with_functions(self) -> None:
         source = _src("""
@@ -844,6 +974,43 @@ class TestPrivateAstHelpers:
         tree = ast.parse("x = 1\n")
         assert _ast_file_essential_complexity(tree) == 1.0
 
+    def test_complexity_visitor_reset_clears_state(self) -> None:
+        tree = ast.parse(
+            _src("""
+            def branchy(self, x):
+                if x and self.y:
+                    call()
+        """)
+        )
+        fn = tree.body[0]
+        visitor = _ComplexityVisitor(per_function=True)
+        visitor.visit(fn.body[0])
+        assert visitor.complexity == 3
+        visitor.reset()
+        state = (visitor.complexity, visitor.max_nesting, visitor.call_count)
+        assert state == (1, 0, 0)
+        assert not visitor.self_attrs
+        visitor.visit(fn.body[0])
+        assert visitor.complexity == 3
+        assert visitor.self_attrs == {"y"}
+
+    def test_iter_nodes_matches_ast_walk(self) -> None:
+        """_iter_nodes yields the same nodes as ast.walk, in source pre-order."""
+        source = _src("""
+            class A:
+                def first(self):
+                    return [x for x in self.items if x]
+
+            def second():
+                pass
+        """)
+        tree = ast.parse(source)
+        nodes = list(_iter_nodes(tree))
+        assert sorted(map(id, nodes)) == sorted(map(id, ast.walk(tree)))
+        assert nodes[0] is tree
+        names = [n.name for n in nodes if isinstance(n, ast.FunctionDef)]
+        assert names == ["first", "second"]
+
 
 # ---------------------------------------------------------------------------
 # _ast_ck_metrics — standalone (analysis=None) path
@@ -885,6 +1052,30 @@ class TestAstCkMetricsStandalone:
         assert "wmc" in ck.metrics
         assert ck.metrics["wmc"] >= 2.0  # method_a CC=2, method_b CC=1
 
+    def test_standalone_matches_single_pass_with_nested_defs(self) -> None:
+        """Fused class walk yields the same CK metrics as the ASTAnalysis path."""
+        source = _src("""
+            import os
+
+            class Holder:
+                def outer(self):
+                    def helper():
+                        return self.hidden
+                    return helper()
+
+                def other(self):
+                    return self.hidden + len(os.sep)
+        """)
+        tree = ast.parse(source)
+        standalone = _ast_ck_metrics(tree, "test.py")
+        primary = _ast_ck_metrics(tree, "test.py", analysis=_single_pass_ast(tree))
+        assert standalone is not None and primary is not None
+        assert standalone.metrics == primary.metrics
+        # self.hidden inside the nested helper is not attributed to outer()
+        assert standalone.metrics["lcom"] == 1.0
+        # WMC counts only the two direct methods (CC 1 each), not helper()
+        assert standalone.metrics["wmc"] == 2.0
+
     def test_from_import_counted_as_cbo(self) -> None:
         source = "from pathlib import Path\nfrom os import getcwd\n"
         tree = ast.parse(source)
@@ -913,12 +1104,70 @@ class TestComputeLcom:
         result = _compute_lcom(classes)
         assert result == 0.0
 
+    def test_repeated_and_empty_attr_sets(self) -> None:
+        """Grouped bitmask counting matches a hand count of sharing pairs."""
+        source = _src("""
+            class Mixed:
+                def a1(self):
+                    return self.a
+                def a2(self):
+                    return self.a
+                def ab(self):
+                    return self.a + self.b
+                def c(self):
+                    return self.c
+                def none1(self):
+                    return 1
+                def none2(self):
+                    return 2
+        """)
+        tree = ast.parse(source)
+        classes = [n for n in ast.walk(tree) if isinstance(n, ast.ClassDef)]
+        # 6 methods -> 15 pairs; sharing: a1-a2, a1-ab, a2-ab = 3
+        assert _compute_lcom(classes) == pytest.approx(1.0 - 3 / 15)
+        analysis = _single_pass_ast(tree)
+        assert _compute_lcom(classes, analysis.fn_self_attrs) == pytest.approx(
+            1.0 - 3 / 15
+        )
+
 
 # ---------------------------------------------------------------------------
 # Regex fallback — import lines coverage
 # ---------------------------------------------------------------------------
 
 
+class TestRegexAnalyze:
+    def test_counts_code_lines_branches_and_functions(self) -> None:
+        source = "import os\n\ndef a(x:\n    if x:\n        return 1\n\n# note\ndef b():\n    pass\n"
+        result = _regex_analyze(source)
+        assert result["loc"] == 6  # blank and comment lines excluded
+        assert result["complexity"] == 2.0  # base + if
+        assert result["functions"] == 2
+        assert result["max_nesting"] == 2
+        # a: lines 3-7 (5), b: lines 8-9 (2)
+        assert result["avg_fn_len"] == 3.5
+
+    def test_comment_lines_are_not_branches(self) -> None:
+        source = "def a(:\n    # retry if needed\n    # if x:\n    pass\n"
+        assert _regex_analyze(source)["complexity"] == 1.0
+
+    def test_crlf_matches_lf(self) -> None:
+        source = "def a(:\n    if x:\n        pass\ndef b():\n    y = 1 if x else 2\n"
+        assert _regex_analyze(source.replace("\n", "\r\n")) == _regex_analyze(source)
+
+    @pytest.mark.parametrize("sep", ["\r", "\f", "\x85", "\u2028"])
+    def test_other_line_breaks_match_lf(self, sep: str) -> None:
+        source = "def a(:\n    if x:\n        pass\ndef b():\n    y = 1 if x else 2\n"
+        assert _regex_analyze(source.replace("\n", sep)) == _regex_analyze(source)
+
+    def test_loc_and_indent_sd_match_line_helpers(self) -> None:
+        source = "def a(:\n\tif x:\n  \t  pass\n\n  # c\n\f\nclass B:\n      y = 1\r\n"
+        lines = source.splitlines()
+        result = _regex_analyze(source)
+        assert result["loc"] == len(_code_line_indents(lines))
+        assert result["indent_sd"] == _indent_sd(lines)
+
+
 class TestRegexFallbackImports:
     def test_import_lines_counted_in_fallback(self) -> None:
         """Broken syntax with imports hits the import-parsing branch."""